@@ -45,7 +45,8 @@ from qiskit.backends.aer import Aer  # pylint: disable=invalid-name
 __path__ = pkgutil.extend_path(__path__, __name__)
 
 from .wrapper._wrapper import (load_qasm_string, load_qasm_file)
-from .tools._compiler import (compile, execute)
+from .tools._compiler import (compile, execute, compile_async, execute_async,
+                              compile_iter)
 
 # Import the wrapper, to make it available when doing "import qiskit".
 from . import wrapper
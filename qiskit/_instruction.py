@@ -25,7 +25,12 @@ Instructions are identified by the following fields, and are serialized as such
     cargs: List of clbits (ClassicalRegister, index) that the instruction acts on.
 
     _decompositions: List of decomposition rule(s), in the form of mini DAG(s).
+        They are built on first access by ``_define_decompositions()``, and
+        shared by the instructions of the same type and parameters: they
+        must be copied before being modified.
 """
+from collections import OrderedDict
+
 import sympy
 
 from qiskit.qasm._node import _node
@@ -33,6 +38,11 @@ from ._qiskiterror import QiskitError
 from ._quantumregister import QuantumRegister
 from ._classicalregister import ClassicalRegister
 
+# Decomposition rules of the instructions, by type, name and parameters,
+# least recently used first.
+_DECOMPOSITIONS = OrderedDict()
+_DECOMPOSITIONS_MAX_SIZE = 4096
+
 
 class Instruction(object):
     """Generic quantum instruction."""
@@ -75,10 +85,27 @@ class Instruction(object):
                                   "{1}".format(type(single_param), name))
         self.qargs = qargs
         self.cargs = cargs
-        self._decompositions = []
+        self._decomposition_rules = None
         self.control = None  # tuple (ClassicalRegister, int) for "if"
         self.circuit = circuit
 
+    @property
+    def _decompositions(self):
+        """List of decomposition rule(s), in the form of mini DAG(s).
+
+        The rules are shared by the instructions of the same type, name and
+        parameters, and must not be modified.
+        """
+        if self._decomposition_rules is None:
+            return _cached_decompositions(self)
+        return self._decomposition_rules
+
+    @_decompositions.setter
+    def _decompositions(self, rules):
+        """Set the decomposition rules of this instruction only, or go back to
+        the shared ones if None."""
+        self._decomposition_rules = rules
+
     def __eq__(self, other):
         """Two instructions are the same if they have the same name and same
         params.
@@ -140,3 +167,60 @@ class Instruction(object):
                                      ",".join(["%s[%d]" % (j[0].name, j[1])
                                                for j in self.qargs + self.cargs]))
         return self._qasmif(name_param_arg)
+
+
+def _cached_decompositions(instruction):
+    """Return the decomposition rules of an instruction, building them only
+    for the first instruction of a given type, name and parameters.
+
+    Args:
+        instruction (Instruction): the instruction.
+
+    Returns:
+        list[DAGCircuit]: the decomposition rules, empty if the instruction
+            does not define any.
+    """
+    if not hasattr(instruction, '_define_decompositions'):
+        return []
+    key = _decomposition_key(instruction)
+    if key is None:
+        # Unhashable parameters: the rules cannot be shared.
+        return _define_decompositions(instruction)
+    try:
+        rules = _DECOMPOSITIONS.pop(key)
+    except KeyError:
+        rules = _define_decompositions(instruction)
+        if len(_DECOMPOSITIONS) >= _DECOMPOSITIONS_MAX_SIZE:
+            _DECOMPOSITIONS.popitem(last=False)
+    _DECOMPOSITIONS[key] = rules
+    return rules
+
+
+def _decomposition_key(instruction):
+    """Return the key identifying the shared decomposition rules of an instruction.
+
+    Args:
+        instruction (Instruction): the instruction.
+
+    Returns:
+        tuple or None: the type, name and parameters of the instruction, or
+            None if its rules are not shared (set on the instruction, or
+            unhashable parameters).
+    """
+    if instruction._decomposition_rules is not None:
+        return None
+    key = (type(instruction), instruction.name,
+           tuple((type(param), param) for param in instruction.param))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _define_decompositions(instruction):
+    """Build the decomposition rules of an instruction, without keeping them in it."""
+    instruction._define_decompositions()
+    rules = instruction._decomposition_rules
+    instruction._decomposition_rules = None
+    return rules
@@ -134,7 +134,8 @@ def validate_json_against_schema(json_dict, schema,
         if isinstance(schema, str):
             schema_name = schema
             schema = _SCHEMAS[schema_name]
-            validator = _get_validator(schema_name)
+            # The standard schemas are checked once, when they are loaded.
+            validator = _get_validator(schema_name, check_schema=False)
             validator.validate(json_dict)
         else:
             jsonschema.validate(json_dict, schema)
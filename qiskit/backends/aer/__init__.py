@@ -9,6 +9,8 @@
 
 from .aerprovider import AerProvider
 from .aerjob import AerJob
+from .clifford_simulator_py import CliffordSimulatorPy
+from .mps_simulator_py import MPSSimulatorPy
 from .qasm_simulator import CliffordSimulator, QasmSimulator
 from .qasm_simulator_py import QasmSimulatorPy
 from .statevector_simulator import StatevectorSimulator
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""Batched simulation of structurally identical experiments.
+
+Experiments whose instructions only differ by the parameters of their
+single qubit gates (such as the circuits of a parameter sweep) are
+simulated together, as a ``(2**n, batch)`` array of statevectors. A gate
+with the same parameters in all the experiments is applied with its
+matrix, and a gate with different parameters with the coefficients of each
+experiment broadcast along the batch axis.
+
+The floating point operations on each amplitude are those of
+``QasmSimulatorPy``, so that the statevectors are identical to those of the
+experiments simulated one at a time.
+"""
+
+import numpy as np
+
+from ._simulatortools import cached_single_gate_matrix, measurements_are_final
+
+_SINGLE_GATES = ('U', 'u1', 'u2', 'u3')
+_CX_GATES = ('CX', 'cx')
+_NO_OP_GATES = ('id', 'u0', 'barrier')
+
+
+def batch_key(experiment, shots):
+    """Return the key of the experiments that can be simulated with an experiment.
+
+    An experiment can be batched if it has no conditionals or resets, and
+    either its measurements can be made last (see
+    ``measurements_are_final()``) and it has no snapshots (with more than one
+    shot, the measurements being sampled), or it has no measurements (with
+    one shot).
+
+    Args:
+        experiment (QobjExperiment): the experiment.
+        shots (int): the number of shots of the experiment.
+
+    Returns:
+        tuple or None: the structure of the experiment, equal for the
+            experiments that can be simulated together, or None if the
+            experiment cannot be batched.
+    """
+    instructions = experiment.instructions
+    if not (measurements_are_final(instructions) and
+            all(_is_batchable(instruction, shots) for instruction in instructions)):
+        return None
+    key = tuple([experiment.config.n_qubits, experiment.config.memory_slots] +
+                [_instruction_key(instruction) for instruction in instructions])
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _is_batchable(instruction, shots):
+    """Return whether an instruction can be simulated in a batch, for a number of shots."""
+    if getattr(instruction, 'conditional', None):
+        return False
+    if instruction.name == 'measure':
+        return shots != 1
+    if instruction.name == 'snapshot':
+        return shots <= 1
+    return instruction.name in _SINGLE_GATES + _CX_GATES + _NO_OP_GATES
+
+
+def _instruction_key(instruction):
+    """Return the structure of an instruction, without the parameters of single qubit gates."""
+    name = instruction.name
+    params = None if name in _SINGLE_GATES else getattr(instruction, 'params', None)
+    return (name, tuple(getattr(instruction, 'qubits', ())),
+            tuple(getattr(instruction, 'memory', ())), tuple(params or ()))
+
+
+def run_batch(instructions_list, number_of_qubits, dtype=complex):
+    """Apply the instructions of experiments with the same key to a batch of statevectors.
+
+    Args:
+        instructions_list (list[list[QobjInstruction]]): the instructions of
+            the experiments, without their measurements.
+        number_of_qubits (int): the number of qubits of the experiments.
+        dtype (numpy.dtype): the complex dtype of the statevectors.
+
+    Returns:
+        tuple(ndarray, list[dict]): the statevectors of the experiments, as
+            the columns of a ``(2**n, batch)`` array, and the snapshots of
+            each experiment.
+    """
+    # The batch axis is the last one, so that the coefficients of the gates
+    # are broadcast along contiguous amplitudes.
+    statevectors = np.zeros((1 << number_of_qubits, len(instructions_list)), dtype=dtype)
+    statevectors[0] = 1
+    snapshots = [{} for _ in instructions_list]
+    for operations in zip(*instructions_list):
+        operation = operations[0]
+        if operation.name in _SINGLE_GATES:
+            gates = [cached_single_gate_matrix(operation.name, getattr(op, 'params', None))
+                     for op in operations]
+            _apply_single(statevectors, gates, operation.qubits[0])
+        elif operation.name in _CX_GATES:
+            _apply_cx(statevectors, *operation.qubits)
+        elif operation.name == 'snapshot':
+            for index, op in enumerate(operations):
+                snapshots[index].setdefault(str(op.params[0]), {}).setdefault(
+                    'statevector', []).append(statevectors[:, index].copy())
+    return statevectors, snapshots
+
+
+def _apply_single(statevectors, gates, qubit):
+    """Apply a single qubit gate, with a matrix per statevector, to a qubit."""
+    view = statevectors.reshape(-1, 2, 1 << qubit, statevectors.shape[1])
+    if all(gate is gates[0] for gate in gates):
+        # Same parameters: the coefficients are the same for all statevectors.
+        gate = gates[0]
+    else:
+        gate = np.stack(gates, axis=-1)
+    gate = gate.astype(statevectors.dtype, copy=False)
+    cache0 = view[:, 0].copy()
+    cache1 = view[:, 1]
+    view[:, 0] = gate[0, 0] * cache0 + gate[0, 1] * cache1
+    view[:, 1] = gate[1, 0] * cache0 + gate[1, 1] * cache1
+
+
+def _apply_cx(statevectors, control, target):
+    """Apply a CX to all the statevectors."""
+    high, low = max(control, target), min(control, target)
+    view = statevectors.reshape(-1, 2, 1 << (high - low - 1), 2, 1 << low,
+                                statevectors.shape[1])
+    if control > target:
+        ind1, ind3 = (slice(None), 1, slice(None), 0), (slice(None), 1, slice(None), 1)
+    else:
+        ind1, ind3 = (slice(None), 0, slice(None), 1), (slice(None), 1, slice(None), 1)
+    cache1 = view[ind3].copy()
+    view[ind3] = view[ind1]
+    view[ind1] = cache1
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""Gate fusion for the Python simulators.
+
+Before simulation, the gates of an experiment can be fused into fewer
+unitaries on one or two qubits, each of which is applied in a single sweep
+over the state:
+
+* consecutive single qubit gates on a qubit are multiplied into a 2x2
+  matrix;
+* CX gates are turned into 4x4 unitaries, which absorb the single qubit
+  gates on their qubits before and after them, and the following CX gates
+  on the same pair of qubits. The unitaries left with CX gates only are
+  applied as a CX (or not at all, if they cancel out).
+
+The other instructions (measurements, resets, conditional gates, ...) are
+kept as they are, after the fused gates on their qubits. Snapshots come
+after all the gates before them.
+
+The matrix of a fused gate on the qubits ``[a, b]`` has its rows and columns
+indexed by ``bit_a + 2 * bit_b``, as the two qubit gates of the unitary
+simulator.
+"""
+
+import numpy as np
+
+from qiskit.qobj import QobjInstruction
+from ._simulatortools import cached_single_gate_matrix
+
+_SINGLE_GATES = ('U', 'u1', 'u2', 'u3')
+_IDENTITY_GATES = ('id', 'u0')
+_CX_GATES = ('CX', 'cx')
+
+# CX on the qubits [control, target], and on the qubits [target, control].
+_CX = np.array([[1, 0, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0], [0, 1, 0, 0]], dtype=complex)
+_CX_REVERSED = np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]],
+                        dtype=complex)
+_IDENTITY = np.eye(2, dtype=complex)
+_IDENTITY_2 = np.eye(4, dtype=complex)
+
+
+class FusedGate:
+    """A unitary on one or two qubits, replacing a sequence of gates.
+
+    Attributes:
+        qubits (list[int]): the qubits of the unitary.
+        matrix (ndarray): the 2x2 or 4x4 matrix of the unitary.
+    """
+
+    __slots__ = ('qubits', 'matrix')
+
+    name = 'fused'
+
+    def __init__(self, qubits, matrix):
+        self.qubits = qubits
+        self.matrix = matrix
+
+
+def fuse_gates(instructions):
+    """Fuse the gates of a list of instructions.
+
+    Args:
+        instructions (list[QobjInstruction]): the instructions of an experiment.
+
+    Returns:
+        list: the instructions, with the gates replaced by ``FusedGate``.
+    """
+    fused = []
+    # Product of the single qubit gates of each qubit not yet added.
+    pending = {}
+    # Two qubit unitary of each qubit that no later instruction acts on.
+    open_blocks = {}
+
+    def flush(qubits):
+        for qubit in qubits:
+            open_blocks.pop(qubit, None)
+            matrix = pending.pop(qubit, None)
+            if matrix is not None:
+                fused.append(FusedGate([qubit], matrix))
+
+    for instruction in instructions:
+        name = instruction.name
+        conditional = getattr(instruction, 'conditional', None)
+        if not conditional and name in _SINGLE_GATES + _IDENTITY_GATES:
+            if name in _IDENTITY_GATES:
+                continue
+            qubit = instruction.qubits[0]
+            matrix = cached_single_gate_matrix(name, getattr(instruction, 'params', None))
+            block = open_blocks.get(qubit)
+            if block is not None:
+                block.matrix = _on_qubit(matrix, block.qubits.index(qubit)).dot(block.matrix)
+            elif qubit in pending:
+                pending[qubit] = matrix.dot(pending[qubit])
+            else:
+                pending[qubit] = matrix
+        elif not conditional and name in _CX_GATES:
+            control, target = instruction.qubits
+            block = open_blocks.get(control)
+            if block is None or block is not open_blocks.get(target):
+                # The earlier blocks of the qubits stay open for their other qubit.
+                open_blocks.pop(control, None)
+                open_blocks.pop(target, None)
+                block = FusedGate([control, target],
+                                  np.kron(pending.pop(target, _IDENTITY),
+                                          pending.pop(control, _IDENTITY)))
+                fused.append(block)
+                open_blocks[control] = open_blocks[target] = block
+            cx_matrix = _CX if block.qubits[0] == control else _CX_REVERSED
+            block.matrix = cx_matrix.dot(block.matrix)
+        elif name == 'barrier':
+            fused.append(instruction)
+        else:
+            if name == 'snapshot':
+                flush(list(pending) + list(open_blocks))
+            else:
+                flush(getattr(instruction, 'qubits', ()))
+            fused.append(instruction)
+    flush(list(pending))
+    return [instruction for instruction in map(_simplify, fused) if instruction is not None]
+
+
+def _simplify(instruction):
+    """Return the instruction, as a CX if it is a fused CX, or None if it is the identity."""
+    if isinstance(instruction, FusedGate) and len(instruction.qubits) == 2:
+        if np.array_equal(instruction.matrix, _CX):
+            return QobjInstruction(name='cx', qubits=list(instruction.qubits))
+        if np.array_equal(instruction.matrix, _CX_REVERSED):
+            return QobjInstruction(name='cx', qubits=instruction.qubits[::-1])
+        if np.array_equal(instruction.matrix, _IDENTITY_2):
+            return None
+    return instruction
+
+
+def _on_qubit(matrix, position):
+    """Return the 4x4 matrix of a single qubit gate on a qubit of a pair."""
+    if position == 0:
+        return np.kron(_IDENTITY, matrix)
+    return np.kron(matrix, _IDENTITY)
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""Matrix product state of qubits on a line.
+
+The state is a chain of tensors, one per qubit, of shape ``(left bond, 2,
+right bond)``. It is kept in mixed canonical form around a center site: the
+tensors left of the center are left-orthonormal, and those right of it
+right-orthonormal, so that truncating the singular values of a bond next
+to the center discards the smallest part of the state.
+
+A gate on two adjacent qubits contracts their tensors, applies the gate
+and splits them again with an SVD, keeping the singular values above a
+threshold and at most a given number of them. A gate on two qubits that are
+not adjacent is applied after moving one of them next to the other with
+SWAP gates, which are undone afterwards.
+"""
+
+import numpy as np
+
+# Two qubit gates on adjacent sites, indexed by 2 * bit_left + bit_right.
+_CX_LEFT_CONTROL = np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]],
+                            dtype=complex)
+_CX_RIGHT_CONTROL = np.array([[1, 0, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0], [0, 1, 0, 0]],
+                             dtype=complex)
+_SWAP = np.array([[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]], dtype=complex)
+
+
+class MatrixProductState:
+    """Matrix product state of qubits on a line, starting in ``|0...0>``.
+
+    Attributes:
+        tensors (list[ndarray]): the tensor of each qubit, of shape
+            ``(left bond, 2, right bond)``.
+        truncation_error (float): the sum of the squared singular values
+            discarded so far, relative to the norm of the state.
+    """
+
+    def __init__(self, num_qubits, max_bond_dimension=None, truncation_threshold=1e-16,
+                 dtype=complex):
+        """
+        Args:
+            num_qubits (int): the number of qubits.
+            max_bond_dimension (int): the maximum number of singular values
+                kept at each bond, or None for no limit.
+            truncation_threshold (float): the singular values whose square,
+                relative to the norm of the state, is below the threshold
+                are discarded.
+            dtype (numpy.dtype): the complex dtype of the tensors.
+        """
+        self.dtype = np.dtype(dtype)
+        self.max_bond_dimension = max_bond_dimension
+        self.truncation_threshold = truncation_threshold
+        self.truncation_error = 0.0
+        zero = np.zeros((1, 2, 1), dtype=self.dtype)
+        zero[0, 0, 0] = 1
+        self.tensors = [zero.copy() for _ in range(num_qubits)]
+        self._center = 0
+
+    @property
+    def bond_dimension(self):
+        """int: the largest bond dimension of the state."""
+        return max(tensor.shape[2] for tensor in self.tensors)
+
+    def apply_single(self, gate, qubit):
+        """Apply a single qubit gate.
+
+        Args:
+            gate (ndarray): the 2x2 matrix of the gate.
+            qubit (int): the qubit.
+        """
+        # A unitary on the physical index keeps the tensor orthonormal.
+        self.tensors[qubit] = np.einsum('ij,ajb->aib', gate.astype(self.dtype, copy=False),
+                                        self.tensors[qubit])
+
+    def apply_cx(self, control, target):
+        """Apply a CX gate, moving the target next to the control if needed.
+
+        Args:
+            control (int): the control qubit.
+            target (int): the target qubit.
+        """
+        step = 1 if control > target else -1
+        position = target
+        swaps = []
+        while abs(control - position) > 1:
+            swaps.append(min(position, position + step))
+            self.apply_adjacent(_SWAP, swaps[-1])
+            position += step
+        if control < position:
+            self.apply_adjacent(_CX_LEFT_CONTROL, control)
+        else:
+            self.apply_adjacent(_CX_RIGHT_CONTROL, position)
+        for site in reversed(swaps):
+            self.apply_adjacent(_SWAP, site)
+
+    def apply_adjacent(self, gate, site):
+        """Apply a two qubit gate on adjacent qubits.
+
+        Args:
+            gate (ndarray): the 4x4 matrix of the gate, indexed by
+                ``2 * bit_site + bit_(site + 1)``.
+            site (int): the first of the two qubits.
+        """
+        self._move_center(site)
+        theta = np.tensordot(self.tensors[site], self.tensors[site + 1], axes=1)
+        theta = np.einsum('ijkl,aklb->aijb',
+                          gate.astype(self.dtype, copy=False).reshape(2, 2, 2, 2), theta)
+        left, right = theta.shape[0], theta.shape[3]
+        left_vectors, singular_values, right_vectors = np.linalg.svd(
+            theta.reshape(2 * left, 2 * right), full_matrices=False)
+
+        weights = singular_values ** 2
+        norm = weights.sum()
+        keep = max(1, int(np.count_nonzero(weights > self.truncation_threshold * norm)))
+        if self.max_bond_dimension:
+            keep = min(keep, self.max_bond_dimension)
+        if keep < len(singular_values):
+            kept = weights[:keep].sum()
+            self.truncation_error += float((norm - kept) / norm)
+            singular_values = singular_values[:keep] * np.sqrt(norm / kept)
+
+        self.tensors[site] = left_vectors[:, :keep].reshape(left, 2, keep)
+        right_tensor = singular_values[:keep, None] * right_vectors[:keep]
+        self.tensors[site + 1] = right_tensor.astype(
+            self.dtype, copy=False).reshape(keep, 2, right)
+        self._center = site + 1
+
+    def sample(self, shots, random_state):
+        """Sample the outcomes of measuring all the qubits.
+
+        The qubits are measured from the first one, each with the
+        probabilities conditioned on the outcomes of the previous ones,
+        for all the shots at once.
+
+        Args:
+            shots (int): the number of shots.
+            random_state (numpy.random.RandomState): the random generator.
+
+        Returns:
+            ndarray: the outcome of each qubit in each shot, of shape
+                ``(shots, num_qubits)``.
+        """
+        self._move_center(0)
+        outcomes = np.zeros((shots, len(self.tensors)), dtype=np.uint8)
+        shot_indices = np.arange(shots)
+        # Left part of the state for the outcomes drawn so far, for each shot.
+        vectors = np.ones((shots, 1), dtype=self.dtype)
+        for qubit, tensor in enumerate(self.tensors):
+            amplitudes = np.tensordot(vectors, tensor, axes=1)
+            # The tensors on the right are orthonormal: the probabilities are
+            # the norms of the amplitudes.
+            probabilities = np.sum(np.abs(amplitudes) ** 2, axis=2)
+            draws = random_state.random_sample(shots) * probabilities.sum(axis=1)
+            outcome = (draws >= probabilities[:, 0]).astype(np.uint8)
+            outcomes[:, qubit] = outcome
+            vectors = amplitudes[shot_indices, outcome]
+            vectors /= np.sqrt(probabilities[shot_indices, outcome])[:, None]
+        return outcomes
+
+    def to_statevector(self):
+        """Return the statevector, with qubit ``i`` as bit ``i`` of the index.
+
+        Returns:
+            ndarray: the ``2**n`` amplitudes.
+        """
+        state = np.ones((1, 1), dtype=self.dtype)
+        for tensor in self.tensors:
+            # The index of the new qubit is the most significant one.
+            state = np.einsum('ia,ajb->jib', state, tensor).reshape(-1, tensor.shape[2])
+        return state[:, 0]
+
+    def _move_center(self, site):
+        """Move the center of the canonical form to a site, with QR decompositions."""
+        while self._center < site:
+            tensor = self.tensors[self._center]
+            left, _, right = tensor.shape
+            q, r = np.linalg.qr(tensor.reshape(2 * left, right))
+            self.tensors[self._center] = q.reshape(left, 2, -1)
+            self.tensors[self._center + 1] = np.tensordot(r, self.tensors[self._center + 1],
+                                                          axes=1)
+            self._center += 1
+        while self._center > site:
+            tensor = self.tensors[self._center]
+            left, _, right = tensor.shape
+            q, r = np.linalg.qr(tensor.reshape(left, 2 * right).T)
+            self.tensors[self._center] = q.T.reshape(-1, 2, right)
+            self.tensors[self._center - 1] = np.tensordot(self.tensors[self._center - 1], r.T,
+                                                          axes=1)
+            self._center -= 1
@@ -14,11 +14,23 @@ Functions
     and b2 as the i2th bit
 """
 
+from collections import OrderedDict
 from string import ascii_uppercase, ascii_lowercase
 
 import numpy as np
 
 from qiskit import QiskitError
+from qiskit._util import local_hardware_info
+from ._simulatorerror import SimulatorError
+
+# Complex dtype of the simulated states, for each value of the ``precision``
+# option.
+PRECISION_DTYPES = {'double': np.complex128, 'single': np.complex64}
+
+# Matrices of the single qubit gates, by name and parameters, in a bounded
+# LRU cache.
+_GATE_MATRICES = OrderedDict()
+_GATE_MATRICES_MAX_SIZE = 4096
 
 
 def index1(b, i, k):
@@ -74,11 +86,11 @@ def single_gate_params(gate, params=None):
     """
     if gate == 'U' or gate == 'u3':
         return params[0], params[1], params[2]
-    elif gate == 'u2':
+    if gate == 'u2':
         return np.pi/2, params[0], params[1]
-    elif gate == 'u1':
+    if gate == 'u1':
         return 0, 0, params[0]
-    elif gate == 'id':
+    if gate == 'id':
         return 0, 0, 0
     raise QiskitError('Gate is not among the valid types: %s' % gate)
 
@@ -103,6 +115,142 @@ def single_gate_matrix(gate, params=None):
                       np.exp(1j*phi+1j*lam)*np.cos(theta/2)]])
 
 
+def cached_single_gate_matrix(gate, params=None):
+    """Get the matrix for a single qubit, shared by the gates of the same
+    name and parameters.
+
+    Args:
+        gate(str): the single qubit gate name
+        params(list): the operation parameters op['params']
+    Returns:
+        array: A read-only numpy array representing the matrix
+    """
+    key = (gate, tuple(params or ()))
+    try:
+        matrix = _GATE_MATRICES.pop(key)
+    except KeyError:
+        matrix = single_gate_matrix(gate, params)
+        matrix.setflags(write=False)
+        if len(_GATE_MATRICES) >= _GATE_MATRICES_MAX_SIZE:
+            _GATE_MATRICES.popitem(last=False)
+    except TypeError:
+        # Unhashable parameters: the matrix cannot be shared.
+        return single_gate_matrix(gate, params)
+    _GATE_MATRICES[key] = matrix
+    return matrix
+
+
+def experiment_option(experiment, qobj_config, name, default=None):
+    """Return an option of an experiment, looking in its config and then in
+    the Qobj config.
+
+    Args:
+        experiment (QobjExperiment): the experiment.
+        qobj_config (QobjConfig): the config of the Qobj of the experiment.
+        name (str): the name of the option.
+        default (object): the value if the option is not set.
+
+    Returns:
+        object: the value of the option.
+    """
+    return getattr(getattr(experiment, 'config', None), name,
+                   getattr(qobj_config, name, default))
+
+
+def simulation_dtype(experiment, qobj_config):
+    """Return the complex dtype of the states of an experiment, set by its
+    ``precision`` option (``'double'``, the default, or ``'single'``).
+
+    Args:
+        experiment (QobjExperiment): the experiment.
+        qobj_config (QobjConfig): the config of the Qobj of the experiment.
+
+    Returns:
+        numpy.dtype: complex128 or complex64.
+
+    Raises:
+        SimulatorError: if the precision is not supported.
+    """
+    precision = experiment_option(experiment, qobj_config, 'precision', 'double')
+    try:
+        return np.dtype(PRECISION_DTYPES[precision])
+    except KeyError:
+        raise SimulatorError('Unsupported precision "{}", expected one of {}.'.format(
+            precision, sorted(PRECISION_DTYPES)))
+
+
+def memory_budget(experiment, qobj_config):
+    """Return the memory that the simulation of an experiment may use, set by
+    its ``max_memory_mb`` option, the memory of the machine by default.
+
+    Args:
+        experiment (QobjExperiment): the experiment.
+        qobj_config (QobjConfig): the config of the Qobj of the experiment.
+
+    Returns:
+        int: the memory budget, in bytes.
+    """
+    max_memory_mb = experiment_option(experiment, qobj_config, 'max_memory_mb')
+    if max_memory_mb is None:
+        max_memory_mb = local_hardware_info()['memory'] * 1024
+    return int(max_memory_mb * 1024 ** 2)
+
+
+def check_memory(backend_name, experiment, qobj_config, required):
+    """Check that the simulation of an experiment fits in its memory budget.
+
+    Args:
+        backend_name (str): the name of the simulator, for the error message.
+        experiment (QobjExperiment): the experiment.
+        qobj_config (QobjConfig): the config of the Qobj of the experiment.
+        required (int): the estimated memory used by the simulation, in bytes.
+
+    Raises:
+        SimulatorError: if the estimate exceeds the budget.
+    """
+    budget = memory_budget(experiment, qobj_config)
+    if required > budget:
+        raise SimulatorError(
+            '{} needs about {:.1f} MB of memory to simulate circuit "{}", more than '
+            'the {:.1f} MB allowed (max_memory_mb).'.format(
+                backend_name, required / 1024 ** 2, experiment.header.name,
+                budget / 1024 ** 2))
+
+
+def measurements_are_final(instructions):
+    """Return whether the measurements of instructions can be made last.
+
+    This is the case when no instruction other than a measurement or a
+    barrier acts on a qubit after it is measured, no snapshot follows a
+    measurement, and no conditional reads a memory slot that was measured.
+    The outcomes are then those of measuring the state left by the other
+    instructions, in any order, as with the circuits of ``compile()``, which
+    measures each qubit right after its last gate.
+
+    Args:
+        instructions (list[QobjInstruction]): the instructions.
+
+    Returns:
+        bool: whether the measurements can be made last.
+    """
+    measured_qubits = set()
+    measured_mask = 0
+    for operation in instructions:
+        conditional = getattr(operation, 'conditional', None)
+        if conditional and int(conditional.mask, 16) & measured_mask:
+            return False
+        if operation.name == 'measure':
+            measured_qubits.update(operation.qubits)
+            measured_mask |= 1 << operation.memory[0]
+        elif operation.name == 'snapshot':
+            if measured_qubits:
+                return False
+        elif operation.name != 'barrier' and \
+                measured_qubits.intersection(getattr(operation, 'qubits', ())):
+            return False
+    return True
+
+
 def einsum_matmul_index(gate_indices, number_of_qubits):
     """Return the index string for Numpy.eignsum matrix multiplication.
 
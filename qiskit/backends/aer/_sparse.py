@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""Sparse statevector, for states with few nonzero amplitudes.
+
+The state is kept as the sorted basis indices of its nonzero amplitudes,
+and the amplitudes themselves. A CX only maps the indices; a single qubit
+gate pairs the indices that differ by the bit of its qubit, and combines
+their amplitudes as the dense kernel does. Amplitudes whose magnitude is
+below ``ZERO_TOLERANCE`` (such as the rounding errors of ``cos(pi/2)`` in
+an X gate) are dropped.
+"""
+
+import numpy as np
+
+# Magnitude under which an amplitude is considered zero.
+ZERO_TOLERANCE = 1e-12
+
+
+class SparseStatevector:
+    """Statevector stored as its nonzero amplitudes.
+
+    Attributes:
+        num_qubits (int): the number of qubits.
+        indices (ndarray): the sorted basis indices of the nonzero
+            amplitudes, with qubit ``i`` as bit ``i``.
+        amplitudes (ndarray): the amplitudes at the indices.
+    """
+
+    def __init__(self, num_qubits, dtype=complex):
+        """Initialize the state ``|0...0>``.
+
+        Args:
+            num_qubits (int): the number of qubits, at most 62.
+            dtype (numpy.dtype): the complex dtype of the amplitudes.
+        """
+        self.num_qubits = num_qubits
+        self.indices = np.zeros(1, dtype=np.int64)
+        self.amplitudes = np.ones(1, dtype=dtype)
+
+    def __len__(self):
+        """Return the number of nonzero amplitudes."""
+        return len(self.indices)
+
+    def apply_single(self, gate, qubit):
+        """Apply a single qubit gate.
+
+        Args:
+            gate (ndarray): the 2x2 matrix of the gate.
+            qubit (int): the qubit.
+        """
+        gate = gate.astype(self.amplitudes.dtype, copy=False)
+        bit = 1 << qubit
+        if gate[0, 1] == 0 and gate[1, 0] == 0:
+            # Diagonal gate: the indices do not change.
+            self.amplitudes = np.where(self.indices & bit, gate[1, 1] * self.amplitudes,
+                                       gate[0, 0] * self.amplitudes)
+            return
+        is_one = (self.indices & bit) != 0
+        pairs, pair_of = np.unique(self.indices & ~bit, return_inverse=True)
+        cache0 = np.zeros(len(pairs), dtype=self.amplitudes.dtype)
+        cache1 = np.zeros(len(pairs), dtype=self.amplitudes.dtype)
+        cache0[pair_of[~is_one]] = self.amplitudes[~is_one]
+        cache1[pair_of[is_one]] = self.amplitudes[is_one]
+        self._set(np.concatenate((pairs, pairs | bit)),
+                  np.concatenate((gate[0, 0] * cache0 + gate[0, 1] * cache1,
+                                  gate[1, 0] * cache0 + gate[1, 1] * cache1)))
+
+    def apply_cx(self, control, target):
+        """Apply a CX gate.
+
+        Args:
+            control (int): the control qubit.
+            target (int): the target qubit.
+        """
+        indices = self.indices ^ (((self.indices >> control) & 1) << target)
+        order = np.argsort(indices, kind='stable')
+        self.indices = indices[order]
+        self.amplitudes = self.amplitudes[order]
+
+    def probability_zero(self, qubit):
+        """Return the probability of measuring a qubit in state 0."""
+        is_zero = (self.indices & (1 << qubit)) == 0
+        return np.add.accumulate(np.abs(self.amplitudes[is_zero]) ** 2)[-1] \
+            if is_zero.any() else 0.0
+
+    def project(self, qubit, outcome, norm):
+        """Project a qubit on an outcome, and renormalize the state.
+
+        Args:
+            qubit (int): the qubit.
+            outcome (int): the state of the qubit, 0 or 1.
+            norm (float): the norm of the projected state.
+        """
+        keep = ((self.indices >> qubit) & 1) == outcome
+        self.indices = self.indices[keep]
+        self.amplitudes = self.amplitudes[keep] / norm
+
+    def flip(self, qubit):
+        """Flip a qubit, as an X gate without rounding errors."""
+        indices = self.indices ^ (1 << qubit)
+        order = np.argsort(indices, kind='stable')
+        self.indices = indices[order]
+        self.amplitudes = self.amplitudes[order]
+
+    def to_dense(self):
+        """Return the dense statevector, of ``2**num_qubits`` amplitudes."""
+        statevector = np.zeros(1 << self.num_qubits, dtype=self.amplitudes.dtype)
+        statevector[self.indices] = self.amplitudes
+        return statevector
+
+    def _set(self, indices, amplitudes):
+        """Set the nonzero amplitudes from unsorted indices."""
+        nonzero = np.abs(amplitudes) > ZERO_TOLERANCE
+        indices = indices[nonzero]
+        order = np.argsort(indices, kind='stable')
+        self.indices = indices[order]
+        self.amplitudes = amplitudes[nonzero][order]
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""Stabilizer tableau of the Aaronson-Gottesman algorithm.
+
+The tableau of ``n`` qubits has ``2n`` rows of Pauli operators: the
+destabilizers, then the stabilizers of the state. Each row is stored as the
+bits of its X and Z parts, packed in ``uint64`` words (qubit ``q`` being bit
+``q % 64`` of word ``q // 64``), and the sign of the operator.
+
+A gate updates a column of bits in all the rows at once. The products of
+rows of a measurement are computed for all the rows involved together: the
+phases of the products are counted with bitwise operations on the packed
+words, and the successive products of a deterministic measurement are
+obtained as cumulative XORs of the rows.
+
+See S. Aaronson and D. Gottesman, "Improved simulation of stabilizer
+circuits", Phys. Rev. A 70, 052328 (2004).
+"""
+
+import numpy as np
+
+_ONE = np.uint64(1)
+
+
+if hasattr(np, 'bitwise_count'):
+    def _popcount(words):
+        """Return the number of set bits of each row of packed words."""
+        return np.bitwise_count(words).sum(axis=-1, dtype=np.int64)
+else:
+    def _popcount(words):
+        """Return the number of set bits of each row of packed words."""
+        words = np.ascontiguousarray(words)
+        return np.unpackbits(words.view(np.uint8), axis=-1).sum(axis=-1, dtype=np.int64)
+
+
+def _phase_exponents(x_left, z_left, x_right, z_right):
+    """Return the exponents of ``i`` of the products of Pauli operators.
+
+    This is the sum over the qubits of the function ``g`` of Aaronson and
+    Gottesman, the number of qubits where it is 1 minus the number where it
+    is -1, for the rows of packed bits of the operators ``(x_left, z_left)``
+    times ``(x_right, z_right)``.
+    """
+    y_left = x_left & z_left
+    only_x_left = x_left & ~z_left
+    only_z_left = ~x_left & z_left
+    plus = ((y_left & z_right & ~x_right) | (only_x_left & z_right & x_right) |
+            (only_z_left & x_right & ~z_right))
+    minus = ((y_left & x_right & ~z_right) | (only_x_left & z_right & ~x_right) |
+             (only_z_left & x_right & z_right))
+    return _popcount(plus) - _popcount(minus)
+
+
+class StabilizerTableau:
+    """Stabilizer tableau of qubits, starting in ``|0...0>``.
+
+    Attributes:
+        num_qubits (int): the number of qubits.
+        x (ndarray): the packed X bits of the rows, of shape
+            ``(2 * num_qubits, words)``.
+        z (ndarray): the packed Z bits of the rows.
+        r (ndarray): the sign bit of each row.
+    """
+
+    def __init__(self, num_qubits):
+        """
+        Args:
+            num_qubits (int): the number of qubits.
+        """
+        self.num_qubits = num_qubits
+        words = (num_qubits + 63) // 64
+        self.x = np.zeros((2 * num_qubits, words), dtype=np.uint64)
+        self.z = np.zeros((2 * num_qubits, words), dtype=np.uint64)
+        self.r = np.zeros(2 * num_qubits, dtype=np.uint8)
+        # Destabilizer i is X_i, stabilizer i is Z_i.
+        for qubit in range(num_qubits):
+            word, mask = self._position(qubit)
+            self.x[qubit, word] = mask
+            self.z[num_qubits + qubit, word] = mask
+
+    def copy(self):
+        """Return a copy of the tableau."""
+        tableau = StabilizerTableau.__new__(StabilizerTableau)
+        tableau.num_qubits = self.num_qubits
+        tableau.x = self.x.copy()
+        tableau.z = self.z.copy()
+        tableau.r = self.r.copy()
+        return tableau
+
+    @staticmethod
+    def _position(qubit):
+        """Return the word of a qubit and the mask of its bit."""
+        word, shift = divmod(qubit, 64)
+        return word, _ONE << np.uint64(shift)
+
+    def _bits(self, array, qubit):
+        """Return the bit of a qubit in each row, as 0 or 1."""
+        word, shift = divmod(qubit, 64)
+        return ((array[:, word] >> np.uint64(shift)) & _ONE).astype(np.uint8)
+
+    def h_gate(self, qubit):
+        """Apply a Hadamard gate."""
+        word, mask = self._position(qubit)
+        x_bits = self.x[:, word] & mask
+        z_bits = self.z[:, word] & mask
+        self.r ^= (x_bits & z_bits) != 0
+        swap = x_bits ^ z_bits
+        self.x[:, word] ^= swap
+        self.z[:, word] ^= swap
+
+    def s_gate(self, qubit):
+        """Apply a phase gate."""
+        word, mask = self._position(qubit)
+        x_bits = self.x[:, word] & mask
+        self.r ^= (x_bits & self.z[:, word]) != 0
+        self.z[:, word] ^= x_bits
+
+    def sdg_gate(self, qubit):
+        """Apply the inverse of the phase gate."""
+        word, mask = self._position(qubit)
+        x_bits = self.x[:, word] & mask
+        self.r ^= (x_bits & ~self.z[:, word]) != 0
+        self.z[:, word] ^= x_bits
+
+    def x_gate(self, qubit):
+        """Apply a Pauli X gate."""
+        word, mask = self._position(qubit)
+        self.r ^= (self.z[:, word] & mask) != 0
+
+    def y_gate(self, qubit):
+        """Apply a Pauli Y gate."""
+        word, mask = self._position(qubit)
+        self.r ^= ((self.x[:, word] ^ self.z[:, word]) & mask) != 0
+
+    def z_gate(self, qubit):
+        """Apply a Pauli Z gate."""
+        word, mask = self._position(qubit)
+        self.r ^= (self.x[:, word] & mask) != 0
+
+    def cx_gate(self, control, target):
+        """Apply a CX gate."""
+        x_control = self._bits(self.x, control)
+        z_control = self._bits(self.z, control)
+        x_target = self._bits(self.x, target)
+        z_target = self._bits(self.z, target)
+        self.r ^= x_control & z_target & (x_target ^ z_control ^ 1)
+        target_word, target_shift = divmod(target, 64)
+        control_word, control_shift = divmod(control, 64)
+        self.x[:, target_word] ^= x_control.astype(np.uint64) << np.uint64(target_shift)
+        self.z[:, control_word] ^= z_target.astype(np.uint64) << np.uint64(control_shift)
+
+    def measure(self, qubit, random_state):
+        """Measure a qubit in the computational basis.
+
+        Args:
+            qubit (int): the qubit.
+            random_state (numpy.random.RandomState): the random generator,
+                for outcomes that are not determined by the state.
+
+        Returns:
+            int: the outcome, 0 or 1.
+        """
+        num_qubits = self.num_qubits
+        x_qubit = self._bits(self.x, qubit)
+        anticommuting = np.flatnonzero(x_qubit[num_qubits:])
+        if len(anticommuting):
+            # Random outcome: the first anticommuting stabilizer is replaced
+            # by +-Z, after being multiplied into the other anticommuting rows.
+            pivot = num_qubits + anticommuting[0]
+            rows = np.flatnonzero(x_qubit)
+            rows = rows[rows != pivot]
+            if len(rows):
+                exponents = (2 * self.r[rows].astype(np.int64) + 2 * int(self.r[pivot]) +
+                             _phase_exponents(self.x[pivot], self.z[pivot],
+                                              self.x[rows], self.z[rows]))
+                self.r[rows] = (exponents & 3) >> 1
+                self.x[rows] ^= self.x[pivot]
+                self.z[rows] ^= self.z[pivot]
+            destabilizer = pivot - num_qubits
+            self.x[destabilizer] = self.x[pivot]
+            self.z[destabilizer] = self.z[pivot]
+            self.r[destabilizer] = self.r[pivot]
+            outcome = random_state.randint(2)
+            word, mask = self._position(qubit)
+            self.x[pivot] = 0
+            self.z[pivot] = 0
+            self.z[pivot, word] = mask
+            self.r[pivot] = outcome
+            return int(outcome)
+
+        # Deterministic outcome: the sign of the product of the stabilizers
+        # whose destabilizers anticommute with Z.
+        rows = num_qubits + np.flatnonzero(x_qubit[:num_qubits])
+        x_rows = self.x[rows]
+        z_rows = self.z[rows]
+        # Product of the rows before each row.
+        x_before = np.zeros_like(x_rows)
+        z_before = np.zeros_like(z_rows)
+        x_before[1:] = np.bitwise_xor.accumulate(x_rows[:-1], axis=0)
+        z_before[1:] = np.bitwise_xor.accumulate(z_rows[:-1], axis=0)
+        exponent = 2 * int(self.r[rows].sum(dtype=np.int64)) + \
+            int(_phase_exponents(x_rows, z_rows, x_before, z_before).sum())
+        return (exponent & 3) >> 1
@@ -50,25 +50,35 @@ class AerJob(BaseJob):
     else:
         _executor = futures.ProcessPoolExecutor()
 
-    def __init__(self, backend, job_id, fn, qobj):
+    def __init__(self, backend, job_id, fn, qobj, validation=None):
+        """
+        Args:
+            backend (BaseBackend): the backend running the job.
+            job_id (str): the id of the job.
+            fn (callable): function running the Qobj, given the job id and the Qobj.
+            qobj (Qobj): the Qobj to run.
+            validation (str): Qobj validation mode (``'full'``, ``'fast'`` or
+                ``'off'``). See ``validate_qobj_against_schema``.
+        """
         super().__init__(backend, job_id)
         self._fn = fn
         self._qobj = qobj
+        self._validation = validation
         self._future = None
 
     def submit(self):
         """Submit the job to the backend for execution.
 
         Raises:
-            QobjValidationError: if the JSON serialization of the Qobj passed
-            during construction does not validate against the Qobj schema.
+            SchemaValidationError: if the Qobj passed during construction does
+            not validate, in the validation mode of the job.
 
             JobError: if trying to re-submit the job.
         """
         if self._future is not None:
             raise JobError("We have already submitted the job!")
 
-        validate_qobj_against_schema(self._qobj)
+        validate_qobj_against_schema(self._qobj, self._validation)
         self._future = self._executor.submit(self._fn, self._job_id, self._qobj)
 
     @requires_submit
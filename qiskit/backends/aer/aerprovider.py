@@ -16,6 +16,8 @@ from qiskit.backends import BaseProvider
 from qiskit.backends.exceptions import QiskitBackendNotFoundError
 from qiskit.backends.providerutils import resolve_backend_name, filter_backends
 
+from .clifford_simulator_py import CliffordSimulatorPy
+from .mps_simulator_py import MPSSimulatorPy
 from .qasm_simulator import CliffordSimulator, QasmSimulator
 from .qasm_simulator_py import QasmSimulatorPy
 from .statevector_simulator import StatevectorSimulator
@@ -32,6 +34,8 @@ AER_STANDARD_BACKENDS = [
     StatevectorSimulatorPy,
     UnitarySimulatorPy,
     CliffordSimulator,
+    MPSSimulatorPy,
+    CliffordSimulatorPy,
 ]
 
 
@@ -151,5 +155,6 @@ class AerProvider(BaseProvider):
         """Return Python alternatives to C++ simulators."""
         return {
             'qasm_simulator': 'qasm_simulator_py',
-            'statevector_simulator': 'statevector_simulator_py'
+            'statevector_simulator': 'statevector_simulator_py',
+            'clifford_simulator': 'clifford_simulator_py'
         }
@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""Contains a Python simulator of stabilizer (Clifford) circuits.
+
+It simulates the stabilizer tableau of the state (see ``_stabilizer``)
+instead of its statevector, with a memory and a cost per gate that grow
+quadratically and linearly with the number of qubits. Circuits of the
+Clifford gates, measurements and resets, such as those of randomized
+benchmarking and error correction, can be simulated on thousands of qubits.
+It is a Python alternative to the ``clifford_simulator`` backend, which
+needs the compiled simulator.
+
+.. code-block:: python
+
+    CliffordSimulatorPy().run(qobj)
+
+Where the input is a Qobj object and the output is a AerJob object, which can
+later be queried for the Result object. The result contains the counts and
+the memory of the measurements of each shot.
+
+When no gate acts on a qubit after it is measured, and there are no
+conditionals or resets, the gates are applied once, and only the
+measurements are repeated for each shot, on a copy of the final tableau.
+"""
+
+import logging
+import random
+import time
+import uuid
+
+import numpy as np
+
+from qiskit.backends import BaseBackend
+from qiskit.backends.aer.aerjob import AerJob
+from qiskit.backends.models import BackendConfiguration
+from qiskit.result import Result
+from qiskit.result._counts import IntegerCounts
+from qiskit.result.models import ExperimentResultData
+from ._simulatorerror import SimulatorError
+from ._simulatortools import measurements_are_final
+from ._stabilizer import StabilizerTableau
+
+logger = logging.getLogger(__name__)
+
+# Gates of the tableau, by name.
+_SINGLE_GATES = {
+    'h': StabilizerTableau.h_gate,
+    's': StabilizerTableau.s_gate,
+    'sdg': StabilizerTableau.sdg_gate,
+    'x': StabilizerTableau.x_gate,
+    'y': StabilizerTableau.y_gate,
+    'z': StabilizerTableau.z_gate,
+}
+
+
+class CliffordSimulatorPy(BaseBackend):
+    """Python simulator of stabilizer circuits."""
+
+    DEFAULT_CONFIGURATION = {
+        'backend_name': 'clifford_simulator_py',
+        'backend_version': '1.0.0',
+        'n_qubits': 10000,
+        'url': 'https://github.com/Qiskit/qiskit-terra',
+        'simulator': True,
+        'local': True,
+        'conditional': True,
+        'open_pulse': False,
+        'memory': True,
+        'max_shots': 65536,
+        'description': 'A python simulator of stabilizer circuits for qasm experiments',
+        'basis_gates': ['cx', 'id', 'x', 'y', 'z', 'h', 's', 'sdg'],
+        'gates': [{'name': 'TODO', 'parameters': [], 'qasm_def': 'TODO'}]
+    }
+
+    def __init__(self, configuration=None, provider=None):
+        super().__init__(configuration=(configuration or
+                                        BackendConfiguration.from_dict(self.DEFAULT_CONFIGURATION)),
+                         provider=provider)
+
+        # Define attributes in __init__.
+        self._shots = 0
+        self._qobj_config = None
+
+    def run(self, qobj, validation=None):
+        """Run qobj asynchronously.
+
+        Args:
+            qobj (Qobj): payload of the experiment
+            validation (str): Qobj validation mode, see ``AerJob``.
+
+        Returns:
+            AerJob: derived from BaseJob
+        """
+        job_id = str(uuid.uuid4())
+        aer_job = AerJob(self, job_id, self._run_job, qobj, validation)
+        aer_job.submit()
+        return aer_job
+
+    def _run_job(self, job_id, qobj):
+        """Run experiments in qobj.
+
+        Args:
+            job_id (str): unique id for the job.
+            qobj (Qobj): job description
+
+        Returns:
+            Result: Result object
+        """
+        self._validate(qobj)
+        self._shots = qobj.config.shots
+        self._qobj_config = qobj.config
+        start = time.time()
+        result_list = [self.run_experiment(experiment) for experiment in qobj.experiments]
+        end = time.time()
+        result = {'backend_name': self.name(),
+                  'backend_version': self._configuration.backend_version,
+                  'qobj_id': qobj.qobj_id,
+                  'job_id': job_id,
+                  'results': result_list,
+                  'status': 'COMPLETED',
+                  'success': True,
+                  'time_taken': (end - start),
+                  'header': qobj.header.as_dict()}
+
+        return Result.from_dict(result, validate=False)
+
+    def run_experiment(self, experiment):
+        """Run an experiment (circuit) and return a single experiment result.
+
+        Args:
+            experiment (QobjExperiment): experiment from qobj experiments list
+
+        Returns:
+            dict: A result dictionary, as for ``QasmSimulatorPy``.
+        """
+        start = time.time()
+        seed = self._experiment_seed(experiment)
+        random_state = np.random.RandomState(seed)
+        instructions = experiment.instructions
+        number_of_qubits = experiment.config.n_qubits
+
+        final_measurements = self._split_final_measurements(instructions)
+        if final_measurements is None:
+            states = [self._run_instructions(StabilizerTableau(number_of_qubits),
+                                             instructions, random_state)
+                      for _ in range(self._shots)]
+        else:
+            operations, measurements = final_measurements
+            tableau = StabilizerTableau(number_of_qubits)
+            self._run_instructions(tableau, operations, random_state)
+            states = [self._run_instructions(tableau.copy(), measurements, random_state)
+                      for _ in range(self._shots)]
+
+        # The counts are kept as integers, and formatted when accessed.
+        data = ExperimentResultData.from_integer_counts(
+            IntegerCounts.from_memory(states, experiment.config.memory_slots),
+            {'memory': list(map(hex, states))},
+            validate=False)
+        end = time.time()
+        return {'name': experiment.header.name,
+                'seed': seed,
+                'shots': self._shots,
+                'data': data,
+                'status': 'DONE',
+                'success': True,
+                'time_taken': (end - start),
+                'header': experiment.header.as_dict()}
+
+    def _run_instructions(self, tableau, instructions, random_state):
+        """Apply instructions to a tableau, and return the classical state.
+
+        Args:
+            tableau (StabilizerTableau): the tableau, updated in place.
+            instructions (list[QobjInstruction]): the instructions.
+            random_state (numpy.random.RandomState): the random generator of
+                the measurements.
+
+        Returns:
+            int: the classical state after the instructions.
+
+        Raises:
+            SimulatorError: if an instruction is not supported.
+        """
+        classical_state = 0
+        for operation in instructions:
+            if getattr(operation, 'conditional', None):
+                mask = int(operation.conditional.mask, 16)
+                if mask > 0:
+                    value = classical_state & mask
+                    while (mask & 0x1) == 0:
+                        mask >>= 1
+                        value >>= 1
+                    if value != int(operation.conditional.val, 16):
+                        continue
+            if operation.name in _SINGLE_GATES:
+                _SINGLE_GATES[operation.name](tableau, operation.qubits[0])
+            elif operation.name in ('CX', 'cx'):
+                tableau.cx_gate(*operation.qubits)
+            elif operation.name == 'measure':
+                outcome = tableau.measure(operation.qubits[0], random_state)
+                cbit = operation.memory[0]
+                classical_state = (classical_state & ~(1 << cbit)) | (outcome << cbit)
+            elif operation.name == 'reset':
+                if tableau.measure(operation.qubits[0], random_state):
+                    tableau.x_gate(operation.qubits[0])
+            elif operation.name in ('id', 'barrier'):
+                pass
+            else:
+                err_msg = '{0} encountered unrecognized operation "{1}"'
+                raise SimulatorError(err_msg.format(self.name(), operation.name))
+        return classical_state
+
+    @staticmethod
+    def _split_final_measurements(instructions):
+        """Split the final measurements from the gates before them.
+
+        Args:
+            instructions (list[QobjInstruction]): the instructions.
+
+        Returns:
+            tuple(list, list): the instructions other than measurements, and
+                the measurements, or None if the measurements cannot be made
+                last (see ``measurements_are_final()``), or if there are
+                conditionals or resets.
+        """
+        if any(getattr(operation, 'conditional', None) or operation.name == 'reset'
+               for operation in instructions):
+            return None
+        if not measurements_are_final(instructions):
+            return None
+        operations = [operation for operation in instructions if operation.name != 'measure']
+        measurements = [operation for operation in instructions if operation.name == 'measure']
+        return operations, measurements
+
+    def _experiment_seed(self, experiment):
+        """Return the seed of an experiment."""
+        # Get the seed looking in circuit, qobj, and then random.
+        if hasattr(experiment, 'config') and hasattr(experiment.config, 'seed'):
+            return experiment.config.seed
+        if hasattr(self._qobj_config, 'seed'):
+            return self._qobj_config.seed
+        return random.getrandbits(32)
+
+    def _validate(self, qobj):
+        """Semantic validations of the qobj which cannot be done via schemas.
+
+        1. Only Clifford gates, measurements, resets and barriers
+        2. Warn if there are no measurements
+        """
+        for experiment in qobj.experiments:
+            for operation in experiment.instructions:
+                if operation.name not in _SINGLE_GATES and operation.name not in (
+                        'CX', 'cx', 'id', 'measure', 'reset', 'barrier'):
+                    raise SimulatorError(
+                        'In circuit {}: {} does not support the operation "{}", only '
+                        'Clifford gates, measurements and resets.'.format(
+                            experiment.header.name, self.name(), operation.name))
+            if 'measure' not in [op.name for op in experiment.instructions]:
+                logger.warning("no measurements in circuit '%s', "
+                               "classical register will remain all zeros.",
+                               experiment.header.name)
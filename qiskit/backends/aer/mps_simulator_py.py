@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""Contains a Python simulator of matrix product states.
+
+It simulates the state of a circuit as a matrix product state (see
+``_mps``), whose memory grows with the entanglement of the state instead of
+exponentially with the number of qubits. Shallow circuits, whose CX gates
+act on nearby qubits, can be simulated on many more qubits than with the
+statevector simulators.
+
+.. code-block:: python
+
+    MPSSimulatorPy().run(qobj)
+
+Where the input is a Qobj object and the output is a AerJob object, which can
+later be queried for the Result object. The result contains the counts and
+the memory of the measurements, which are sampled for all the shots from the
+final state: no gate may act on a qubit after it is measured.
+
+The ``max_bond_dimension`` option, in the configuration of the Qobj or of an
+experiment, limits the number of singular values kept between two qubits,
+and ``truncation_threshold`` (1e-16 by default) discards the smaller ones.
+The sum of the discarded weights is returned in the ``metadata`` of the
+result of each experiment, as ``truncation_error``, along with the largest
+``bond_dimension`` of the final state.
+"""
+
+import logging
+import random
+import time
+import uuid
+
+import numpy as np
+
+from qiskit.backends import BaseBackend
+from qiskit.backends.aer.aerjob import AerJob
+from qiskit.backends.models import BackendConfiguration
+from qiskit.result import Result
+from qiskit.result._counts import IntegerCounts
+from qiskit.result.models import ExperimentResultData
+from ._mps import MatrixProductState
+from ._simulatorerror import SimulatorError
+from ._simulatortools import (cached_single_gate_matrix, experiment_option,
+                              measurements_are_final, simulation_dtype)
+
+logger = logging.getLogger(__name__)
+
+
+class MPSSimulatorPy(BaseBackend):
+    """Python simulator of matrix product states."""
+
+    DEFAULT_CONFIGURATION = {
+        'backend_name': 'mps_simulator_py',
+        'backend_version': '1.0.0',
+        'n_qubits': 1000,
+        'url': 'https://github.com/Qiskit/qiskit-terra',
+        'simulator': True,
+        'local': True,
+        'conditional': False,
+        'open_pulse': False,
+        'memory': True,
+        'max_shots': 65536,
+        'description': 'A python simulator of matrix product states for qasm experiments',
+        'basis_gates': ['u1', 'u2', 'u3', 'cx', 'id'],
+        'gates': [{'name': 'TODO', 'parameters': [], 'qasm_def': 'TODO'}]
+    }
+
+    def __init__(self, configuration=None, provider=None):
+        super().__init__(configuration=(configuration or
+                                        BackendConfiguration.from_dict(self.DEFAULT_CONFIGURATION)),
+                         provider=provider)
+
+        # Define attributes in __init__.
+        self._shots = 0
+        self._qobj_config = None
+
+    def run(self, qobj, validation=None):
+        """Run qobj asynchronously.
+
+        Args:
+            qobj (Qobj): payload of the experiment
+            validation (str): Qobj validation mode, see ``AerJob``.
+
+        Returns:
+            AerJob: derived from BaseJob
+        """
+        job_id = str(uuid.uuid4())
+        aer_job = AerJob(self, job_id, self._run_job, qobj, validation)
+        aer_job.submit()
+        return aer_job
+
+    def _run_job(self, job_id, qobj):
+        """Run experiments in qobj.
+
+        Args:
+            job_id (str): unique id for the job.
+            qobj (Qobj): job description
+
+        Returns:
+            Result: Result object
+        """
+        self._validate(qobj)
+        self._shots = qobj.config.shots
+        self._qobj_config = qobj.config
+        start = time.time()
+        result_list = [self.run_experiment(experiment) for experiment in qobj.experiments]
+        end = time.time()
+        result = {'backend_name': self.name(),
+                  'backend_version': self._configuration.backend_version,
+                  'qobj_id': qobj.qobj_id,
+                  'job_id': job_id,
+                  'results': result_list,
+                  'status': 'COMPLETED',
+                  'success': True,
+                  'time_taken': (end - start),
+                  'header': qobj.header.as_dict()}
+
+        return Result.from_dict(result, validate=False)
+
+    def run_experiment(self, experiment):
+        """Run an experiment (circuit) and return a single experiment result.
+
+        Args:
+            experiment (QobjExperiment): experiment from qobj experiments list
+
+        Returns:
+            dict: A result dictionary, as for ``QasmSimulatorPy``, with a
+                ``metadata`` field::
+
+                {
+                "truncation_error": sum of the discarded weights
+                "bond_dimension": largest bond dimension of the final state
+                }
+        """
+        start = time.time()
+        seed = self._experiment_seed(experiment)
+        state, measured_qubits = self.simulate(experiment)
+
+        memory_slots = experiment.config.memory_slots
+        if measured_qubits:
+            outcomes = state.sample(self._shots, np.random.RandomState(seed))
+            # Python integers for the outcomes that do not fit in an int64.
+            states = np.zeros(self._shots, dtype=np.int64 if memory_slots < 63 else object)
+            for cbit, qubit in measured_qubits.items():
+                states |= outcomes[:, qubit].astype(states.dtype) << cbit
+            states = states.tolist()
+        else:
+            states = [0] * self._shots
+
+        # The counts are kept as integers, and formatted when accessed.
+        data = ExperimentResultData.from_integer_counts(
+            IntegerCounts.from_memory(states, memory_slots),
+            {'memory': list(map(hex, states))},
+            validate=False)
+        end = time.time()
+        return {'name': experiment.header.name,
+                'seed': seed,
+                'shots': self._shots,
+                'data': data,
+                'status': 'DONE',
+                'success': True,
+                'time_taken': (end - start),
+                'header': experiment.header.as_dict(),
+                'metadata': {'truncation_error': state.truncation_error,
+                             'bond_dimension': state.bond_dimension}}
+
+    def simulate(self, experiment):
+        """Apply the gates of an experiment to a matrix product state.
+
+        Args:
+            experiment (QobjExperiment): an experiment validated by
+                ``_validate()``.
+
+        Returns:
+            tuple(MatrixProductState, dict): the final state, and the qubit
+                measured into each memory slot (the last measurement winning).
+
+        Raises:
+            SimulatorError: if an instruction is not supported.
+        """
+        state = MatrixProductState(
+            experiment.config.n_qubits,
+            max_bond_dimension=experiment_option(experiment, self._qobj_config,
+                                                 'max_bond_dimension'),
+            truncation_threshold=experiment_option(experiment, self._qobj_config,
+                                                   'truncation_threshold', 1e-16),
+            dtype=simulation_dtype(experiment, self._qobj_config))
+        measured_qubits = {}
+        for operation in experiment.instructions:
+            if operation.name in ('U', 'u1', 'u2', 'u3'):
+                gate = cached_single_gate_matrix(operation.name,
+                                                 getattr(operation, 'params', None))
+                state.apply_single(gate, operation.qubits[0])
+            elif operation.name in ('CX', 'cx'):
+                state.apply_cx(*operation.qubits)
+            elif operation.name == 'measure':
+                measured_qubits[operation.memory[0]] = operation.qubits[0]
+            elif operation.name in ('id', 'u0', 'barrier'):
+                pass
+            else:
+                err_msg = '{0} encountered unrecognized operation "{1}"'
+                raise SimulatorError(err_msg.format(self.name(), operation.name))
+        return state, measured_qubits
+
+    def _experiment_seed(self, experiment):
+        """Return the seed of an experiment."""
+        # Get the seed looking in circuit, qobj, and then random.
+        if hasattr(experiment, 'config') and hasattr(experiment.config, 'seed'):
+            return experiment.config.seed
+        if hasattr(self._qobj_config, 'seed'):
+            return self._qobj_config.seed
+        return random.getrandbits(32)
+
+    def _validate(self, qobj):
+        """Semantic validations of the qobj which cannot be done via schemas.
+
+        1. No conditionals, resets or snapshots
+        2. No gates on a qubit after it is measured
+        """
+        for experiment in qobj.experiments:
+            for operation in experiment.instructions:
+                if getattr(operation, 'conditional', None) or \
+                        operation.name in ('reset', 'snapshot'):
+                    raise SimulatorError(
+                        'In circuit {}: {} does not support conditionals, resets '
+                        'or snapshots.'.format(experiment.header.name, self.name()))
+            if not measurements_are_final(experiment.instructions):
+                raise SimulatorError(
+                    'In circuit {}: {} does not support gates on a qubit after it '
+                    'is measured.'.format(experiment.header.name, self.name()))
+            if 'measure' not in [op.name for op in experiment.instructions]:
+                logger.warning("no measurements in circuit '%s', "
+                               "classical register will remain all zeros.",
+                               experiment.header.name)
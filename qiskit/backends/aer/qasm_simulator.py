@@ -83,10 +83,18 @@ class QasmSimulator(BaseBackend):
             raise FileNotFoundError('Simulator executable not found (using %s)' %
                                     getattr(self._configuration, 'exe', 'default locations'))
 
-    def run(self, qobj):
-        """Run a qobj on the backend."""
+    def run(self, qobj, validation=None):
+        """Run a qobj on the backend.
+
+        Args:
+            qobj (Qobj): job description
+            validation (str): Qobj validation mode, see ``AerJob``.
+
+        Returns:
+            AerJob: derived from BaseJob
+        """
         job_id = str(uuid.uuid4())
-        aer_job = AerJob(self, job_id, self._run_job, qobj)
+        aer_job = AerJob(self, job_id, self._run_job, qobj, validation)
         aer_job.submit()
         return aer_job
 
@@ -96,7 +104,7 @@ class QasmSimulator(BaseBackend):
         qobj_dict = qobj.as_dict()
         result = run(qobj_dict, self._configuration.exe)
         result['job_id'] = job_id
-        return Result.from_dict(result)
+        return Result.from_dict(result, validate=False)
 
     def _validate(self, qobj):
         for experiment in qobj.experiments:
@@ -147,17 +155,18 @@ class CliffordSimulator(BaseBackend):
             raise FileNotFoundError('Simulator executable not found (using %s)' %
                                     getattr(self._configuration, 'exe', 'default locations'))
 
-    def run(self, qobj):
+    def run(self, qobj, validation=None):
         """Run a Qobj on the backend.
 
         Args:
             qobj (dict): job description
+            validation (str): Qobj validation mode, see ``AerJob``.
 
         Returns:
             AerJob: derived from BaseJob
         """
         job_id = str(uuid.uuid4())
-        aer_job = AerJob(self, job_id, self._run_job, qobj)
+        aer_job = AerJob(self, job_id, self._run_job, qobj, validation)
         aer_job.submit()
         return aer_job
 
@@ -171,7 +180,7 @@ class CliffordSimulator(BaseBackend):
             qobj_dict['config'] = {'simulator': 'clifford'}
         result = run(qobj_dict, self._configuration.exe)
         result['job_id'] = job_id
-        return Result.from_dict(result)
+        return Result.from_dict(result, validate=False)
 
     def _validate(self):
         return
@@ -20,6 +20,38 @@ The simulator is run using
 Where the input is a Qobj object and the output is a AerJob object, which can
 later be queried for the Result object. The result will contain a 'memory' data
 field, which is a result of measurements for each shot.
+
+When no gate acts on a qubit after it is measured, no conditional depends
+on a measurement, and there are no resets or snapshots, the experiment is
+simulated once and the outcomes of all the shots are sampled from the final
+statevector.
+Otherwise each shot is simulated from the start.
+
+With ``fusion`` set to True in the configuration of the Qobj or of an
+experiment, the gates are fused into fewer unitaries on one or two qubits
+before simulation (see ``_fusion``).
+
+With ``precision`` set to ``'single'``, the statevector is simulated with
+complex64 instead of complex128 amplitudes, halving its memory. The memory
+used by each experiment is estimated before simulating the Qobj, and a
+``SimulatorError`` is raised if it exceeds ``max_memory_mb`` (by default the
+memory of the machine).
+
+The experiments of a Qobj can be run in a pool of worker processes, with
+``max_parallel_experiments`` set to the number of workers (0 for the number
+of CPUs) in the configuration of the Qobj. With ``max_parallel_shots`` set,
+the shots of the experiments that are simulated shot by shot are also split
+into as many chunks, each chunk being seeded from the seed of its experiment.
+The results are in the order of the experiments, and do not depend on the
+number of workers.
+
+With ``sparse`` set to True, the statevector is stored as its nonzero
+amplitudes (see ``_sparse``), until more than ``sparse_threshold`` (1/16 by
+default) of the amplitudes are nonzero. It is then converted to a dense
+statevector, if that fits in ``max_memory_mb``. Circuits that keep few
+nonzero amplitudes, such as permutations of basis states, can be simulated
+on more qubits this way. Fusion and batching do not apply to sparse
+experiments.
 """
 import random
 import uuid
@@ -27,19 +59,32 @@ import time
 import logging
 
 from math import log2
-from collections import Counter
 import numpy as np
 
 from qiskit._util import local_hardware_info
 from qiskit.backends.models import BackendConfiguration
 from qiskit.result import Result
+from qiskit.result._counts import IntegerCounts
+from qiskit.result.models import ExperimentResultData
 from qiskit.backends import BaseBackend
 from qiskit.backends.aer.aerjob import AerJob
 from ._simulatorerror import SimulatorError
-from ._simulatortools import single_gate_matrix, index2
+from ._batch import batch_key, run_batch
+from ._fusion import fuse_gates
+from ._sparse import SparseStatevector
+from ._simulatortools import (cached_single_gate_matrix, check_memory, experiment_option,
+                              measurements_are_final, memory_budget, simulation_dtype)
+from ...transpiler._parallel import parallel_map, CPU_COUNT
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of amplitudes of the statevectors of a batch of experiments.
+BATCH_MAX_AMPLITUDES = 1 << 24
+
+# Default fraction of nonzero amplitudes over which a sparse statevector is
+# converted to a dense one.
+SPARSE_THRESHOLD = 1 / 16
+
 
 class QasmSimulatorPy(BaseBackend):
     """Python implementation of a qasm simulator."""
@@ -75,6 +120,17 @@ class QasmSimulatorPy(BaseBackend):
         self._number_of_qubits = 0
         self._shots = 0
         self._qobj_config = None
+        self._dtype = np.dtype(complex)
+        self._max_nonzeros = None
+
+    def _qubit_view(self, qubit):
+        """Return a view of the statevector with the qubit on the middle axis.
+
+        The view has shape ``(2**(n-qubit-1), 2, 2**qubit)``: ``view[:, b]``
+        are the amplitudes with the qubit in state ``b``, in increasing
+        order of their index.
+        """
+        return self._statevector.reshape(-1, 2, 1 << qubit)
 
     def _add_qasm_single(self, gate, qubit):
         """Apply an arbitrary 1-qubit operator to a qubit.
@@ -82,15 +138,19 @@ class QasmSimulatorPy(BaseBackend):
         Gate is the single qubit applied.
         qubit is the qubit the gate is applied to.
         """
-        psi = self._statevector
-        bit = 1 << qubit
-        for k1 in range(0, 1 << self._number_of_qubits, 1 << (qubit+1)):
-            for k2 in range(0, 1 << qubit, 1):
-                k = k1 | k2
-                cache0 = psi[k]
-                cache1 = psi[k | bit]
-                psi[k] = gate[0, 0] * cache0 + gate[0, 1] * cache1
-                psi[k | bit] = gate[1, 0] * cache0 + gate[1, 1] * cache1
+        if isinstance(self._statevector, SparseStatevector):
+            self._statevector.apply_single(gate, qubit)
+            if len(self._statevector) > self._max_nonzeros:
+                self._statevector = self._statevector.to_dense()
+            return
+        gate = gate.astype(self._dtype, copy=False)
+        view = self._qubit_view(qubit)
+        cache0 = view[:, 0].copy()
+        cache1 = view[:, 1]
+        # The 2x2 product is written out, with the same floating point
+        # operations as for each amplitude pair.
+        view[:, 0] = gate[0, 0] * cache0 + gate[0, 1] * cache1
+        view[:, 1] = gate[1, 0] * cache0 + gate[1, 1] * cache1
 
     def _add_qasm_cx(self, q0, q1):
         """Optimized ideal CX on two qubits.
@@ -98,27 +158,56 @@ class QasmSimulatorPy(BaseBackend):
         q0 is the first qubit (control) counts from 0.
         q1 is the second qubit (target).
         """
-        psi = self._statevector
-        for k in range(0, 1 << (self._number_of_qubits - 2)):
-            # first bit is control, second is target
-            ind1 = index2(1, q0, 0, q1, k)
-            # swap target if control is 1
-            ind3 = index2(1, q0, 1, q1, k)
-            cache0 = psi[ind1]
-            cache1 = psi[ind3]
-            psi[ind3] = cache0
-            psi[ind1] = cache1
+        if isinstance(self._statevector, SparseStatevector):
+            self._statevector.apply_cx(q0, q1)
+            return
+        high, low = max(q0, q1), min(q0, q1)
+        view = self._statevector.reshape(-1, 2, 1 << (high - low - 1), 2, 1 << low)
+        # swap target if control is 1
+        if q0 > q1:
+            ind1, ind3 = (slice(None), 1, slice(None), 0), (slice(None), 1, slice(None), 1)
+        else:
+            ind1, ind3 = (slice(None), 0, slice(None), 1), (slice(None), 1, slice(None), 1)
+        cache1 = view[ind3].copy()
+        view[ind3] = view[ind1]
+        view[ind1] = cache1
+
+    def _add_qasm_fused(self, gate, qubits):
+        """Apply a fused gate (see ``_fusion``) to one or two qubits.
+
+        gate is the 2x2 or 4x4 matrix, whose rows and columns are indexed by
+            bit_qubits[0] + 2 * bit_qubits[1].
+        qubits are the qubits the gate is applied to.
+        """
+        gate = gate.astype(self._dtype, copy=False)
+        if len(qubits) == 1:
+            view = self._qubit_view(qubits[0])
+            view[...] = np.matmul(gate, view)
+            return
+        qubit0, qubit1 = qubits
+        high, low = max(qubit0, qubit1), min(qubit0, qubit1)
+        view = self._statevector.reshape(-1, 2, 1 << (high - low - 1), 2, 1 << low)
+        # Move the axes of qubit1 and qubit0 first, as the gate indices.
+        axes = (1, 3) if qubit1 == high else (3, 1)
+        amplitudes = np.moveaxis(view, axes, (0, 1))
+        product = gate.dot(amplitudes.reshape(4, -1)).reshape(amplitudes.shape)
+        view[...] = np.moveaxis(product, (0, 1), axes)
 
     def _add_qasm_decision(self, qubit):
         """Apply the decision of measurement/reset qubit gate.
 
         qubit is the qubit that is measured/reset
         """
-        probability_zero = 0
         random_number = self._local_random.random()
-        for ii in range(1 << self._number_of_qubits):
-            if ii & (1 << qubit) == 0:
-                probability_zero += np.abs(self._statevector[ii])**2
+        if isinstance(self._statevector, SparseStatevector):
+            probability_zero = self._statevector.probability_zero(qubit)
+        else:
+            amplitudes = self._qubit_view(qubit)[:, 0].ravel()
+            # hypot() rounds as abs() of a single amplitude, and the
+            # probabilities are summed in order, so that the outcomes do not
+            # depend on the number of amplitudes processed at a time.
+            probabilities = np.hypot(amplitudes.real, amplitudes.imag) ** 2
+            probability_zero = np.add.accumulate(probabilities)[-1]
         if random_number <= probability_zero:
             outcome = '0'
             norm = np.sqrt(probability_zero)
@@ -134,12 +223,13 @@ class QasmSimulatorPy(BaseBackend):
         cbit is the classical bit the measurement is assigned to.
         """
         outcome, norm = self._add_qasm_decision(qubit)
-        for ii in range(1 << self._number_of_qubits):
-            # update quantum state
-            if (ii >> qubit) & 1 == int(outcome):
-                self._statevector[ii] = self._statevector[ii]/norm
-            else:
-                self._statevector[ii] = 0
+        # update quantum state
+        if isinstance(self._statevector, SparseStatevector):
+            self._statevector.project(qubit, int(outcome), norm)
+        else:
+            view = self._qubit_view(qubit)
+            view[:, int(outcome)] /= norm
+            view[:, 1 - int(outcome)] = 0
         # update classical state
         bit = 1 << cbit
         self._classical_state = (self._classical_state & (~bit)) | (int(outcome) << cbit)
@@ -152,23 +242,186 @@ class QasmSimulatorPy(BaseBackend):
 
         qubit is the qubit that is reset.
         """
-        # TODO: slow, refactor later
         outcome, norm = self._add_qasm_decision(qubit)
-        temp = np.copy(self._statevector)
-        self._statevector.fill(0.0)
+        if isinstance(self._statevector, SparseStatevector):
+            self._statevector.project(qubit, int(outcome), norm)
+            if outcome == '1':
+                self._statevector.flip(qubit)
+            return
+        view = self._qubit_view(qubit)
         # measurement
-        for ii in range(1 << self._number_of_qubits):
-            if (ii >> qubit) & 1 == int(outcome):
-                temp[ii] = temp[ii]/norm
-            else:
-                temp[ii] = 0
+        measured = view[:, int(outcome)] / norm
+        view.fill(0.0)
         # reset
         if outcome == '1':
-            for ii in range(1 << self._number_of_qubits):
-                iip = (~ (1 << qubit)) & ii  # bit number qubit set to zero
-                self._statevector[iip] += temp[ii]
+            view[:, 0] += measured
         else:
-            self._statevector = temp
+            view[:, 0] = measured
+
+    def _initialize_statevector(self):
+        """Set the quantum and classical states to zero.
+
+        Raises:
+            SimulatorError: if a sparse statevector has more than 62 qubits.
+        """
+        if self._max_nonzeros is not None:
+            if self._number_of_qubits > 62:
+                raise SimulatorError('{} supports sparse statevectors of up to 62 qubits, '
+                                     'not {}.'.format(self.name(), self._number_of_qubits))
+            self._statevector = SparseStatevector(self._number_of_qubits, self._dtype)
+        else:
+            self._statevector = np.zeros(1 << self._number_of_qubits,
+                                         dtype=self._dtype)
+            self._statevector[0] = 1
+        self._classical_state = 0
+
+    def _run_instructions(self, instructions):
+        """Apply instructions to the quantum and classical states.
+
+        Args:
+            instructions (list[QobjInstruction]): the instructions.
+
+        Raises:
+            SimulatorError: if an instruction is not supported.
+        """
+        for operation in instructions:
+            if getattr(operation, 'conditional', None):
+                mask = int(operation.conditional.mask, 16)
+                if mask > 0:
+                    value = self._classical_state & mask
+                    while (mask & 0x1) == 0:
+                        mask >>= 1
+                        value >>= 1
+                    if value != int(operation.conditional.val, 16):
+                        continue
+            # Check if single  gate
+            if operation.name in ('U', 'u1', 'u2', 'u3'):
+                params = getattr(operation, 'params', None)
+                qubit = operation.qubits[0]
+                gate = cached_single_gate_matrix(operation.name, params)
+                self._add_qasm_single(gate, qubit)
+            # Check if fused gate
+            elif operation.name == 'fused':
+                self._add_qasm_fused(operation.matrix, operation.qubits)
+            # Check if CX gate
+            elif operation.name in ('id', 'u0'):
+                pass
+            elif operation.name in ('CX', 'cx'):
+                qubit0 = operation.qubits[0]
+                qubit1 = operation.qubits[1]
+                self._add_qasm_cx(qubit0, qubit1)
+            # Check if measure
+            elif operation.name == 'measure':
+                qubit = operation.qubits[0]
+                cbit = operation.memory[0]
+                self._add_qasm_measure(qubit, cbit)
+            # Check if reset
+            elif operation.name == 'reset':
+                qubit = operation.qubits[0]
+                self._add_qasm_reset(qubit)
+            # Check if barrier
+            elif operation.name == 'barrier':
+                pass
+            # Check if snapshot command
+            elif operation.name == 'snapshot':
+                params = operation.params
+                self._add_qasm_snapshot(params[0])
+            else:
+                backend = self.name()
+                err_msg = '{0} encountered unrecognized operation "{1}"'
+                raise SimulatorError(err_msg.format(backend,
+                                                    operation.name))
+
+    @staticmethod
+    def _can_sample_measure(instructions):
+        """Return whether the shots can be sampled from a single run.
+
+        This is the case when no instruction acts on a qubit after it is
+        measured, no conditional depends on a measurement (see
+        ``measurements_are_final()``), and there are no resets or snapshots
+        (which are recorded once per shot).
+
+        Args:
+            instructions (list[QobjInstruction]): the instructions.
+
+        Returns:
+            bool: whether the measurements can be sampled.
+        """
+        if any(operation.name in ('reset', 'snapshot') for operation in instructions):
+            return False
+        return measurements_are_final(instructions)
+
+    def _sample_measure(self, instructions, fusion=False):
+        """Run the instructions once, and sample the measurements of each shot.
+
+        The instructions before the measurements are applied once, and the
+        outcomes of all the shots are drawn at once from the probabilities
+        of the final statevector.
+
+        Args:
+            instructions (list[QobjInstruction]): instructions for which
+                ``_can_sample_measure()`` is true.
+            fusion (bool): fuse the gates before applying them.
+
+        Returns:
+            list[int]: the classical state of each shot.
+        """
+        operations, measured_qubits = self._split_measurements(instructions)
+        if fusion:
+            operations = fuse_gates(operations)
+        self._initialize_statevector()
+        self._run_instructions(operations)
+        return self._sample_statevector(measured_qubits)
+
+    @staticmethod
+    def _split_measurements(instructions):
+        """Split the final measurements from the other instructions.
+
+        Args:
+            instructions (list[QobjInstruction]): instructions for which
+                ``_can_sample_measure()`` is true.
+
+        Returns:
+            tuple(list, dict): the instructions other than measurements, and
+                the qubit measured into each memory slot (the last
+                measurement winning).
+        """
+        measured_qubits = {}
+        operations = []
+        for operation in instructions:
+            if operation.name == 'measure':
+                measured_qubits[operation.memory[0]] = operation.qubits[0]
+            else:
+                operations.append(operation)
+        return operations, measured_qubits
+
+    def _sample_statevector(self, measured_qubits):
+        """Sample the measurements of each shot from the statevector.
+
+        Args:
+            measured_qubits (dict): the qubit measured into each memory slot.
+
+        Returns:
+            list[int]: the classical state of each shot.
+        """
+        if isinstance(self._statevector, SparseStatevector):
+            amplitudes = self._statevector.amplitudes
+        else:
+            amplitudes = self._statevector
+        cumulative = np.cumsum(np.abs(amplitudes) ** 2)
+        rng = np.random.RandomState(self._local_random.getrandbits(32))
+        samples = np.searchsorted(cumulative, rng.random_sample(self._shots) * cumulative[-1],
+                                  side='right')
+        samples = np.minimum(samples, len(cumulative) - 1)
+        if isinstance(self._statevector, SparseStatevector):
+            samples = self._statevector.indices[samples]
+
+        dtype = np.int64 if self._number_of_cbits < 63 else object
+        samples = samples.astype(dtype)
+        states = np.zeros(self._shots, dtype=dtype)
+        for cbit, qubit in measured_qubits.items():
+            states |= ((samples >> qubit) & 1) << cbit
+        return states.tolist()
 
     def _add_qasm_snapshot(self, slot):
         """Snapshot instruction to record simulator's internal representation
@@ -177,21 +430,26 @@ class QasmSimulatorPy(BaseBackend):
         Args:
             slot (string): a label to identify the recorded snapshot.
         """
+        if isinstance(self._statevector, SparseStatevector):
+            statevector = self._statevector.to_dense()
+        else:
+            statevector = np.copy(self._statevector)
         self._snapshots.setdefault(str(slot),
                                    {}).setdefault("statevector",
-                                                  []).append(np.copy(self._statevector))
+                                                  []).append(statevector)
 
-    def run(self, qobj):
+    def run(self, qobj, validation=None):
         """Run qobj asynchronously.
 
         Args:
             qobj (Qobj): payload of the experiment
+            validation (str): Qobj validation mode, see ``AerJob``.
 
         Returns:
             AerJob: derived from BaseJob
         """
         job_id = str(uuid.uuid4())
-        aer_job = AerJob(self, job_id, self._run_job, qobj)
+        aer_job = AerJob(self, job_id, self._run_job, qobj, validation)
         aer_job.submit()
         return aer_job
 
@@ -211,8 +469,16 @@ class QasmSimulatorPy(BaseBackend):
         self._qobj_config = qobj.config
         start = time.time()
 
-        for experiment in qobj.experiments:
-            result_list.append(self.run_experiment(experiment))
+        if isinstance(qobj.experiments, list):
+            # Fail before simulating anything if an experiment is too large.
+            for experiment in qobj.experiments:
+                self._check_memory(experiment)
+            result_list = self._run_experiments(qobj.experiments)
+        else:
+            # Experiments read from a file, one at a time.
+            for experiment in qobj.experiments:
+                self._check_memory(experiment)
+                result_list.append(self.run_experiment(experiment))
         end = time.time()
         result = {'backend_name': self.name(),
                   'backend_version': self._configuration.backend_version,
@@ -224,13 +490,15 @@ class QasmSimulatorPy(BaseBackend):
                   'time_taken': (end - start),
                   'header': qobj.header.as_dict()}
 
-        return Result.from_dict(result)
+        return Result.from_dict(result, validate=False)
 
-    def run_experiment(self, experiment):
+    def run_experiment(self, experiment, seed=None):
         """Run an experiment (circuit) and return a single experiment result.
 
         Args:
             experiment (QobjExperiment): experiment from qobj experiments list
+            seed (int): seed of the experiment, looked up in the experiment
+                and Qobj configs if None.
 
         Returns:
              dict: A result dictionary which looks something like::
@@ -257,80 +525,159 @@ class QasmSimulatorPy(BaseBackend):
         """
         self._number_of_qubits = experiment.config.n_qubits
         self._number_of_cbits = experiment.config.memory_slots
+        self._dtype = simulation_dtype(experiment, self._qobj_config)
+        self._max_nonzeros = self._sparse_max_nonzeros(experiment)
         self._statevector = 0
         self._classical_state = 0
         self._snapshots = {}
+        seed = self._seed_experiment(experiment, seed)
+        fusion = self._fusion(experiment)
+
+        start = time.time()
+        if self._shots > 1 and self._can_sample_measure(experiment.instructions):
+            states = self._sample_measure(experiment.instructions, fusion)
+        else:
+            states = self._run_shots(experiment, self._shots)
+
+        return self._experiment_result(experiment, seed, states, start)
+
+    def _run_shots(self, experiment, shots):
+        """Simulate the shots of an experiment one by one.
+
+        Args:
+            experiment (QobjExperiment): the experiment.
+            shots (int): the number of shots.
+
+        Returns:
+            list[int]: the classical state of each shot.
+        """
+        instructions = experiment.instructions
+        if self._fusion(experiment):
+            instructions = fuse_gates(instructions)
+        states = []
+        for _ in range(shots):
+            self._initialize_statevector()
+            self._run_instructions(instructions)
+            states.append(self._classical_state)
+        return states
+
+    def _experiment_seed(self, experiment):
+        """Return the seed of an experiment.
+
+        Args:
+            experiment (QobjExperiment): the experiment.
 
+        Returns:
+            int: the seed of the experiment.
+        """
         # Get the seed looking in circuit, qobj, and then random.
         if hasattr(experiment, 'config') and hasattr(experiment.config, 'seed'):
-            seed = experiment.config.seed
-        elif hasattr(self._qobj_config, 'seed'):
-            seed = self._qobj_config.seed
-        else:
-            seed = random.getrandbits(32)
+            return experiment.config.seed
+        if hasattr(self._qobj_config, 'seed'):
+            return self._qobj_config.seed
+        return random.getrandbits(32)
+
+    def _seed_experiment(self, experiment, seed=None):
+        """Seed the random number generator for an experiment.
+
+        Args:
+            experiment (QobjExperiment): the experiment.
+            seed (int): the seed, looked up with ``_experiment_seed()`` if None.
+
+        Returns:
+            int: the seed of the experiment.
+        """
+        if seed is None:
+            seed = self._experiment_seed(experiment)
         self._local_random.seed(seed)
-        outcomes = []
+        return seed
 
-        start = time.time()
-        for _ in range(self._shots):
-            self._statevector = np.zeros(1 << self._number_of_qubits,
-                                         dtype=complex)
-            self._statevector[0] = 1
-            self._classical_state = 0
-            for operation in experiment.instructions:
-                if getattr(operation, 'conditional', None):
-                    mask = int(operation.conditional.mask, 16)
-                    if mask > 0:
-                        value = self._classical_state & mask
-                        while (mask & 0x1) == 0:
-                            mask >>= 1
-                            value >>= 1
-                        if value != int(operation.conditional.val, 16):
-                            continue
-                # Check if single  gate
-                if operation.name in ('U', 'u1', 'u2', 'u3'):
-                    params = getattr(operation, 'params', None)
-                    qubit = operation.qubits[0]
-                    gate = single_gate_matrix(operation.name, params)
-                    self._add_qasm_single(gate, qubit)
-                # Check if CX gate
-                elif operation.name in ('id', 'u0'):
-                    pass
-                elif operation.name in ('CX', 'cx'):
-                    qubit0 = operation.qubits[0]
-                    qubit1 = operation.qubits[1]
-                    self._add_qasm_cx(qubit0, qubit1)
-                # Check if measure
-                elif operation.name == 'measure':
-                    qubit = operation.qubits[0]
-                    cbit = operation.memory[0]
-                    self._add_qasm_measure(qubit, cbit)
-                # Check if reset
-                elif operation.name == 'reset':
-                    qubit = operation.qubits[0]
-                    self._add_qasm_reset(qubit)
-                # Check if barrier
-                elif operation.name == 'barrier':
-                    pass
-                # Check if snapshot command
-                elif operation.name == 'snapshot':
-                    params = operation.params
-                    self._add_qasm_snapshot(params[0])
-                else:
-                    backend = self.name()
-                    err_msg = '{0} encountered unrecognized operation "{1}"'
-                    raise SimulatorError(err_msg.format(backend,
-                                                        operation.name))
-            # Turn classical_state (int) into bit string and pad zero for unused cbits
-            outcome = bin(self._classical_state)[2:]
-            # Return a compact hexadecimal
-            outcomes.append(hex(int(outcome, 2)))
-
-        data = {
-            'counts': dict(Counter(outcomes)),
-            'memory': outcomes,
-            'snapshots': self._snapshots
-        }
+    def _experiment_memory(self, experiment):
+        """Estimate the memory used by the simulation of an experiment.
+
+        The estimate counts the statevector, the temporary arrays of the
+        gates, the probabilities of the sampled shots, and the snapshots.
+
+        Args:
+            experiment (QobjExperiment): the experiment.
+
+        Returns:
+            int: the estimated memory, in bytes.
+        """
+        number_of_amplitudes = 1 << experiment.config.n_qubits
+        statevector = simulation_dtype(experiment, self._qobj_config).itemsize * \
+            number_of_amplitudes
+        if self._shots > 1 and self._can_sample_measure(experiment.instructions):
+            # Cumulative probabilities and the outcome of each shot.
+            return 2 * statevector + 8 * (number_of_amplitudes + self._shots)
+        snapshots = sum(1 for instruction in experiment.instructions
+                        if instruction.name == 'snapshot')
+        return (2 + snapshots * max(self._shots, 1)) * statevector
+
+    def _check_memory(self, experiment):
+        """Check that the simulation of an experiment fits in its memory budget.
+
+        Sparse experiments are not checked, as their statevector only
+        becomes dense if it fits (see ``_sparse_max_nonzeros()``).
+
+        Raises:
+            SimulatorError: if it does not, see ``check_memory()``.
+        """
+        if not self._sparse(experiment):
+            check_memory(self.name(), experiment, self._qobj_config,
+                         self._experiment_memory(experiment))
+
+    def _sparse(self, experiment):
+        """Return whether to use a sparse statevector, as asked in the experiment or Qobj config."""
+        return experiment_option(experiment, self._qobj_config, 'sparse', False)
+
+    def _sparse_max_nonzeros(self, experiment):
+        """Return the number of nonzero amplitudes over which a sparse
+        statevector is converted to a dense one.
+
+        Args:
+            experiment (QobjExperiment): the experiment.
+
+        Returns:
+            int: the number of amplitudes, ``2**n`` if the dense statevector
+                does not fit in the memory budget, or None if the experiment
+                is not simulated with a sparse statevector.
+        """
+        if not self._sparse(experiment):
+            return None
+        number_of_amplitudes = 1 << experiment.config.n_qubits
+        if self._experiment_memory(experiment) > memory_budget(experiment, self._qobj_config):
+            return number_of_amplitudes
+        threshold = experiment_option(experiment, self._qobj_config, 'sparse_threshold',
+                                      SPARSE_THRESHOLD)
+        return max(1, int(threshold * number_of_amplitudes))
+
+    def _fusion(self, experiment):
+        """Return whether to fuse the gates, as asked in the experiment or Qobj config.
+
+        Gates are not fused in sparse experiments.
+        """
+        return getattr(experiment.config, 'fusion',
+                       getattr(self._qobj_config, 'fusion', False)) and \
+            not self._sparse(experiment)
+
+    def _experiment_result(self, experiment, seed, states, start):
+        """Return the result dict of an experiment.
+
+        Args:
+            experiment (QobjExperiment): the experiment.
+            seed (int): the seed of the experiment.
+            states (list[int]): the classical state of each shot.
+            start (float): the time the simulation of the experiment started.
+
+        Returns:
+            dict: the result of the experiment, as in ``run_experiment()``.
+        """
+        # The counts are kept as integers, and formatted when accessed.
+        data = ExperimentResultData.from_integer_counts(
+            IntegerCounts.from_memory(states, self._number_of_cbits),
+            {'memory': list(map(hex, states)), 'snapshots': self._snapshots},
+            validate=False)
         end = time.time()
         return {'name': experiment.header.name,
                 'seed': seed,
@@ -341,6 +688,207 @@ class QasmSimulatorPy(BaseBackend):
                 'time_taken': (end-start),
                 'header': experiment.header.as_dict()}
 
+    def _batches(self, experiments):
+        """Group the experiments that can be simulated together.
+
+        Args:
+            experiments (list[QobjExperiment]): the experiments.
+
+        Returns:
+            list[list[int]]: the indices of the experiments of each batch, in
+                the order of their first experiment.
+        """
+        batches = []
+        batch_indices = {}
+        for index, experiment in enumerate(experiments):
+            key = None
+            if not self._fusion(experiment) and not self._sparse(experiment):
+                key = batch_key(experiment, self._shots)
+            if key is None:
+                batches.append([index])
+                continue
+            dtype = simulation_dtype(experiment, self._qobj_config)
+            key = (dtype, key)
+            max_size = max(1, min(BATCH_MAX_AMPLITUDES >> experiment.config.n_qubits,
+                                  memory_budget(experiment, self._qobj_config) //
+                                  self._experiment_memory(experiment)))
+            batch = batch_indices.get(key)
+            if batch is None or len(batch) >= max_size:
+                batch = batch_indices[key] = []
+                batches.append(batch)
+            batch.append(index)
+        return batches
+
+    def _run_batch(self, experiments, seeds=None):
+        """Run experiments with the same batch key together.
+
+        Args:
+            experiments (list[QobjExperiment]): the experiments.
+            seeds (list[int]): the seed of each experiment, looked up in the
+                experiment and Qobj configs if None.
+
+        Returns:
+            list[dict]: the result of each experiment, as in ``run_experiment()``.
+        """
+        start = time.time()
+        self._number_of_qubits = experiments[0].config.n_qubits
+        self._number_of_cbits = experiments[0].config.memory_slots
+        self._dtype = simulation_dtype(experiments[0], self._qobj_config)
+        operations, measured_qubits = zip(*[self._split_measurements(experiment.instructions)
+                                            for experiment in experiments])
+        statevectors, snapshots = run_batch(operations, self._number_of_qubits, self._dtype)
+        # The time of the batch is shared among its experiments.
+        batch_time = (time.time() - start) / len(experiments)
+
+        results = []
+        for index, experiment in enumerate(experiments):
+            experiment_start = time.time() - batch_time
+            seed = self._seed_experiment(experiment, seeds[index] if seeds else None)
+            self._statevector = np.ascontiguousarray(statevectors[:, index])
+            self._snapshots = snapshots[index]
+            if self._shots > 1:
+                states = self._sample_statevector(measured_qubits[index])
+            else:
+                states = [0]
+            results.append(self._experiment_result(experiment, seed, states, experiment_start))
+        return results
+
+    def _max_parallel(self, name):
+        """Return the number of workers set by an option of the Qobj config.
+
+        Args:
+            name (str): ``'max_parallel_experiments'`` or ``'max_parallel_shots'``.
+
+        Returns:
+            int: the number of workers, ``CPU_COUNT`` if the option is 0.
+        """
+        value = getattr(self._qobj_config, name, 1)
+        return value if value > 0 else CPU_COUNT
+
+    def _run_experiments(self, experiments):
+        """Run the experiments of a Qobj, possibly in parallel.
+
+        The experiments are split into tasks: a batch of experiments (see
+        ``_batches()``), a single experiment, or a chunk of the shots of an
+        experiment simulated shot by shot. The tasks are run in a pool of
+        ``max_parallel_experiments`` processes, or in this process if 1.
+
+        The seeds of the experiments are drawn before the tasks are
+        dispatched, and the seed of each chunk of shots is drawn from the
+        seed of its experiment, so that the results do not depend on the
+        workers that run the tasks.
+
+        Args:
+            experiments (list[QobjExperiment]): the experiments.
+
+        Returns:
+            list[dict]: the result of each experiment, as in ``run_experiment()``.
+        """
+        num_processes = self._max_parallel('max_parallel_experiments')
+        num_chunks = self._max_parallel('max_parallel_shots')
+        seeds = [self._experiment_seed(experiment) for experiment in experiments]
+
+        # Each task is (its experiments, their seeds, shots of the chunk or
+        # None for all the shots), and runs the experiments at task_indices.
+        tasks = []
+        task_indices = []
+        for indices in self._batches(experiments):
+            experiment = experiments[indices[0]]
+            if len(indices) == 1 and num_chunks > 1 and self._shots > 1 and \
+                    not self._can_sample_measure(experiment.instructions):
+                chunk_random = random.Random(seeds[indices[0]])
+                for shots in _shot_chunks(self._shots, num_chunks):
+                    tasks.append(([experiment], [chunk_random.getrandbits(32)], shots))
+                    task_indices.append(indices)
+            else:
+                tasks.append(([experiments[index] for index in indices],
+                              [seeds[index] for index in indices], None))
+                task_indices.append(indices)
+
+        if num_processes > 1 and len(tasks) > 1:
+            # Do not send the state of the last experiment to the workers.
+            self._statevector = 0
+            self._snapshots = {}
+            task_results = parallel_map(_run_task, tasks, task_args=(self,),
+                                        num_processes=num_processes,
+                                        costs=[self._task_cost(task[0], task[2]) for task in tasks])
+        else:
+            task_results = [_run_task(task, self) for task in tasks]
+
+        result_list = [None] * len(experiments)
+        chunks = {}
+        for (_, _, shots), indices, results in zip(tasks, task_indices, task_results):
+            if shots is None:
+                for index, experiment_result in zip(indices, results):
+                    result_list[index] = experiment_result
+            else:
+                chunks.setdefault(indices[0], []).append(results)
+        for index, experiment_chunks in chunks.items():
+            result_list[index] = self._merge_chunks(experiments[index], seeds[index],
+                                                    experiment_chunks)
+        return result_list
+
+    def _run_task(self, experiments, seeds, shots):
+        """Run a task of ``_run_experiments()``.
+
+        Args:
+            experiments (list[QobjExperiment]): the experiments of the task.
+            seeds (list[int]): the seed of each experiment.
+            shots (int): the number of shots of a chunk of shots, or None to
+                run all the shots of the experiments.
+
+        Returns:
+            list[dict] or tuple(list[int], dict, float): the result of each
+                experiment, or the classical state of each shot, the
+                snapshots and the time taken by a chunk of shots.
+        """
+        if shots is None:
+            if len(experiments) == 1:
+                return [self.run_experiment(experiments[0], seeds[0])]
+            return self._run_batch(experiments, seeds)
+
+        experiment = experiments[0]
+        start = time.time()
+        self._number_of_qubits = experiment.config.n_qubits
+        self._number_of_cbits = experiment.config.memory_slots
+        self._dtype = simulation_dtype(experiment, self._qobj_config)
+        self._max_nonzeros = self._sparse_max_nonzeros(experiment)
+        self._snapshots = {}
+        self._seed_experiment(experiment, seeds[0])
+        states = self._run_shots(experiment, shots)
+        return states, self._snapshots, time.time() - start
+
+    def _merge_chunks(self, experiment, seed, chunks):
+        """Return the result of an experiment from those of its chunks of shots.
+
+        Args:
+            experiment (QobjExperiment): the experiment.
+            seed (int): the seed of the experiment.
+            chunks (list[tuple]): the classical states, snapshots and time
+                taken of each chunk, in order.
+
+        Returns:
+            dict: the result of the experiment, as in ``run_experiment()``.
+        """
+        states = []
+        self._snapshots = {}
+        for chunk_states, chunk_snapshots, _ in chunks:
+            states.extend(chunk_states)
+            for slot, snapshot in chunk_snapshots.items():
+                self._snapshots.setdefault(slot, {}).setdefault(
+                    'statevector', []).extend(snapshot['statevector'])
+        self._number_of_cbits = experiment.config.memory_slots
+        start = time.time() - sum(chunk[2] for chunk in chunks)
+        return self._experiment_result(experiment, seed, states, start)
+
+    def _task_cost(self, experiments, shots):
+        """Estimate the cost of a task of ``_run_experiments()``, for balancing the workers."""
+        experiment = experiments[0]
+        cost = len(experiments) * len(experiment.instructions) << experiment.config.n_qubits
+        if shots is None and not self._can_sample_measure(experiment.instructions):
+            shots = self._shots
+        return cost * (shots or 1)
+
     def _validate(self, qobj):
         for experiment in qobj.experiments:
             if 'measure' not in [op.name for
@@ -348,3 +896,14 @@ class QasmSimulatorPy(BaseBackend):
                 logger.warning("no measurements in circuit '%s', "
                                "classical register will remain all zeros.",
                                experiment.header.name)
+
+
+def _shot_chunks(shots, num_chunks):
+    """Split a number of shots into at most ``num_chunks`` chunks of similar size."""
+    num_chunks = min(shots, num_chunks)
+    return [shots // num_chunks + (index < shots % num_chunks) for index in range(num_chunks)]
+
+
+def _run_task(task, backend):
+    """Run a task of ``QasmSimulatorPy._run_experiments()``, in a worker process."""
+    return backend._run_task(*task)
@@ -51,10 +51,18 @@ class StatevectorSimulator(QasmSimulator):
                                         BackendConfiguration.from_dict(self.DEFAULT_CONFIGURATION)),
                          provider=provider)
 
-    def run(self, qobj):
-        """Run a qobj on the backend."""
+    def run(self, qobj, validation=None):
+        """Run a qobj on the backend.
+
+        Args:
+            qobj (Qobj): job description
+            validation (str): Qobj validation mode, see ``AerJob``.
+
+        Returns:
+            AerJob: derived from BaseJob
+        """
         job_id = str(uuid.uuid4())
-        aer_job = AerJob(self, job_id, self._run_job, qobj)
+        aer_job = AerJob(self, job_id, self._run_job, qobj, validation)
         aer_job.submit()
         return aer_job
 
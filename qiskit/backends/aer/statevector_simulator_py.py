@@ -55,17 +55,18 @@ class StatevectorSimulatorPy(QasmSimulatorPy):
                                         BackendConfiguration.from_dict(self.DEFAULT_CONFIGURATION)),
                          provider=provider)
 
-    def run(self, qobj):
+    def run(self, qobj, validation=None):
         """Run qobj asynchronously.
 
         Args:
             qobj (dict): job description
+            validation (str): Qobj validation mode, see ``AerJob``.
 
         Returns:
             AerJob: derived from BaseJob
         """
         job_id = str(uuid.uuid4())
-        aer_job = AerJob(self, job_id, self._run_job, qobj)
+        aer_job = AerJob(self, job_id, self._run_job, qobj, validation)
         aer_job.submit()
         return aer_job
 
@@ -18,6 +18,23 @@ Where the input is a Qobj object and the output is a AerJob object, which can
 later be queried for the Result object. The result will contain a 'unitary'
 data field, which is a 2**n x 2**n complex numpy array representing the
 circuit's unitary matrix.
+
+With ``fusion`` set to True in the configuration of the Qobj or of an
+experiment, the gates are fused into fewer unitaries on one or two qubits
+before simulation (see ``_fusion``).
+
+With ``precision`` set to ``'single'``, the unitary is computed with
+complex64 instead of complex128 numbers. The memory used by an experiment is
+estimated before simulating the Qobj, and a ``SimulatorError`` is raised if
+it exceeds ``max_memory_mb`` (by default the memory of the machine).
+
+The gates are applied with ``np.tensordot``, a matrix product over the
+indices of their qubits, so the number of qubits is only limited by the
+memory. The experiments of a Qobj that start with the same instructions,
+such as the circuits of a process tomography that share their preparation,
+compute the unitary of their common prefix once: the experiments are
+simulated in the order of their instructions, and the unitary of the prefix
+shared with the next experiment is kept while memory allows.
 """
 import logging
 import uuid
@@ -30,7 +47,9 @@ from qiskit.backends import BaseBackend
 from qiskit.backends.aer.aerjob import AerJob
 from qiskit.result import Result
 from ._simulatorerror import SimulatorError
-from ._simulatortools import single_gate_matrix, einsum_matmul_index
+from ._fusion import fuse_gates
+from ._simulatortools import (cached_single_gate_matrix, check_memory, experiment_option,
+                              memory_budget, simulation_dtype)
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +57,21 @@ logger = logging.getLogger(__name__)
 # TODO add ["status"] = 'DONE', 'ERROR' especially for empty circuit error
 # does not show up
 
+_CX_MATRIX = np.array([[1, 0, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0], [0, 1, 0, 0]])
+
+
+def _common_prefix_length(key0, key1):
+    """Return the number of instructions shared at the start of two
+    experiments, from their keys (see ``UnitarySimulatorPy._experiment_key``)."""
+    if key0[0] != key1[0]:
+        return 0
+    length = 0
+    for operation0, operation1 in zip(key0[1], key1[1]):
+        if operation0 != operation1:
+            break
+        length += 1
+    return length
+
 
 class UnitarySimulatorPy(BaseBackend):
     """Python implementation of a unitary simulator."""
@@ -66,6 +100,10 @@ class UnitarySimulatorPy(BaseBackend):
         # Define attributes inside __init__.
         self._unitary_state = None
         self._number_of_qubits = 0
+        self._qobj_config = None
+        # Axes of the unitary tensor contracted by a gate, by number of
+        # qubits and qubits of the gate.
+        self._gate_axes = {}
 
     def _add_unitary_single(self, gate, qubit):
         """Apply the single-qubit gate.
@@ -75,16 +113,7 @@ class UnitarySimulatorPy(BaseBackend):
             is q_{n-1} ... otimes q_1 otimes q_0.
         number_of_qubits is the number of qubits in the system.
         """
-        # Convert to complex rank-2 tensor
-        gate_tensor = np.array(gate, dtype=complex)
-        # Compute einsum index string for 1-qubit matrix multiplication
-        indexes = einsum_matmul_index([qubit], self._number_of_qubits)
-        # Apply matrix multiplication
-        self._unitary_state = np.einsum(indexes,
-                                        gate_tensor,
-                                        self._unitary_state,
-                                        dtype=complex,
-                                        casting='no')
+        self._add_unitary(gate, [qubit])
 
     def _add_unitary_two(self, gate, qubit0, qubit1):
         """Apply the two-qubit gate.
@@ -94,31 +123,45 @@ class UnitarySimulatorPy(BaseBackend):
         qubit1 is the second qubit (target)
         returns a complex numpy array
         """
+        self._add_unitary(gate, [qubit0, qubit1])
 
-        # Convert to complex rank-4 tensor
-        gate_tensor = np.reshape(np.array(gate, dtype=complex), 4 * [2])
-
-        # Compute einsum index string for 2-qubit matrix multiplication
-        indexes = einsum_matmul_index([qubit0, qubit1], self._number_of_qubits)
+    def _add_unitary(self, gate, qubits):
+        """Apply a gate on k qubits.
 
-        # Apply matrix multiplication
-        self._unitary_state = np.einsum(indexes,
-                                        gate_tensor,
-                                        self._unitary_state,
-                                        dtype=complex,
-                                        casting='no')
-
-    def run(self, qobj):
+        gate is the 2**k x 2**k matrix of the gate, whose index has the bit
+            of the last qubit as most significant bit.
+        qubits is the list of the qubits, counted from 0.
+        """
+        number_of_gate_qubits = len(qubits)
+        # Convert to complex rank-2k tensor
+        gate_tensor = np.reshape(np.asarray(gate, dtype=self._unitary_state.dtype),
+                                 2 * number_of_gate_qubits * [2])
+        key = (self._number_of_qubits, tuple(qubits))
+        axes = self._gate_axes.get(key)
+        if axes is None:
+            # Row axis of each qubit, from the last qubit to the first as the
+            # input axes of the gate tensor.
+            axes = [self._number_of_qubits - 1 - qubit for qubit in reversed(qubits)]
+            self._gate_axes[key] = axes
+        # Contract the input axes of the gate with the row axes of its qubits,
+        # and move the output axes of the gate in their place.
+        product = np.tensordot(gate_tensor, self._unitary_state,
+                               axes=(list(range(number_of_gate_qubits,
+                                                2 * number_of_gate_qubits)), axes))
+        self._unitary_state = np.moveaxis(product, list(range(number_of_gate_qubits)), axes)
+
+    def run(self, qobj, validation=None):
         """Run qobj asynchronously.
 
         Args:
             qobj (dict): job description
+            validation (str): Qobj validation mode, see ``AerJob``.
 
         Returns:
             AerJob: derived from BaseJob
         """
         job_id = str(uuid.uuid4())
-        aer_job = AerJob(self, job_id, self._run_job, qobj)
+        aer_job = AerJob(self, job_id, self._run_job, qobj, validation)
         aer_job.submit()
         return aer_job
 
@@ -134,9 +177,18 @@ class UnitarySimulatorPy(BaseBackend):
         """
         self._validate(qobj)
         result_list = []
+        self._qobj_config = qobj.config
         start = time.time()
-        for experiment in qobj.experiments:
-            result_list.append(self.run_experiment(experiment))
+        if isinstance(qobj.experiments, list):
+            # Fail before simulating anything if an experiment is too large.
+            for experiment in qobj.experiments:
+                self._check_memory(experiment)
+            result_list = self._run_experiments(qobj.experiments)
+        else:
+            # Experiments read from a file, one at a time.
+            for experiment in qobj.experiments:
+                self._check_memory(experiment)
+                result_list.append(self.run_experiment(experiment))
         end = time.time()
         result = {'backend_name': self.name(),
                   'backend_version': self._configuration.backend_version,
@@ -148,7 +200,7 @@ class UnitarySimulatorPy(BaseBackend):
                   'time_taken': (end - start),
                   'header': qobj.header.as_dict()}
 
-        return Result.from_dict(result)
+        return Result.from_dict(result, validate=False)
 
     def run_experiment(self, experiment):
         """Run an experiment (circuit) and return a single experiment result.
@@ -174,47 +226,118 @@ class UnitarySimulatorPy(BaseBackend):
                 "success": boolean
                 "time taken": simulation time of this single experiment
                 }
-
-        Raises:
-            SimulatorError: if the number of qubits in the circuit is greater than 24.
-            Note that the practical qubit limit is much lower than 24.
         """
         self._number_of_qubits = experiment.header.n_qubits
-        if self._number_of_qubits > 24:
-            raise SimulatorError("np.einsum implementation limits unitary_simulator_py" +
-                                 " to 24 qubit circuits.")
-        result = {
-            'data': {},
-            'name': experiment.header.name,
-            'header': experiment.header.as_dict()
-        }
+        unitary = self._apply_instructions(self._identity(experiment),
+                                           self._instructions(experiment))
+        return self._experiment_result(experiment, unitary)
 
-        # Initialize unitary as rank 2*N tensor
-        self._unitary_state = np.reshape(np.eye(2 ** self._number_of_qubits,
-                                                dtype=complex),
-                                         self._number_of_qubits * [2, 2])
+    def _run_experiments(self, experiments):
+        """Run experiments, computing the unitaries of their common prefixes once.
 
-        for operation in experiment.instructions:
+        The experiments are simulated in the order of their instructions, so
+        that the experiments starting with the same instructions follow each
+        other. The unitaries after the prefixes shared with the next
+        experiment are kept as checkpoints, from which the next experiments
+        start, as many as fit in the memory budget.
+
+        Args:
+            experiments (list[QobjExperiment]): the experiments.
+
+        Returns:
+            list[dict]: the result of each experiment, as ``run_experiment()``.
+        """
+        instructions = [self._instructions(experiment) for experiment in experiments]
+        keys = [self._experiment_key(experiment, experiment_instructions)
+                for experiment, experiment_instructions in zip(experiments, instructions)]
+        order = sorted(range(len(experiments)), key=lambda index: keys[index])
+
+        results = [None] * len(experiments)
+        # Pairs of prefix length and unitary, of increasing lengths, for
+        # prefixes of the previous experiment.
+        checkpoints = []
+        shared = 0
+        for position, index in enumerate(order):
+            experiment = experiments[index]
+            self._number_of_qubits = experiment.header.n_qubits
+            while checkpoints and checkpoints[-1][0] > shared:
+                checkpoints.pop()
+            if checkpoints:
+                length, unitary = checkpoints[-1]
+            else:
+                length, unitary = 0, self._identity(experiment)
+
+            shared = _common_prefix_length(keys[index], keys[order[position + 1]]) \
+                if position + 1 < len(order) else 0
+            if shared > length and len(checkpoints) < self._max_checkpoints(experiment):
+                unitary = self._apply_instructions(unitary, instructions[index][length:shared])
+                length = shared
+                checkpoints.append((length, unitary))
+            unitary = self._apply_instructions(unitary, instructions[index][length:])
+            results[index] = self._experiment_result(experiment, unitary)
+        return results
+
+    def _instructions(self, experiment):
+        """Return the instructions of an experiment, fused if asked in the
+        experiment or Qobj config."""
+        if experiment_option(experiment, self._qobj_config, 'fusion', False):
+            return fuse_gates(experiment.instructions)
+        return experiment.instructions
+
+    def _identity(self, experiment):
+        """Return the identity of the qubits of an experiment, as a rank 2N tensor."""
+        return np.reshape(np.eye(2 ** experiment.header.n_qubits,
+                                 dtype=simulation_dtype(experiment, self._qobj_config)),
+                          experiment.header.n_qubits * [2, 2])
+
+    def _apply_instructions(self, unitary, instructions):
+        """Apply instructions to a unitary.
+
+        Args:
+            unitary (ndarray): the unitary as a rank 2N tensor, which is not
+                modified, or None.
+            instructions (list[QobjInstruction]): the instructions.
+
+        Returns:
+            ndarray: the unitary after the instructions, or None if it was
+                None or an instruction is not supported.
+        """
+        if unitary is None:
+            return None
+        self._unitary_state = unitary
+        for operation in instructions:
             if operation.name in ('U', 'u1', 'u2', 'u3'):
                 params = getattr(operation, 'params', None)
                 qubit = operation.qubits[0]
-                gate = single_gate_matrix(operation.name, params)
+                gate = cached_single_gate_matrix(operation.name, params)
                 self._add_unitary_single(gate, qubit)
+            elif operation.name == 'fused':
+                self._add_unitary(operation.matrix, operation.qubits)
             elif operation.name in ('id', 'u0'):
                 pass
             elif operation.name in ('CX', 'cx'):
                 qubit0 = operation.qubits[0]
                 qubit1 = operation.qubits[1]
-                gate = np.array([[1, 0, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0],
-                                 [0, 1, 0, 0]])
-                self._add_unitary_two(gate, qubit0, qubit1)
+                self._add_unitary_two(_CX_MATRIX, qubit0, qubit1)
             elif operation.name == 'barrier':
                 pass
             else:
-                result['status'] = 'ERROR'
-                return result
+                return None
+        return self._unitary_state
+
+    def _experiment_result(self, experiment, unitary):
+        """Return the result dictionary of an experiment from its unitary,
+        which is None if the experiment could not be simulated."""
+        result = {
+            'data': {},
+            'name': experiment.header.name,
+            'header': experiment.header.as_dict()
+        }
+        if unitary is None:
+            result['status'] = 'ERROR'
+            return result
         # Reshape unitary rank-2n tensor back to a matrix
-        tmp = np.reshape(self._unitary_state, 2 * [2 ** self._number_of_qubits])
+        tmp = np.reshape(unitary, 2 * [2 ** experiment.header.n_qubits])
         # Convert complex numbers to pair of (real, imag)
         result['data']['unitary'] = np.stack((tmp.real, tmp.imag), axis=-1)
         result['status'] = 'DONE'
@@ -222,6 +345,44 @@ class UnitarySimulatorPy(BaseBackend):
         result['shots'] = 1
         return result
 
+    def _experiment_key(self, experiment, instructions):
+        """Return the key of an experiment whose prefixes are shared with the
+        experiments of the same size and precision.
+
+        Returns:
+            tuple: the number of qubits and dtype, and the tuple of the keys of
+                the instructions.
+        """
+        operations = []
+        for operation in instructions:
+            matrix = getattr(operation, 'matrix', None)
+            operations.append((operation.name, tuple(getattr(operation, 'qubits', ())),
+                               repr(getattr(operation, 'params', None)) if matrix is None
+                               else np.asarray(matrix).tobytes()))
+        return ((experiment.header.n_qubits,
+                 simulation_dtype(experiment, self._qobj_config).str),
+                tuple(operations))
+
+    def _max_checkpoints(self, experiment):
+        """Return the number of unitaries that can be kept as checkpoints
+        next to the simulation of an experiment (see ``_check_memory()``)."""
+        unitary = simulation_dtype(experiment, self._qobj_config).itemsize << \
+            (2 * experiment.header.n_qubits)
+        return memory_budget(experiment, self._qobj_config) // unitary - 3
+
+    def _check_memory(self, experiment):
+        """Check that the simulation of an experiment fits in its memory budget.
+
+        The estimate counts the unitary, the output of the products of the
+        gates, and the real and imaginary parts of the result.
+
+        Raises:
+            SimulatorError: if it does not, see ``check_memory()``.
+        """
+        unitary = simulation_dtype(experiment, self._qobj_config).itemsize << \
+            (2 * experiment.header.n_qubits)
+        check_memory(self.name(), experiment, self._qobj_config, 3 * unitary)
+
     def _validate(self, qobj):
         """Semantic validations of the qobj which cannot be done via schemas.
         Some of these may later move to backend schemas.
@@ -17,7 +17,18 @@ from .models import BackendStatus
 
 
 class BaseBackend(ABC):
-    """Base class for backends."""
+    """Base class for backends.
+
+    Attributes:
+        OPTIONAL_QOBJ_FIELDS (tuple[str]): optional Qobj fields the backend
+            needs to find in the Qobjs it runs: 'texparams' (LaTeX
+            representation of the parameters of the instructions) and
+            'compiled_circuit_qasm' (QASM in the experiment headers). By
+            default, ``compile`` produces them for the backends that list
+            them, and leaves them out of the Qobjs of the other backends.
+    """
+
+    OPTIONAL_QOBJ_FIELDS = ()
 
     @abstractmethod
     def __init__(self, configuration, provider=None):
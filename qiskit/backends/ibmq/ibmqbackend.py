@@ -27,6 +27,8 @@ class IBMQBackend(BaseBackend):
     """Backend class interfacing with the Quantum Experience remotely.
     """
 
+    OPTIONAL_QOBJ_FIELDS = ('texparams', 'compiled_circuit_qasm')
+
     def __init__(self, configuration, provider, credentials, api):
         """Initialize remote backend for IBM Quantum Experience.
 
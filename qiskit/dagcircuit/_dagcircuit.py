@@ -58,6 +58,12 @@ class DAGCircuit:
         # Running count of the total number of nodes
         self.node_counter = 0
 
+        # Running count of the modifications made to the circuit. It is
+        # increased every time a wire, a basis element or an operation node
+        # is added, removed or replaced, so that two equal values mean that
+        # the circuit has not been changed in between.
+        self.generation = 0
+
         # Map of named operations in this circuit and their signatures.
         # The signature is an integer tuple (nq,nc,np) specifying the
         # number of input qubits, input bits, and real parameters.
@@ -105,6 +111,7 @@ class DAGCircuit:
             raise DAGCircuitError("duplicate register name %s" % newname)
         if regname not in self.qregs and regname not in self.cregs:
             raise DAGCircuitError("no register named %s" % regname)
+        self.generation += 1
         if regname in self.qregs:
             reg = self.qregs[regname]
             reg.name = newname
@@ -177,6 +184,7 @@ class DAGCircuit:
             DAGCircuitError: if trying to add duplicate wire
         """
         if wire not in self.wires:
+            self.generation += 1
             self.wires.append(wire)
             self.node_counter += 1
             self.input_map[wire] = self.node_counter
@@ -210,6 +218,7 @@ class DAGCircuit:
         number of qubit arguments.
         """
         if name not in self.basis:
+            self.generation += 1
             self.basis[name] = (
                 number_qubits,
                 number_classical,
@@ -233,6 +242,7 @@ class DAGCircuit:
         "body"   = GateBody AST node
         """
         if name not in self.gates:
+            self.generation += 1
             self.gates[name] = gatedata
             if name in self.basis:
                 if self.basis[name][0] != self.gates[name]["n_bits"] or \
@@ -326,6 +336,7 @@ class DAGCircuit:
             condition (tuple or None): optional condition (ClassicalRegister, int)
         """
         # Add a new operation node to the graph
+        self.generation += 1
         self.node_counter += 1
         self.multi_graph.add_node(self.node_counter)
         # Update the operation itself. TODO: remove after qargs not connected to op
@@ -1031,6 +1042,7 @@ class DAGCircuit:
                         self._full_pred_succ_maps(pred_map, succ_map,
                                                   input_circuit, wire_map)
                     # Now that we know the connections, delete node
+                    self.generation += 1
                     self.multi_graph.remove_node(n)
                     # Iterate over nodes of input_circuit
                     for m in nx.topological_sort(input_circuit.multi_graph):
@@ -1133,6 +1145,7 @@ class DAGCircuit:
             self._full_pred_succ_maps(pred_map, succ_map,
                                       input_circuit, wire_map)
         # Now that we know the connections, delete node
+        self.generation += 1
         self.multi_graph.remove_node(node)
         # Iterate over nodes of input_circuit
         for m in nx.topological_sort(input_circuit.multi_graph):
@@ -1174,6 +1187,46 @@ class DAGCircuit:
 
                 self.multi_graph.remove_edge(p[0], self.output_map[w])
 
+    def substitute_operations_one(self, node, operations):
+        """Replace one node with a sequence of operations on its wires.
+
+        Unlike ``substitute_circuit_one``, the operations are given on the
+        wires of self, and only act on the (qu)bits of the node. They keep
+        the condition of the node, if any.
+
+        Args:
+            node (int): node of self.multi_graph (of type "op") to substitute
+            operations (list[tuple]): (op, qargs, cargs) triples, in the
+                order they are applied.
+
+        Raises:
+            DAGCircuitError: if the node is not an operation, or an operation
+                is not in the basis or acts on a (qu)bit outside of the node.
+        """
+        nd = self.multi_graph.node[node]
+        if nd["type"] != "op":
+            raise DAGCircuitError("expected node type \"op\", got %s"
+                                  % nd["type"])
+        pred_map, succ_map = self._make_pred_succ_maps(node)
+        for op, qargs, cargs in operations:
+            self._check_basis_data(op, qargs, cargs)
+            self._check_bits(qargs, pred_map)
+            self._check_bits(cargs, pred_map)
+
+        condition = nd["condition"]
+        condition_bits = self._bits_in_condition(condition)
+        self.generation += 1
+        self.multi_graph.remove_node(node)
+        for op, qargs, cargs in operations:
+            self._add_op_node(op, qargs, cargs, condition)
+            for q in itertools.chain(qargs, condition_bits, cargs):
+                self.multi_graph.add_edge(pred_map[q], self.node_counter,
+                                          name="%s[%s]" % (q[0].name, q[1]), wire=q)
+                pred_map[q] = self.node_counter
+        for q, predecessor in pred_map.items():
+            self.multi_graph.add_edge(predecessor, succ_map[q],
+                                      name="%s[%s]" % (q[0].name, q[1]), wire=q)
+
     def get_op_nodes(self, op=None):
         """Get the set of "op" node ids with the given op.
 
@@ -1225,6 +1278,7 @@ class DAGCircuit:
         Add edges from predecessors to successors.
         """
         pred_map, succ_map = self._make_pred_succ_maps(n)
+        self.generation += 1
         self.multi_graph.remove_node(n)
         for w in pred_map.keys():
             self.multi_graph.add_edge(pred_map[w], succ_map[w],
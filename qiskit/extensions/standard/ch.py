@@ -30,7 +30,6 @@ class CHGate(Gate):
     def __init__(self, ctl, tgt, circ=None):
         """Create new CH gate."""
         super().__init__("ch", [], [ctl, tgt], circ)
-        self._define_decompositions()
 
     def _define_decompositions(self):
         """
@@ -75,7 +74,6 @@ class CHGate(Gate):
 
     def inverse(self):
         """Invert this gate."""
-        self._define_decompositions()
         return self  # self-inverse
 
     def reapply(self, circ):
@@ -24,7 +24,6 @@ class Cu1Gate(Gate):
     def __init__(self, theta, ctl, tgt, circ=None):
         """Create new cu1 gate."""
         super().__init__("cu1", [theta], [ctl, tgt], circ)
-        self._define_decompositions()
 
     def _define_decompositions(self):
         """
@@ -53,7 +52,6 @@ class Cu1Gate(Gate):
     def inverse(self):
         """Invert this gate."""
         self.param[0] = -self.param[0]
-        self._define_decompositions()
         return self
 
     def reapply(self, circ):
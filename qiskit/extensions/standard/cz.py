@@ -26,7 +26,6 @@ class CzGate(Gate):
     def __init__(self, ctl, tgt, circ=None):
         """Create new CZ gate."""
         super().__init__("cz", [], [ctl, tgt], circ)
-        self._define_decompositions()
 
     def _define_decompositions(self):
         """
@@ -48,7 +47,6 @@ class CzGate(Gate):
 
     def inverse(self):
         """Invert this gate."""
-        self._define_decompositions()
         return self  # self-inverse
 
     def reapply(self, circ):
@@ -26,7 +26,6 @@ class HGate(Gate):
     def __init__(self, qubit, circ=None):
         """Create new Hadamard gate."""
         super().__init__("h", [], [qubit], circ)
-        self._define_decompositions()
 
     def _define_decompositions(self):
         """
@@ -45,7 +44,6 @@ class HGate(Gate):
 
     def inverse(self):
         """Invert this gate."""
-        self._define_decompositions()
         return self  # self-inverse
 
     def reapply(self, circ):
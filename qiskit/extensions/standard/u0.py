@@ -25,7 +25,6 @@ class U0Gate(Gate):
     def __init__(self, m, qubit, circ=None):
         """Create new u0 gate."""
         super().__init__("u0", [m], [qubit], circ)
-        self._define_decompositions()
 
     def _define_decompositions(self):
         decomposition = DAGCircuit()
@@ -41,7 +40,6 @@ class U0Gate(Gate):
 
     def inverse(self):
         """Invert this gate."""
-        self._define_decompositions()
         return self  # self-inverse
 
     def reapply(self, circ):
@@ -25,7 +25,6 @@ class U1Gate(Gate):
     def __init__(self, theta, qubit, circ=None):
         """Create new diagonal single-qubit gate."""
         super().__init__("u1", [theta], [qubit], circ)
-        self._define_decompositions()
 
     def _define_decompositions(self):
         decomposition = DAGCircuit()
@@ -42,7 +41,6 @@ class U1Gate(Gate):
     def inverse(self):
         """Invert this gate."""
         self.param[0] = -self.param[0]
-        self._define_decompositions()
         return self
 
     def reapply(self, circ):
@@ -26,7 +26,6 @@ class XGate(Gate):
     def __init__(self, qubit, circ=None):
         """Create new X gate."""
         super().__init__("x", [], [qubit], circ)
-        self._define_decompositions()
 
     def _define_decompositions(self):
         """
@@ -47,7 +46,6 @@ class XGate(Gate):
 
     def inverse(self):
         """Invert this gate."""
-        self._define_decompositions()
         return self  # self-inverse
 
     def reapply(self, circ):
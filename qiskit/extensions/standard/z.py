@@ -26,7 +26,6 @@ class ZGate(Gate):
     def __init__(self, qubit, circ=None):
         """Create new Z gate."""
         super().__init__("z", [], [qubit], circ)
-        self._define_decompositions()
 
     def _define_decompositions(self):
         decomposition = DAGCircuit()
@@ -42,7 +41,6 @@ class ZGate(Gate):
 
     def inverse(self):
         """Invert this gate."""
-        self._define_decompositions()
         return self  # self-inverse
 
     def reapply(self, circ):
@@ -165,8 +165,9 @@ def layer_permutation(layer_partition, layout, qubit_subset, coupling, trials,
     swap circuit has been applied. The trivial_flag is set if the layer
     has no multi-qubit gates.
     """
-    if seed is not None:
-        np.random.seed(seed)
+    # A generator of its own, so that concurrent calls with a seed do not
+    # share the global one.
+    rng = np.random.RandomState(seed) if seed is not None else np.random
     logger.debug("layer_permutation: ----- enter -----")
     logger.debug("layer_permutation: layer_partition = %s",
                  pprint.pformat(layer_partition))
@@ -225,7 +226,7 @@ def layer_permutation(layer_partition, layout, qubit_subset, coupling, trials,
             i = (QuantumRegister(coupling.size(), 'q'), i)
             for j in coupling.physical_qubits:
                 j = (QuantumRegister(coupling.size(), 'q'), j)
-                scale = 1 + np.random.normal(0, 1 / n)
+                scale = 1 + rng.normal(0, 1 / n)
                 xi[i][j] = scale * coupling.distance(i[1], j[1]) ** 2
                 xi[j][i] = xi[i][j]
 
@@ -838,6 +839,7 @@ def optimize_1q_gates(circuit):
         if right_name == "u3":
             new_op = U3Gate(*right_parameters, run_qarg)
 
+        unrolled.generation += 1
         nx.set_node_attributes(unrolled.multi_graph, name='name',
                                values={run[0]: right_name})
         nx.set_node_attributes(unrolled.multi_graph, name='op',
@@ -11,3 +11,4 @@ from ._qobj import (Qobj, QobjConfig, QobjExperiment, QobjInstruction,
                     QobjItem, QobjHeader, QobjExperimentHeader)
 from ._converter import qobj_to_dict
 from ._validation import validate_qobj_against_schema, QobjValidationError
+from ._stream import iterencode_qobj, dump_qobj, load_qobj
@@ -7,7 +7,7 @@
 
 """Models for Qobj and its related components."""
 
-from types import SimpleNamespace
+from collections.abc import Sequence
 
 import numpy
 import sympy
@@ -22,14 +22,30 @@ QOBJ_VERSION = '1.0.0'
 # * 0.0.1: Qiskit 0.5.x format (pre-schemas).
 
 
-class QobjItem(SimpleNamespace):
+# Types of the values that are used as they are in the dict of a QobjItem.
+_SCALAR_TYPES = frozenset([str, int, float, bool, type(None)])
+# Value of the attributes missing from the slots of a QobjItem.
+_MISSING = object()
+
+
+class QobjItem:
     """Generic Qobj structure.
 
     Single item of a Qobj structure, acting as a superclass of the rest of the
-    more specific elements.
+    more specific elements. As in ``types.SimpleNamespace``, the attributes of
+    an item are given as keyword arguments, and two items are equal if they
+    have the same attributes.
     """
     REQUIRED_ARGS = ()
 
+    def __init__(self, **kwargs):
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    def _attributes(self):
+        """Return the attributes of the item, as a dict."""
+        return self.__dict__
+
     def as_dict(self):
         """
         Return a dictionary representation of the QobjItem, recursively
@@ -37,8 +53,8 @@ class QobjItem(SimpleNamespace):
         Returns:
             dict: a dictionary.
         """
-        return {key: self._expand_item(value) for key, value
-                in self.__dict__.items() if not key.startswith('_')}
+        return {key: value if type(value) in _SCALAR_TYPES else self._expand_item(value)
+                for key, value in self._attributes().items() if not key.startswith('_')}
 
     @classmethod
     def _expand_item(cls, obj):
@@ -46,7 +62,11 @@ class QobjItem(SimpleNamespace):
         """
         Return a valid representation of `obj` depending on its type.
         """
+        if type(obj) in _SCALAR_TYPES:
+            return obj
         if isinstance(obj, (list, tuple)):
+            if _SCALAR_TYPES.issuperset(map(type, obj)):
+                return list(obj)
             return [cls._expand_item(item) for item in obj]
         if isinstance(obj, dict):
             return {key: cls._expand_item(value) for key, value in obj.items()}
@@ -64,6 +84,8 @@ class QobjItem(SimpleNamespace):
             return obj.tolist()
         if isinstance(obj, complex):
             return [obj.real, obj.imag]
+        if isinstance(obj, Sequence) and not isinstance(obj, str):
+            return [cls._expand_item(item) for item in obj]
         return obj
 
     @classmethod
@@ -84,7 +106,7 @@ class QobjItem(SimpleNamespace):
                 'The dict does not contain all required keys: missing "%s"' %
                 [key for key in cls.REQUIRED_ARGS if key not in obj.keys()])
 
-        return cls(**{key: cls._qobjectify_item(value)
+        return cls(**{key: value if type(value) in _SCALAR_TYPES else cls._qobjectify_item(value)
                       for key, value in obj.items()})
 
     @classmethod
@@ -92,24 +114,84 @@ class QobjItem(SimpleNamespace):
         """
         Return a valid value for a QobjItem from a object.
         """
+        if type(obj) in _SCALAR_TYPES:
+            return obj
         if isinstance(obj, dict):
             # TODO: should use the subclasses for finer control over the
             # required arguments.
             return QobjItem.from_dict(obj)
         elif isinstance(obj, list):
+            if _SCALAR_TYPES.issuperset(map(type, obj)):
+                return list(obj)
             return [cls._qobjectify_item(item) for item in obj]
         return obj
 
+    def __eq__(self, other):
+        if isinstance(other, QobjItem):
+            return self._attributes() == other._attributes()
+        return NotImplemented
+
+    def __repr__(self):
+        return '%s(%s)' % (type(self).__name__,
+                           ', '.join('%s=%r' % item
+                                     for item in sorted(self._attributes().items())))
+
     def __reduce__(self):
         """
         Customize the reduction in order to allow serialization, as the Qobjs
         are automatically serialized due to the use of futures.
         """
         init_args = tuple(getattr(self, key) for key in self.REQUIRED_ARGS)
-        extra_args = {key: value for key, value in self.__dict__.items()
+        extra_args = {key: value for key, value in self._attributes().items()
                       if key not in self.REQUIRED_ARGS}
         return self.__class__, init_args, extra_args
 
+    def __setstate__(self, state):
+        for key, value in state.items():
+            setattr(self, key, value)
+
+
+class _QobjSlotsItem(QobjItem):
+    """Qobj item keeping its most common attributes in ``__slots__``.
+
+    The attributes in the ``__slots__`` of the subclass are stored in the
+    instance, and the others in its ``__dict__``, which is only created when
+    one of them is set or when the attributes of the item are read, so that
+    the numerous items of a Qobj take little memory.
+    """
+    __slots__ = ()
+
+    def _attributes(self):
+        """Return the attributes of the item, as a dict."""
+        attributes = {}
+        for key in self.__slots__:
+            value = getattr(self, key, _MISSING)
+            if value is not _MISSING:
+                attributes[key] = value
+        attributes.update(self._extra_attributes())
+        return attributes
+
+    def _extra_attributes(self):
+        """Return the attributes of the item that are not in the slots."""
+        return self.__dict__
+
+    def as_dict(self):
+        """
+        Return a dictionary representation of the QobjItem, recursively
+        converting its public attributes.
+        Returns:
+            dict: a dictionary.
+        """
+        item = {}
+        for key in self.__slots__:
+            value = getattr(self, key, _MISSING)
+            if value is not _MISSING:
+                item[key] = value if type(value) in _SCALAR_TYPES else self._expand_item(value)
+        for key, value in self._extra_attributes().items():
+            if not key.startswith('_'):
+                item[key] = self._expand_item(value)
+        return item
+
 
 class Qobj(QobjItem):
     """Representation of a Qobj.
@@ -137,6 +219,25 @@ class Qobj(QobjItem):
 
         super().__init__(**kwargs)
 
+    @classmethod
+    def from_file(cls, path):
+        """Read a Qobj from a JSON file, leaving its experiments in the file.
+
+        The experiments are read from the file, one at a time, each time they
+        are iterated over, so that the memory used does not grow with their
+        number. See ``qiskit.qobj.dump_qobj`` for writing the file.
+
+        Args:
+            path (str): path of the JSON file of the Qobj.
+
+        Returns:
+            Qobj: the Qobj, with its experiments as a ``QobjExperimentsFile``
+                sequence.
+        """
+        # pylint: disable=cyclic-import
+        from ._stream import load_qobj_file
+        return load_qobj_file(path)
+
 
 class QobjConfig(QobjItem):
     """Configuration for a Qobj.
@@ -171,7 +272,7 @@ class QobjHeader(QobjItem):
     pass
 
 
-class QobjExperiment(QobjItem):
+class QobjExperiment(_QobjSlotsItem):
     """Quantum experiment represented inside a Qobj.
 
         instructions (list[QobjInstruction)): list of instructions.
@@ -181,6 +282,7 @@ class QobjExperiment(QobjItem):
         config (QobjItem): config settings for the Experiment.
     """
     REQUIRED_ARGS = ['instructions']
+    __slots__ = ('instructions', 'header', 'config')
 
     def __init__(self, instructions, **kwargs):
         self.instructions = instructions
@@ -197,14 +299,20 @@ class QobjExperimentHeader(QobjItem):
     pass
 
 
-class QobjInstruction(QobjItem):
+class QobjInstruction(_QobjSlotsItem):
     """Quantum Instruction.
 
     Attributes:
         name(str): name of the gate.
         qubits(list): list of qubits to apply to the gate.
+
+    Attributes defined in the schema but not required:
+        memory(list): list of memory slots the results are stored in.
+        params(list): list of parameters of the gate.
+        conditional(QobjItem): condition on the memory for applying the gate.
     """
     REQUIRED_ARGS = ['name']
+    __slots__ = ('name', 'qubits', 'memory', 'params', 'conditional')
 
     def __init__(self, name, **kwargs):
         self.name = name
@@ -0,0 +1,331 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""Streaming JSON serialization of Qobj.
+
+The Qobj is encoded and decoded one experiment, and one instruction, at a
+time, so that the JSON representation of the whole Qobj (or the dictionary it
+is built from) is never held in memory. The encoder writes the experiments
+after the other fields of the Qobj, which lets ``Qobj.from_file`` read the
+fields of the Qobj without going through the experiments.
+
+The file objects can be any text stream, including sockets wrapped with
+``socket.makefile()``.
+"""
+
+import json
+from collections.abc import Sequence
+
+from ._qobj import (Qobj, QobjConfig, QobjExperiment, QobjExperimentHeader,
+                    QobjHeader, QobjInstruction, QobjItem)
+from ._validation import QobjValidationError
+
+# Number of characters read from the file at a time, at least.
+READ_SIZE = 1 << 16
+
+# Classes the fields of the Qobj and of its experiments are decoded into.
+_QOBJ_FIELDS = {'config': QobjConfig, 'header': QobjHeader}
+_EXPERIMENT_FIELDS = {'config': QobjItem, 'header': QobjExperimentHeader}
+
+
+def iterencode_qobj(qobj):
+    """Encode a Qobj into JSON, one piece at a time.
+
+    Args:
+        qobj (Qobj): the Qobj to encode.
+
+    Yields:
+        str: successive pieces of the JSON representation of the Qobj.
+    """
+    yield '{'
+    for key, value in _public_fields(qobj, 'experiments'):
+        yield '%s: %s, ' % (json.dumps(key), json.dumps(QobjItem._expand_item(value)))
+    yield '"experiments": ['
+    for index, experiment in enumerate(qobj.experiments):
+        if index:
+            yield ', '
+        yield from _iterencode_experiment(experiment)
+    yield ']}'
+
+
+def dump_qobj(qobj, file_obj):
+    """Write the JSON representation of a Qobj to a file, one piece at a time.
+
+    Args:
+        qobj (Qobj): the Qobj to write.
+        file_obj (file): text stream to write to.
+    """
+    for chunk in iterencode_qobj(qobj):
+        file_obj.write(chunk)
+
+
+def load_qobj(file_obj):
+    """Read a Qobj from a file, one experiment and instruction at a time.
+
+    Args:
+        file_obj (file): text stream to read from.
+
+    Returns:
+        Qobj: the Qobj.
+
+    Raises:
+        QobjValidationError: if the file does not contain a Qobj.
+        json.JSONDecodeError: if the file does not contain valid JSON.
+    """
+    fields = {}
+    reader = _JsonReader(file_obj)
+    for key in reader.iter_object_keys():
+        if key == 'experiments':
+            fields[key] = list(_iter_experiments(reader))
+        else:
+            fields[key] = _decode_field(_QOBJ_FIELDS, key, reader.read_value())
+    return _build(Qobj, fields)
+
+
+def load_qobj_file(path):
+    """Return a Qobj whose experiments are read from a file when iterated.
+
+    Args:
+        path (str): path of the JSON file of the Qobj.
+
+    Returns:
+        Qobj: the Qobj, with its experiments as a ``QobjExperimentsFile``.
+
+    Raises:
+        QobjValidationError: if the file does not contain a Qobj.
+        json.JSONDecodeError: if the file does not contain valid JSON.
+    """
+    fields = {}
+    with open(path) as file_obj:
+        reader = _JsonReader(file_obj)
+        for key in reader.iter_object_keys():
+            if key != 'experiments':
+                fields[key] = _decode_field(_QOBJ_FIELDS, key, reader.read_value())
+                continue
+            fields[key] = QobjExperimentsFile(path)
+            if _ends_with_experiments(path):
+                break
+            # Go through the experiments for the fields written after them.
+            fields[key]._count = sum(1 for _ in reader.iter_array_values())
+    return _build(Qobj, fields)
+
+
+class QobjExperimentsFile(Sequence):
+    """Experiments of a Qobj, read from a JSON file each time they are iterated.
+
+    Only the experiment being iterated over is kept in memory. Accessing the
+    experiments by index also reads the file up to the experiment.
+    """
+
+    def __init__(self, path, count=None):
+        """
+        Args:
+            path (str): path of the JSON file of the Qobj.
+            count (int): number of experiments, if known.
+        """
+        self.path = path
+        self._count = count
+
+    def __iter__(self):
+        with open(self.path) as file_obj:
+            reader = _JsonReader(file_obj)
+            for key in reader.iter_object_keys():
+                if key == 'experiments':
+                    yield from _iter_experiments(reader)
+                    return
+                reader.read_value()
+        raise QobjValidationError('No experiments in %s' % self.path)
+
+    def __len__(self):
+        if self._count is None:
+            with open(self.path) as file_obj:
+                reader = _JsonReader(file_obj)
+                for key in reader.iter_object_keys():
+                    if key == 'experiments':
+                        self._count = sum(1 for _ in reader.iter_array_values())
+                        break
+                    reader.read_value()
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if index >= 0:
+            for i, experiment in enumerate(self):
+                if i == index:
+                    return experiment
+        raise IndexError('experiment index out of range')
+
+    def __eq__(self, other):
+        if isinstance(other, Sequence):
+            return len(self) == len(other) and all(
+                experiment == other_experiment
+                for experiment, other_experiment in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, self.path)
+
+
+def _public_fields(item, last_key):
+    """Return the public (key, value) fields of a Qobj item, except one."""
+    return [(key, value) for key, value in item._attributes().items()
+            if not key.startswith('_') and key != last_key]
+
+
+def _ends_with_experiments(path):
+    """Return whether the experiments are the last field of the Qobj in a file.
+
+    The experiments are the only array among the fields of a Qobj, so they
+    are the last one if the file ends with the end of an array.
+    """
+    with open(path, 'rb') as file_obj:
+        file_obj.seek(0, 2)
+        file_obj.seek(max(0, file_obj.tell() - 64))
+        tail = file_obj.read().rstrip()
+    return tail[:-1].rstrip().endswith(b']')
+
+
+def _iterencode_experiment(experiment):
+    """Encode an experiment into JSON, one instruction at a time."""
+    yield '{'
+    for key, value in _public_fields(experiment, 'instructions'):
+        yield '%s: %s, ' % (json.dumps(key), json.dumps(QobjItem._expand_item(value)))
+    yield '"instructions": ['
+    for index, instruction in enumerate(experiment.instructions):
+        if index:
+            yield ', '
+        yield json.dumps(QobjItem._expand_item(instruction))
+    yield ']}'
+
+
+def _iter_experiments(reader):
+    """Decode the experiments of an array, one instruction at a time."""
+    for _ in reader.iter_array_values(decode=False):
+        fields = {}
+        for key in reader.iter_object_keys():
+            if key == 'instructions':
+                fields[key] = [QobjInstruction.from_dict(instruction)
+                               for instruction in reader.iter_array_values()]
+            else:
+                fields[key] = _decode_field(_EXPERIMENT_FIELDS, key, reader.read_value())
+        yield _build(QobjExperiment, fields)
+
+
+def _decode_field(classes, key, value):
+    """Return the value of a field of a Qobj item."""
+    if key in classes and isinstance(value, dict):
+        return classes[key].from_dict(value)
+    return QobjItem._qobjectify_item(value)
+
+
+def _build(cls, fields):
+    """Build a Qobj item from its decoded fields, checking the required ones."""
+    missing = [key for key in cls.REQUIRED_ARGS if key not in fields]
+    if missing:
+        raise QobjValidationError(
+            'The dict does not contain all required keys: missing "%s"' % missing)
+    return cls(**fields)
+
+
+class _JsonReader:
+    """Pull reader of the JSON values in a text stream.
+
+    The stream is read in blocks, keeping only the value being decoded in
+    the buffer. Values are decoded with ``json.JSONDecoder.raw_decode``,
+    after making sure they are complete: a value ending at the end of the
+    buffer (such as a number) might continue in the next block.
+    """
+
+    _WHITESPACE = ' \t\n\r'
+
+    def __init__(self, file_obj):
+        self._file_obj = file_obj
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _read(self, size=READ_SIZE):
+        """Append at least ``size`` characters of the stream to the buffer."""
+        chunk = self._file_obj.read(max(size, READ_SIZE))
+        if not chunk:
+            self._eof = True
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+
+    def _peek(self):
+        """Return the next non-whitespace character, or '' at the end of the stream."""
+        while True:
+            while self._pos < len(self._buffer) and \
+                    self._buffer[self._pos] in self._WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer) or self._eof:
+                return self._buffer[self._pos:self._pos + 1]
+            self._read()
+
+    def _expect(self, characters):
+        """Consume the next non-whitespace character, which must be one of ``characters``."""
+        character = self._peek()
+        if not character or character not in characters:
+            raise QobjValidationError('Expected one of %r in the JSON stream, got %r' %
+                                      (characters, character))
+        self._pos += 1
+        return character
+
+    def read_value(self):
+        """Decode the next JSON value."""
+        self._peek()
+        size = READ_SIZE
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            # Read blocks of growing size, so that long values are decoded
+            # a logarithmic number of times.
+            self._read(size)
+            size *= 2
+
+    def iter_object_keys(self):
+        """Iterate over the keys of the next JSON object.
+
+        The value of each key must be consumed before getting the next key.
+        """
+        self._expect('{')
+        if self._peek() == '}':
+            self._pos += 1
+            return
+        while True:
+            key = self.read_value()
+            if not isinstance(key, str):
+                raise QobjValidationError('Expected a key in the JSON stream, got %r' % key)
+            self._expect(':')
+            yield key
+            if self._expect(',}') == '}':
+                return
+
+    def iter_array_values(self, decode=True):
+        """Iterate over the values of the next JSON array.
+
+        Args:
+            decode (bool): decode the values, or let the caller consume them.
+        """
+        self._expect('[')
+        if self._peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield self.read_value() if decode else None
+            if self._expect(',]') == ']':
+                return
@@ -5,22 +5,181 @@
 # This source code is licensed under the Apache License, Version 2.0 found in
 # the LICENSE.txt file in the root directory of this source tree.
 
-"""QObj validation module for validation against JSON schemas."""
+"""QObj validation module for validation against JSON schemas.
 
+Qobjs are validated in one of the following modes:
+
+* ``'full'``: the dict of the Qobj is validated against the Qobj schema.
+* ``'fast'``: the Qobj is checked for the fields read by the simulators,
+  without building its dict. Each instruction is checked for the number of
+  qubits, memory slots and parameters of its gate, as in the schema, and for
+  non-negative qubit and memory slot indices and conditionals with a mask and
+  a value, which the schema leaves unchecked.
+* ``'off'``: the Qobj is not validated.
+
+The default mode is ``'full'``, and can be set with the
+``QISKIT_QOBJ_VALIDATION`` environment variable.
+"""
+
+import os
 
 from qiskit import _schema_validation
 from qiskit import _qiskiterror
 
+VALIDATION_MODES = ('full', 'fast', 'off')
+
+_ERROR_MESSAGE = 'Qobj failed validation. Set Qiskit log level to DEBUG ' \
+                 'for further information.'
+
+# Number of qubits, memory slots and parameters of the instructions, as in
+# the Qobj schema (None for any number).
+_INSTRUCTION_SIZES = {}
+_INSTRUCTION_SIZES.update(dict.fromkeys(['u3', 'U'], (1, 0, 3)))
+_INSTRUCTION_SIZES.update(dict.fromkeys(
+    ['reset', 'id', 'h', 's', 'sdg', 't', 'tdg', 'x', 'y', 'z'], (1, 0, 0)))
+_INSTRUCTION_SIZES.update(dict.fromkeys(['u1', 'u0', 'rx', 'ry', 'rz'], (1, 0, 1)))
+_INSTRUCTION_SIZES.update(dict.fromkeys(['u2'], (1, 0, 2)))
+_INSTRUCTION_SIZES.update(dict.fromkeys(['cx', 'CX', 'cy', 'cz', 'ch', 'swap'], (2, 0, 0)))
+_INSTRUCTION_SIZES.update(dict.fromkeys(['cu1', 'crz', 'rzz'], (2, 0, 1)))
+_INSTRUCTION_SIZES.update(dict.fromkeys(['cu3'], (2, 0, 3)))
+_INSTRUCTION_SIZES.update(dict.fromkeys(['ccx', 'cswap'], (3, 0, 0)))
+_INSTRUCTION_SIZES.update(dict.fromkeys(['barrier'], (None, 0, 0)))
+
 
 class QobjValidationError(_qiskiterror.QiskitError):
     """Represents an error during Qobj validation."""
     pass
 
 
-def validate_qobj_against_schema(qobj):
-    """Validates a QObj against a schema."""
-    _schema_validation.validate_json_against_schema(
-        qobj.as_dict(), 'qobj',
-        err_msg='Qobj failed validation. '
-                'Set Qiskit log level to DEBUG '
-                'for further information.')
+def validate_qobj_against_schema(qobj, mode=None):
+    """Validates a QObj against a schema.
+
+    Args:
+        qobj (Qobj): the Qobj to validate.
+        mode (str): ``'full'``, ``'fast'`` or ``'off'``. Defaults to the
+            value of the ``QISKIT_QOBJ_VALIDATION`` environment variable, or
+            ``'full'``.
+
+    Raises:
+        SchemaValidationError: if the Qobj does not validate.
+        QiskitError: if the mode is not one of the validation modes.
+    """
+    mode = mode or os.getenv('QISKIT_QOBJ_VALIDATION', 'full')
+    if mode == 'full':
+        _schema_validation.validate_json_against_schema(
+            qobj.as_dict(), 'qobj', err_msg=_ERROR_MESSAGE)
+    elif mode == 'fast':
+        _validate_qobj_structure(qobj)
+    elif mode != 'off':
+        raise _qiskiterror.QiskitError(
+            'Unknown Qobj validation mode "%s": expected one of %s' %
+            (mode, ', '.join(VALIDATION_MODES)))
+
+
+def _validate_qobj_structure(qobj):
+    """Check the fields of a Qobj read by the simulators.
+
+    Args:
+        qobj (Qobj): the Qobj to validate.
+
+    Raises:
+        SchemaValidationError: if a field is missing or invalid.
+    """
+    _check(isinstance(getattr(qobj, 'qobj_id', None), str), 'qobj_id', 'must be a string')
+    _check(isinstance(getattr(qobj, 'schema_version', None), str), 'schema_version',
+           'must be a string')
+    _check(getattr(qobj, 'type', None) in ('QASM', 'PULSE'), 'type',
+           'must be "QASM" or "PULSE"')
+    _check(hasattr(qobj, 'header'), 'header', 'is required')
+    config = getattr(qobj, 'config', None)
+    _check(config is not None, 'config', 'is required')
+    shots = getattr(config, 'shots', None)
+    _check(_is_integer(shots) and shots >= 1, 'config.shots',
+           'must be a positive integer')
+    _check_config_sizes(config, 'config')
+
+    experiments = getattr(qobj, 'experiments', None)
+    _check(experiments is not None and len(experiments) >= 1, 'experiments',
+           'must be a non-empty list')
+    if qobj.type != 'QASM':
+        return
+    for index, experiment in enumerate(experiments):
+        path = 'experiments[%d]' % index
+        if hasattr(experiment, 'config'):
+            _check_config_sizes(experiment.config, path + '.config')
+        instructions = getattr(experiment, 'instructions', None)
+        _check(isinstance(instructions, list) and instructions,
+               path + '.instructions', 'must be a non-empty list')
+        for instruction_index, instruction in enumerate(instructions):
+            _check_instruction(instruction,
+                               '%s.instructions[%d]' % (path, instruction_index))
+
+
+def _check_config_sizes(config, path):
+    """Check the number of qubits and memory slots of a configuration."""
+    n_qubits = getattr(config, 'n_qubits', 1)
+    _check(_is_integer(n_qubits) and n_qubits >= 1, path + '.n_qubits',
+           'must be a positive integer')
+    memory_slots = getattr(config, 'memory_slots', 0)
+    _check(_is_integer(memory_slots) and memory_slots >= 0, path + '.memory_slots',
+           'must be a non-negative integer')
+
+
+def _check_instruction(instruction, path):
+    """Check the fields of a QASM instruction."""
+    name = getattr(instruction, 'name', None)
+    _check(isinstance(name, str), path + '.name', 'must be a string')
+    qubits = getattr(instruction, 'qubits', ())
+    _check(_are_indices(qubits), path + '.qubits', 'must be a list of qubit indices')
+    memory = getattr(instruction, 'memory', ())
+    _check(_are_indices(memory), path + '.memory', 'must be a list of memory slot indices')
+    params = getattr(instruction, 'params', ())
+    _check(isinstance(params, (list, tuple)), path + '.params', 'must be a list')
+    _check_instruction_sizes(instruction, name, qubits, memory, params, path)
+    _check_conditional(getattr(instruction, 'conditional', None), path)
+
+
+def _check_instruction_sizes(instruction, name, qubits, memory, params, path):
+    """Check the number of qubits, memory slots and parameters of an instruction."""
+    sizes = _INSTRUCTION_SIZES.get(name)
+    if sizes is not None:
+        n_qubits, n_memory, n_params = sizes
+        _check(len(qubits) == n_qubits if n_qubits is not None else qubits,
+               path + '.qubits', 'has the wrong number of qubits for "%s"' % name)
+        _check(len(memory) == n_memory,
+               path + '.memory', 'has the wrong number of memory slots for "%s"' % name)
+        _check(len(params) == n_params,
+               path + '.params', 'has the wrong number of parameters for "%s"' % name)
+    elif name == 'measure':
+        _check(qubits and memory,
+               path + '.name', '"measure" requires qubits and memory slots')
+    elif name == 'snapshot':
+        _check(isinstance(getattr(instruction, 'label', None), str) and
+               isinstance(getattr(instruction, 'type', None), str),
+               path + '.name', '"snapshot" requires a label and a type')
+
+
+def _check_conditional(conditional, path):
+    """Check the conditional of an instruction, if any."""
+    if conditional is not None and not _is_integer(conditional):
+        _check(isinstance(getattr(conditional, 'mask', None), str) and
+               isinstance(getattr(conditional, 'val', None), str),
+               path + '.conditional', 'requires a mask and a value')
+
+
+def _is_integer(value):
+    """Return whether a value is an integer, as in JSON schemas."""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _are_indices(values):
+    """Return whether a value is a list of non-negative integers."""
+    return isinstance(values, (list, tuple)) and \
+        all(_is_integer(value) and value >= 0 for value in values)
+
+
+def _check(condition, path, message):
+    """Raise a SchemaValidationError about a field if a condition is false."""
+    if not condition:
+        raise _schema_validation.SchemaValidationError(
+            'Qobj failed validation: "%s" %s' % (path, message))
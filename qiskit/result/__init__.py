@@ -9,3 +9,4 @@
 
 from .result import Result
 from ._resulterror import ResultError
+from ._counts import IntegerCounts
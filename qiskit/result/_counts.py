@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""Counts of measurement outcomes, as integers.
+
+The outcomes are kept as a sparse pair of NumPy arrays (the distinct
+outcomes, as integers whose bit ``i`` is memory slot ``i``, and their
+counts), on which marginalisation, register splitting and bit reordering
+are vectorized. The dicts with hexadecimal or bitstring keys are only
+built when asked for.
+"""
+
+import numpy as np
+
+from qiskit import QiskitError
+
+# Registers of up to this number of bits are counted with dense bincounts.
+DENSE_MAX_BITS = 20
+
+
+class IntegerCounts:
+    """Counts of the measurement outcomes of an experiment, as integers.
+
+    Attributes:
+        outcomes (ndarray): the distinct outcomes, in increasing order.
+        counts (ndarray): the number of times each outcome was measured.
+        num_bits (int): the number of memory slots of the outcomes.
+    """
+
+    def __init__(self, outcomes, counts, num_bits):
+        """
+        Args:
+            outcomes (ndarray): the distinct outcomes, in increasing order.
+            counts (ndarray): the number of times each outcome was measured.
+            num_bits (int): the number of memory slots of the outcomes.
+        """
+        self.outcomes = outcomes
+        self.counts = counts
+        self.num_bits = num_bits
+
+    @classmethod
+    def from_memory(cls, memory, num_bits):
+        """Count the outcomes of each shot.
+
+        Args:
+            memory (iterable[int]): the outcome of each shot, as an integer.
+            num_bits (int): the number of memory slots of the outcomes.
+
+        Returns:
+            IntegerCounts: the counts of the outcomes.
+        """
+        dtype = _dtype(num_bits)
+        if dtype is object:
+            memory = np.array(list(memory), dtype=object)
+        else:
+            memory = np.fromiter(memory, dtype=dtype)
+        return cls(*_aggregate(memory, None, num_bits), num_bits)
+
+    @classmethod
+    def from_dict(cls, counts, num_bits=None):
+        """Build the counts from a dict with hexadecimal or bitstring keys.
+
+        Args:
+            counts (dict): the counts, with hexadecimal keys (``'0x5'``) or
+                bitstring keys (``'101'``), optionally with the bits of the
+                registers separated by spaces (``'1 01'``).
+            num_bits (int): the number of memory slots of the outcomes.
+                Defaults to the length of the bitstring keys, or to the
+                length of the largest hexadecimal key.
+
+        Returns:
+            IntegerCounts: the counts of the outcomes.
+        """
+        outcomes = []
+        for key in counts:
+            if key.startswith('0x'):
+                outcomes.append(int(key, 16))
+            else:
+                key = key.replace(' ', '')
+                outcomes.append(int(key, 2))
+                if num_bits is None:
+                    num_bits = len(key)
+        if num_bits is None:
+            num_bits = max(max(outcomes, default=0).bit_length(), 1)
+        outcomes = np.array(outcomes, dtype=_dtype(num_bits))
+        values = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+        order = np.argsort(outcomes, kind='stable')
+        return cls(outcomes[order], values[order], num_bits)
+
+    @property
+    def shots(self):
+        """Total number of shots."""
+        return int(self.counts.sum())
+
+    def dense(self):
+        """Return the counts of every outcome, zero or not, as an array.
+
+        Returns:
+            ndarray: array of size ``2**num_bits``, whose entry ``i`` is the
+                count of outcome ``i``.
+
+        Raises:
+            QiskitError: if the outcomes have more than ``DENSE_MAX_BITS`` bits.
+        """
+        if self.num_bits > DENSE_MAX_BITS:
+            raise QiskitError('Too many bits (%d) for dense counts' % self.num_bits)
+        dense = np.zeros(1 << self.num_bits, dtype=np.int64)
+        dense[self.outcomes.astype(np.int64)] = self.counts
+        return dense
+
+    def marginal(self, bits):
+        """Return the counts of the outcomes of some of the bits.
+
+        Args:
+            bits (list[int]): the memory slots to keep. Bit ``k`` of the new
+                outcomes is bit ``bits[k]`` of the outcomes.
+
+        Returns:
+            IntegerCounts: the counts of the outcomes of the bits.
+
+        Raises:
+            QiskitError: if a bit is out of range.
+        """
+        if any(bit < 0 or bit >= self.num_bits for bit in bits):
+            raise QiskitError('Bits %s out of range for %d memory slots' %
+                              (bits, self.num_bits))
+        num_bits = len(bits)
+        outcomes = np.zeros(len(self.outcomes), dtype=_dtype(num_bits))
+        for new_bit, bit in enumerate(bits):
+            outcomes |= ((self.outcomes >> bit) & 1).astype(outcomes.dtype) << new_bit
+        return IntegerCounts(*_aggregate(outcomes, self.counts, num_bits), num_bits)
+
+    def reorder(self, order):
+        """Return the counts with the bits of the outcomes permuted.
+
+        Args:
+            order (list[int]): permutation of the memory slots. Bit ``k`` of
+                the new outcomes is bit ``order[k]`` of the outcomes.
+
+        Returns:
+            IntegerCounts: the counts of the permuted outcomes.
+
+        Raises:
+            QiskitError: if the order is not a permutation of the bits.
+        """
+        if sorted(order) != list(range(self.num_bits)):
+            raise QiskitError('%s is not a permutation of %d bits' % (order, self.num_bits))
+        return self.marginal(order)
+
+    def split(self, register_sizes):
+        """Return the counts of the outcomes of each register.
+
+        Args:
+            register_sizes (list[int]): the sizes of the registers, from the
+                register of the least significant bits.
+
+        Returns:
+            list[IntegerCounts]: the counts of each register.
+
+        Raises:
+            QiskitError: if the sizes do not add up to the number of bits.
+        """
+        if sum(register_sizes) != self.num_bits:
+            raise QiskitError('Register sizes %s do not add up to %d bits' %
+                              (register_sizes, self.num_bits))
+        registers = []
+        start = 0
+        for size in register_sizes:
+            registers.append(self.marginal(list(range(start, start + size))))
+            start += size
+        return registers
+
+    def hex_dict(self):
+        """Return the counts as a dict with hexadecimal keys (``'0x5'``)."""
+        return dict(zip(map(hex, self.outcomes.tolist()), self.counts.tolist()))
+
+    def bitstring_dict(self, register_sizes=None):
+        """Return the counts as a dict with bitstring keys (``'101'``).
+
+        Args:
+            register_sizes (list[int]): the sizes of the registers, from the
+                register of the least significant bits. If given, the bits of
+                the registers are separated by spaces (``'1 01'``).
+
+        Returns:
+            dict: the counts with bitstring keys.
+        """
+        key_format = '{:0%db}' % self.num_bits
+        keys = [key_format.format(outcome) for outcome in self.outcomes.tolist()]
+        if register_sizes and len(register_sizes) > 1:
+            ends = np.cumsum(register_sizes[::-1])[:-1].tolist()
+            keys = [' '.join(key[start:end] for start, end in
+                             zip([0] + ends, ends + [self.num_bits]))
+                    for key in keys]
+        return dict(zip(keys, self.counts.tolist()))
+
+    def __eq__(self, other):
+        if isinstance(other, IntegerCounts):
+            return self.num_bits == other.num_bits and \
+                np.array_equal(self.outcomes, other.outcomes) and \
+                np.array_equal(self.counts, other.counts)
+        return NotImplemented
+
+    def __repr__(self):
+        return '%s(%r, num_bits=%d)' % (type(self).__name__, self.hex_dict(), self.num_bits)
+
+
+def _dtype(num_bits):
+    """Return the dtype of outcomes of a number of bits."""
+    return np.int64 if num_bits < 63 else object
+
+
+def _aggregate(outcomes, counts, num_bits):
+    """Sum the counts of equal outcomes.
+
+    Args:
+        outcomes (ndarray): the outcomes, possibly repeated.
+        counts (ndarray): the count of each outcome, or None for ones.
+        num_bits (int): the number of bits of the outcomes.
+
+    Returns:
+        tuple(ndarray, ndarray): the distinct outcomes, in increasing order,
+            and their counts.
+    """
+    if num_bits <= DENSE_MAX_BITS and len(outcomes) > 0:
+        dense = np.bincount(outcomes, weights=counts, minlength=1 << num_bits)
+        distinct = np.flatnonzero(dense)
+        return distinct.astype(outcomes.dtype), dense[distinct].astype(np.int64)
+    distinct, inverse = np.unique(outcomes, return_inverse=True)
+    return distinct, np.bincount(inverse, weights=counts,
+                                 minlength=len(distinct)).astype(np.int64)
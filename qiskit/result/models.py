@@ -10,9 +10,10 @@
 from marshmallow.fields import Boolean, DateTime, Integer, List, Nested, Raw, String
 from marshmallow.validate import Length, OneOf, Regexp, Range
 
-from qiskit.validation.base import BaseModel, BaseSchema, ObjSchema, bind_schema
+from qiskit.validation.base import BaseModel, BaseSchema, Obj, ObjSchema, bind_schema
 from qiskit.validation.fields import Complex, ByType
 from qiskit.validation.validate import PatternProperties
+from ._counts import IntegerCounts
 
 
 class ExperimentResultDataSchema(BaseSchema):
@@ -73,8 +74,76 @@ class ExperimentResultData(BaseModel):
     Please note that this class only describes the required fields. For the
     full description of the model, please check
     ``ExperimentResultDataSchema``.
+
+    The counts can be given as ``IntegerCounts`` (see
+    ``from_integer_counts()``), in which case the ``counts`` field, with
+    hexadecimal keys, is only built when accessed.
     """
-    pass
+
+    # Counts of the outcomes as integers, if given as such.
+    __slots__ = ('_integer_counts',)
+
+    @classmethod
+    def from_integer_counts(cls, integer_counts, fields=None, validate=True):
+        """Create the data of an experiment from counts of integer outcomes.
+
+        Args:
+            integer_counts (IntegerCounts): the counts of the outcomes.
+            fields (dict): the other fields of the data, as for ``from_dict()``.
+            validate (bool): validate the other fields.
+
+        Returns:
+            ExperimentResultData: the data, whose ``counts`` field is built
+                on first access.
+        """
+        data = cls.from_dict(fields or {}, validate=validate)
+        data._integer_counts = integer_counts
+        return data
+
+    def integer_counts(self, num_bits=None):
+        """Return the counts of the outcomes as integers.
+
+        Args:
+            num_bits (int): the number of memory slots, if the counts are not
+                given as integers. Defaults to the length of the largest
+                outcome.
+
+        Returns:
+            IntegerCounts: the counts of the outcomes.
+
+        Raises:
+            AttributeError: if there are no counts.
+        """
+        integer_counts = getattr(self, '_integer_counts', None)
+        if integer_counts is None:
+            integer_counts = IntegerCounts.from_dict(self.counts.to_dict(), num_bits)
+        return integer_counts
+
+    def __getattr__(self, name):
+        if name == 'counts' and getattr(self, '_integer_counts', None) is not None:
+            # Cached as a field of the model, on first access.
+            # pylint: disable=attribute-defined-outside-init
+            self.counts = Obj(**self._integer_counts.hex_dict())
+            return self.counts
+        raise AttributeError("'{}' object has no attribute '{}'".format(
+            type(self).__name__, name))
+
+    def __contains__(self, item):
+        return super().__contains__(item) or (
+            item == 'counts' and getattr(self, '_integer_counts', None) is not None)
+
+    def __eq__(self, other):
+        if isinstance(other, ExperimentResultData):
+            # Compare the counts with hexadecimal keys.
+            for data in (self, other):
+                if 'counts' in data:
+                    _ = data.counts
+        return super().__eq__(other)
+
+    def __reduce__(self):
+        """Keep the counts of integer outcomes in the serialization."""
+        return _experiment_result_data, (self.__class__, self.__dict__,
+                                         getattr(self, '_integer_counts', None))
 
 
 @bind_schema(ExperimentResultSchema)
@@ -96,3 +165,18 @@ class ExperimentResult(BaseModel):
         self.data = data
 
         super().__init__(**kwargs)
+
+
+def _experiment_result_data(cls, kwargs, integer_counts):
+    """Helper for ExperimentResultData.__reduce__.
+
+    The data was validated when it was built, so it is rebuilt with the
+    constructor undecorated by ``bind_schema``, as by ``from_dict()`` with
+    ``validate=False``.
+    """
+    init_method = getattr(cls.__init__, '__wrapped__', cls.__init__)
+    data = cls.__new__(cls)
+    init_method(data, **kwargs)
+    if integer_counts is not None:
+        data._integer_counts = integer_counts
+    return data
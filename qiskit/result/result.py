@@ -32,6 +32,10 @@ class Result(BaseModel):
             experiments of the input qobj
     """
 
+    # Index of the experiments by name, built on the first lookup by name and
+    # kept out of the fields of the model.
+    __slots__ = ('_experiment_indices',)
+
     def __init__(self, backend_name, backend_version, qobj_id, job_id, success,
                  results, **kwargs):
         self.backend_name = backend_name
@@ -40,9 +44,19 @@ class Result(BaseModel):
         self.job_id = job_id
         self.success = success
         self.results = results
+        self._experiment_indices = (None, 0, None)
 
         super().__init__(**kwargs)
 
+    def __setstate__(self, state):
+        """Restore the fields of the model, with an index of the experiments
+        to be rebuilt."""
+        if isinstance(state, tuple):
+            # (__dict__, slots) of the default reduction of slotted objects.
+            state = state[0]
+        self.__dict__.update(state or {})
+        self._experiment_indices = (None, 0, None)
+
     def data(self, circuit=None):
         """Get the raw data for an experiment.
 
@@ -113,6 +127,26 @@ class Result(BaseModel):
         except KeyError:
             raise QiskitError('No counts for circuit "{0}"'.format(circuit))
 
+    def get_integer_counts(self, circuit=None):
+        """Get the counts of an experiment, with the outcomes as integers.
+
+        Args:
+            circuit (str or QuantumCircuit or int or None): the index of the
+                experiment, as specified by ``get_data()``.
+
+        Returns:
+            IntegerCounts: the counts of the outcomes, whose bit ``i`` is
+                memory slot ``i``.
+
+        Raises:
+            QiskitError: if there are no counts for the experiment.
+        """
+        experiment = self._get_experiment(circuit)
+        if 'counts' not in experiment.data:
+            raise QiskitError('No counts for circuit "{0}"'.format(circuit))
+        num_bits = getattr(getattr(experiment, 'header', None), 'memory_slots', None)
+        return experiment.data.integer_counts(num_bits)
+
     def get_statevector(self, circuit=None, decimals=8):
         """Get the final statevector of an experiment.
 
@@ -188,14 +222,38 @@ class Result(BaseModel):
         # Key is a QuantumCircuit or str: retrieve result by name.
         if isinstance(key, QuantumCircuit):
             key = key.name
-        try:
-            # Look into `result[x].header.name` for the names.
-            return next(result for result in self.results
-                        if getattr(getattr(result, 'header', None),
-                                   'name', '') == key)
-        except StopIteration:
+        index = self._experiment_index(key)
+        if index is None:
             raise QiskitError('Data for experiment "%s" could not be found.' %
                               key)
+        return self.results[index]
+
+    def _experiment_index(self, name):
+        """Return the index of the first experiment with a given name.
+
+        The index of the experiments by name is built on the first lookup,
+        and rebuilt when the list of results is replaced or changes length,
+        or when the experiment found under the name has been renamed.
+
+        Args:
+            name (str): the name of the experiment, in its header.
+
+        Returns:
+            int: the index of the experiment, or None if there is none.
+        """
+        results, length, indices = self._experiment_indices
+        if results is not self.results or length != len(self.results):
+            indices = None
+        else:
+            index = indices.get(name)
+            if index is None or _experiment_name(self.results[index]) == name:
+                return index
+
+        indices = {}
+        for index, result in enumerate(self.results):
+            indices.setdefault(_experiment_name(result), index)
+        self._experiment_indices = (self.results, len(self.results), indices)
+        return indices.get(name)
 
     # To be deprecated after 0.7
 
@@ -221,6 +279,7 @@ class Result(BaseModel):
             raise QiskitError('Can not combine a failed result with another result.')
 
         self.results.extend(other.results)
+        self._experiment_indices = (None, 0, None)
         return self
 
     def __add__(self, other):
@@ -312,3 +371,8 @@ class Result(BaseModel):
                       'version 0.7+. Instead inspect result.results directly',
                       DeprecationWarning)
         return list(self.results.keys())
+
+
+def _experiment_name(experiment_result):
+    """Return the name of an experiment result, in its header."""
+    return getattr(getattr(experiment_result, 'header', None), 'name', '')
@@ -15,6 +15,7 @@ scenarios and flows: for more advanced usage, it is encouraged to instead
 refer to the documentation of each component and use them separately.
 """
 
-from ._compiler import (compile, execute)
+from ._compiler import (compile, execute, compile_async, execute_async,
+                        compile_iter)
 from ._monitor import job_monitor
 from .qobj_to_circuits import qobj_to_circuits
@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""Assembly of circuits into Qobj experiments.
+
+The experiments are built in a single pass over the instructions, producing
+the same experiments as unrolling a ``DAGCircuit`` of the circuit with a
+``JsonBackend`` and converting the result with ``QobjExperiment.from_dict``,
+except for the parameters that are given as floats. The LaTeX parameters and
+the QASM of the circuit are only produced on request, either right away or,
+when requested explicitly, lazily (``LAZY``), the first time they are
+accessed. Lazy fields that have not been accessed yet are computed by
+``as_dict()``, pickling and comparisons, so that they are never left out of
+a serialized experiment.
+"""
+from copy import deepcopy
+
+import networkx as nx
+import sympy
+
+from qiskit._compositegate import CompositeGate
+from qiskit.qobj import QobjExperiment, QobjExperimentHeader, QobjInstruction, QobjItem
+
+# Fields added to the snapshot instructions, which the current extensions
+# cannot provide (see ``DagUnroller._process``).
+_SNAPSHOT_FIELDS = {'type': 'MISSING', 'label': 'MISSING'}
+
+# Value of the ``texparams`` and ``qasm`` options for producing the fields
+# on first access.
+LAZY = 'lazy'
+
+
+class _LazyFieldsMixin:
+    """Qobj item with fields computed the first time they are accessed.
+
+    The pending fields are kept in ``_lazy_fields``, as a dict from the name
+    of the field to a (function, argument) pair computing its value.
+    """
+
+    def _compute_lazy_fields(self):
+        """Compute the pending fields, and drop the objects computing them."""
+        lazy_fields = getattr(self, '_lazy_fields', None)
+        if lazy_fields is None:
+            return
+        for name in list(lazy_fields):
+            getattr(self, name)
+        del self._lazy_fields
+
+    def __getattr__(self, name):
+        if name != '_lazy_fields':
+            lazy_fields = getattr(self, '_lazy_fields', None)
+            if lazy_fields and name in lazy_fields:
+                function, argument = lazy_fields.pop(name)
+                value = function(argument)
+                setattr(self, name, value)
+                return value
+        # The Qobj items have no __getattr__: raise the usual AttributeError.
+        return super().__getattribute__(name)
+
+    def __deepcopy__(self, memo):
+        """Copy the pending fields without copying the objects computing them."""
+        copied = self.__class__.__new__(self.__class__)
+        memo[id(self)] = copied
+        for key, value in self._attributes().items():
+            if key == '_lazy_fields':
+                setattr(copied, key, dict(value))
+            else:
+                setattr(copied, key, deepcopy(value, memo))
+        return copied
+
+    def as_dict(self):
+        """Return the dict of the item, with its pending fields computed."""
+        self._compute_lazy_fields()
+        return super().as_dict()
+
+    def __reduce__(self):
+        """Serialize the item with its pending fields computed."""
+        self._compute_lazy_fields()
+        return super().__reduce__()
+
+    def __eq__(self, other):
+        self._compute_lazy_fields()
+        if isinstance(other, _LazyFieldsMixin):
+            other._compute_lazy_fields()
+        return super().__eq__(other)
+
+
+class _LazyQobjInstruction(_LazyFieldsMixin, QobjInstruction):
+    """Instruction whose ``texparams`` can be computed on first access."""
+
+
+class _LazyQobjExperimentHeader(_LazyFieldsMixin, QobjExperimentHeader):
+    """Experiment header whose ``compiled_circuit_qasm`` can be computed on first access."""
+
+
+def circuit_to_experiment(circuit, config=None, texparams=False, qasm=False):
+    """Assemble a circuit into a Qobj experiment.
+
+    Args:
+        circuit (QuantumCircuit): the circuit to assemble.
+        config (dict): dictionary of parameters (e.g. noise) used by runner
+        texparams (bool or str): add the LaTeX representation of the
+            parameters to the instructions, right away (True) or on first
+            access (``LAZY``).
+        qasm (bool or str): add the QASM of the circuit to the experiment
+            header, as ``compiled_circuit_qasm``, right away (True) or on
+            first access (``LAZY``).
+
+    Returns:
+        QobjExperiment: the experiment.
+    """
+    instructions = []
+    for instruction in circuit.data:
+        if isinstance(instruction, CompositeGate):
+            instructions.extend(instruction.instruction_list())
+        else:
+            instructions.append(instruction)
+    experiment = _assemble(circuit.name, circuit.qregs, circuit.cregs,
+                           ((op, op.qargs, op.cargs, op.control) for op in instructions),
+                           config, texparams, qasm, circuit)
+    return experiment
+
+
+def dag_to_experiment(dag, config=None, texparams=False, qasm=False):
+    """Assemble a dag into a Qobj experiment, with its operations in topological order.
+
+    Args:
+        dag (DAGCircuit): the dag to assemble.
+        config (dict): dictionary of parameters (e.g. noise) used by runner
+        texparams (bool or str): add the LaTeX representation of the
+            parameters to the instructions, right away (True) or on first
+            access (``LAZY``).
+        qasm (bool or str): add the QASM of the dag to the experiment
+            header, as ``compiled_circuit_qasm``, right away (True) or on
+            first access (``LAZY``).
+
+    Returns:
+        QobjExperiment: the experiment.
+    """
+    graph = dag.multi_graph
+    nodes = (graph.nodes[node] for node in nx.topological_sort(graph))
+    instructions = ((node['op'], node['qargs'], node['cargs'], node['condition'])
+                    for node in nodes if node['type'] == 'op')
+    experiment = _assemble(dag.name, dag.qregs.values(), dag.cregs.values(),
+                           instructions, config, texparams, qasm, dag)
+    return experiment
+
+
+def _assemble(name, qregs, cregs, instructions, config, texparams, qasm, circuit):
+    """Assemble a sequence of instructions into a Qobj experiment.
+
+    Args:
+        name (str): name of the experiment.
+        qregs (iterable[QuantumRegister]): quantum registers, in order.
+        cregs (iterable[ClassicalRegister]): classical registers, in order.
+        instructions (iterable): (op, qargs, cargs, condition) tuples.
+        config (dict): dictionary of parameters (e.g. noise) used by runner
+        texparams (bool or str): add the LaTeX representation of the
+            parameters, right away (True) or on first access (``LAZY``).
+        qasm (bool or str): add the QASM of the circuit, right away (True)
+            or on first access (``LAZY``).
+        circuit (QuantumCircuit or DAGCircuit): the circuit or dag providing the QASM.
+
+    Returns:
+        QobjExperiment: the experiment.
+    """
+    # Bits are indexed by register name, as the registers of the
+    # instructions may be copies of the registers of the circuit.
+    qubit_labels = [[qreg.name, j] for qreg in qregs for j in range(qreg.size)]
+    clbit_labels = [[creg.name, j] for creg in cregs for j in range(creg.size)]
+    qubit_indices = {tuple(label): i for i, label in enumerate(qubit_labels)}
+    clbit_indices = {tuple(label): i for i, label in enumerate(clbit_labels)}
+    # Mask of the memory slots of each register, for the conditionals.
+    masks = {}
+    for index, (creg_name, _) in enumerate(clbit_labels):
+        masks[creg_name] = masks.get(creg_name, 0) | (1 << index)
+
+    instruction_class = _LazyQobjInstruction if texparams == LAZY else QobjInstruction
+    qobj_instructions = []
+    for op, qargs, cargs, condition in instructions:
+        fields = {
+            'params': [_param_value(param) for param in op.param],
+            'qubits': [qubit_indices.get((qubit[0].name, qubit[1])) for qubit in qargs],
+            'memory': [clbit_indices.get((clbit[0].name, clbit[1])) for clbit in cargs]
+        }
+        if op.name == 'snapshot':
+            fields.update(_SNAPSHOT_FIELDS)
+            if texparams:
+                fields['texparams'] = []
+        elif texparams == LAZY:
+            if op.param:
+                fields['_lazy_fields'] = {'texparams': (_texparams, tuple(op.param))}
+            else:
+                fields['texparams'] = []
+        elif texparams:
+            fields['texparams'] = _texparams(op.param)
+        if condition is not None:
+            fields['conditional'] = QobjItem(type='equals',
+                                             mask='0x%X' % masks.get(condition[0].name, 0),
+                                             val='0x%X' % condition[1])
+        qobj_instructions.append(instruction_class(name=op.name, **fields))
+
+    header_fields = {}
+    if qasm == LAZY:
+        header_fields['_lazy_fields'] = {'compiled_circuit_qasm': (_qasm, circuit)}
+    elif qasm:
+        header_fields['compiled_circuit_qasm'] = circuit.qasm()
+    header_class = _LazyQobjExperimentHeader if qasm == LAZY else QobjExperimentHeader
+    header = header_class(
+        n_qubits=len(qubit_labels),
+        memory_slots=len(clbit_labels),
+        qubit_labels=qubit_labels,
+        clbit_labels=clbit_labels,
+        qreg_sizes=[[qreg.name, qreg.size] for qreg in qregs],
+        creg_sizes=[[creg.name, creg.size] for creg in cregs],
+        name=name,
+        **header_fields)
+
+    experiment_config = deepcopy(config or {})
+    experiment_config.update({'memory_slots': len(clbit_labels),
+                              'n_qubits': len(qubit_labels)})
+
+    return QobjExperiment(instructions=qobj_instructions, header=header,
+                          config=QobjItem(**experiment_config))
+
+
+def _qasm(circuit):
+    """Return the QASM of a circuit or dag."""
+    return circuit.qasm()
+
+
+def _texparams(params):
+    """Return the LaTeX representation of instruction parameters."""
+    return list(map(sympy.latex, params))
+
+
+def _param_value(param):
+    """Return the value of an instruction parameter, as a float if it is a number."""
+    if isinstance(param, sympy.Basic):
+        value = param.evalf()
+        if value.is_real and value.is_Number:
+            return float(value)
+        return value
+    return param
@@ -6,26 +6,45 @@
 # the LICENSE.txt file in the root directory of this source tree.
 
 """Helper module for simplified Qiskit usage."""
+from concurrent import futures
 from copy import deepcopy
+from itertools import islice
+import json
 import warnings
 import uuid
 import logging
 
 from qiskit import transpiler
 from qiskit.transpiler._passmanager import PassManager
-from qiskit.qobj import Qobj, QobjConfig, QobjExperiment, QobjItem, QobjHeader
-from qiskit.unroll import DagUnroller, JsonBackend
-from qiskit.dagcircuit import DAGCircuit
+from qiskit.transpiler._parallel import parallel_min_cost, _chunks
+from qiskit.transpiler._transpiler import transpile_async, _transpilation_cost
+from qiskit.qobj import Qobj, QobjConfig, QobjHeader
 from qiskit._quantumcircuit import QuantumCircuit
+from qiskit._qiskiterror import QiskitError
+from ._assembler import circuit_to_experiment
 
 logger = logging.getLogger(__name__)
 
+# Executor running the pipelines started by ``compile_async`` and
+# ``execute_async``. The transpilation stages of the pipelines run on the
+# executor of ``transpile_async``, so that a pipeline waiting for one of its
+# stages never holds the thread that stage needs.
+_executor = futures.ThreadPoolExecutor()
+
+# Maximum number of batches a pipeline splits the circuits into.
+PIPELINE_BATCHES = 8
+
+# Number of circuits ``compile_iter`` transpiles at a time when the chunks
+# are only limited in bytes.
+STREAM_BATCH_SIZE = 64
+
 
 # pylint: disable=redefined-builtin
 def compile(circuits, backend,
             config=None, basis_gates=None, coupling_map=None, initial_layout=None,
             shots=1024, max_credits=10, seed=None, qobj_id=None,
-            skip_transpiler=False, seed_mapper=None, pass_manager=None):
+            skip_transpiler=False, seed_mapper=None, pass_manager=None,
+            texparams=None, compiled_circuit_qasm=None):
     """Compile a list of circuits into a qobj.
 
     Args:
@@ -42,15 +61,21 @@ def compile(circuits, backend,
         qobj_id (int): identifier for the generated qobj
         pass_manager (PassManager): a pass manger for the transpiler pipeline
         skip_transpiler (bool): DEPRECATED skip transpiler and create qobj directly
+        texparams (bool or str): add the LaTeX representation of the
+            parameters to the instructions (True), leave it out (False), or
+            compute it on first access or serialization (``'lazy'``). If
+            None, it is added if the backend lists 'texparams' in its
+            ``OPTIONAL_QOBJ_FIELDS``, and left out otherwise.
+        compiled_circuit_qasm (bool or str): add the QASM of the circuits to
+            the experiment headers (True), leave it out (False), or compute
+            it on first access or serialization (``'lazy'``). If None, it is
+            added if the backend lists 'compiled_circuit_qasm' in its
+            ``OPTIONAL_QOBJ_FIELDS``, and left out otherwise.
 
     Returns:
         Qobj: the qobj to be run on the backends
     """
-    if skip_transpiler:  # empty pass manager which does nothing
-        pass_manager = PassManager()
-        warnings.warn('The skip_transpiler option has been deprecated. '
-                      'Please pass an empty PassManager() instance instead',
-                      DeprecationWarning)
+    pass_manager = _skip_transpiler(skip_transpiler, pass_manager)
 
     circuits = transpiler.transpile(circuits, backend, basis_gates, coupling_map, initial_layout,
                                     seed_mapper, pass_manager)
@@ -59,14 +84,121 @@ def compile(circuits, backend,
     qobj = circuits_to_qobj(circuits, backend_name=backend.name(),
                             config=config, shots=shots, max_credits=max_credits,
                             qobj_id=qobj_id, basis_gates=basis_gates,
-                            coupling_map=coupling_map, seed=seed)
+                            coupling_map=coupling_map, seed=seed,
+                            texparams=_optional_field(backend, 'texparams', texparams),
+                            compiled_circuit_qasm=_optional_field(
+                                backend, 'compiled_circuit_qasm', compiled_circuit_qasm))
 
     return qobj
 
 
+def compile_iter(circuits, backend,
+                 config=None, basis_gates=None, coupling_map=None, initial_layout=None,
+                 shots=1024, max_credits=10, seed=None, qobj_id=None,
+                 seed_mapper=None, pass_manager=None,
+                 max_experiments=None, max_bytes=None,
+                 texparams=None, compiled_circuit_qasm=None):
+    """Compile circuits into a sequence of qobjs holding a chunk of them each.
+
+    The circuits are consumed and transpiled lazily, a batch at a time, so
+    that the memory used does not grow with the number of circuits when they
+    are produced by a generator and the qobjs are run as they are yielded.
+
+    Args:
+        circuits (iterable[QuantumCircuit] or QuantumCircuit): circuits to compile
+        backend (BaseBackend): a backend to compile for
+        config (dict): dictionary of parameters (e.g. noise) used by runner
+        basis_gates (str): comma-separated basis gate set to compile to
+        coupling_map (list): coupling map (perhaps custom) to target in mapping
+        initial_layout (list): initial layout of qubits in mapping
+        shots (int): number of repetitions of each circuit, for sampling
+        max_credits (int): maximum credits to use
+        seed (int): random seed for simulators
+        qobj_id (int): identifier prefix for the generated qobjs, followed by
+            the index of the chunk
+        seed_mapper (int): random seed for swapper mapper
+        pass_manager (PassManager): a pass manger for the transpiler pipeline
+        max_experiments (int): maximum number of experiments in a qobj
+        max_bytes (int): maximum size of the JSON serialization of the
+            experiments of a qobj. A qobj holds at least one experiment, even
+            if it is larger.
+        texparams (bool or str): see ``compile``.
+        compiled_circuit_qasm (bool or str): see ``compile``. Unlike
+            ``compile``, the fields requested with ``'lazy'`` are computed
+            right away, as computing them on first access would keep the
+            circuits alive as long as the qobjs.
+
+    Returns:
+        iterator[Qobj]: the qobjs to be run on the backends, in the order of
+            the circuits
+
+    Raises:
+        QiskitError: if neither max_experiments nor max_bytes is set, or if
+            one of them is not positive.
+    """
+    if max_experiments is None and max_bytes is None:
+        raise QiskitError('compile_iter needs a max_experiments or a max_bytes.')
+    for name, value in (('max_experiments', max_experiments), ('max_bytes', max_bytes)):
+        if value is not None and value <= 0:
+            raise QiskitError('compile_iter needs a positive {}, not {}.'.format(name, value))
+    return _compile_iter(circuits, backend, config, basis_gates, coupling_map, initial_layout,
+                         shots, max_credits, seed, qobj_id, seed_mapper, pass_manager,
+                         max_experiments, max_bytes, texparams, compiled_circuit_qasm)
+
+
+def _compile_iter(circuits, backend, config, basis_gates, coupling_map, initial_layout,
+                  shots, max_credits, seed, qobj_id, seed_mapper, pass_manager,
+                  max_experiments, max_bytes, texparams, compiled_circuit_qasm):
+    """Generator of the qobjs of ``compile_iter``, whose arguments are checked.
+
+    Yields:
+        Qobj: the qobjs to be run on the backends, in the order of the circuits
+    """
+    if isinstance(circuits, QuantumCircuit):
+        circuits = [circuits]
+    circuits = iter(circuits)
+    batch_size = max_experiments or STREAM_BATCH_SIZE
+    texparams = bool(_optional_field(backend, 'texparams', texparams))
+    compiled_circuit_qasm = bool(_optional_field(backend, 'compiled_circuit_qasm',
+                                                 compiled_circuit_qasm))
+
+    def _new_qobj(index):
+        chunk_id = None if qobj_id is None else '{}-{}'.format(qobj_id, index)
+        return _empty_qobj(backend.name(), config, shots, max_credits, chunk_id, seed)
+
+    index = 0
+    qobj = _new_qobj(index)
+    qobj_bytes = 0
+    while True:
+        batch = list(islice(circuits, batch_size))
+        if not batch:
+            break
+        batch = transpiler.transpile(batch, backend, basis_gates, coupling_map,
+                                     initial_layout, seed_mapper, pass_manager)
+        for circuit in batch:
+            experiment = _circuit_to_experiment(circuit, config, basis_gates, coupling_map,
+                                                texparams, compiled_circuit_qasm)
+            experiment_bytes = len(json.dumps(experiment.as_dict())) if max_bytes else 0
+            full = max_experiments and len(qobj.experiments) >= max_experiments
+            too_large = max_bytes and qobj_bytes + experiment_bytes > max_bytes
+            if qobj.experiments and (full or too_large):
+                _update_qobj_config(qobj)
+                yield qobj
+                index += 1
+                qobj = _new_qobj(index)
+                qobj_bytes = 0
+            qobj.experiments.append(experiment)
+            qobj_bytes += experiment_bytes
+        del batch
+
+    if qobj.experiments:
+        _update_qobj_config(qobj)
+        yield qobj
+
+
 def circuits_to_qobj(circuits, backend_name, config=None, shots=1024,
                      max_credits=10, qobj_id=None, basis_gates=None, coupling_map=None,
-                     seed=None):
+                     seed=None, texparams=None, compiled_circuit_qasm=None):
     """Convert a list of circuits into a qobj.
 
     Args:
@@ -79,6 +211,12 @@ def circuits_to_qobj(circuits, backend_name, config=None, shots=1024,
         basis_gates (list[str])): basis gates for the experiment
         coupling_map (list): coupling map (perhaps custom) to target in mapping
         seed (int): random seed for simulators
+        texparams (bool or str): add the LaTeX representation of the
+            parameters to the instructions (True), leave it out (False or
+            None), or compute it on first access (``'lazy'``).
+        compiled_circuit_qasm (bool or str): add the QASM of the circuits to
+            the experiment headers (True), leave it out (False or None), or
+            compute it on first access (``'lazy'``).
 
     Returns:
         Qobj: the Qobj to be run on the backends
@@ -87,6 +225,38 @@ def circuits_to_qobj(circuits, backend_name, config=None, shots=1024,
     # `basis_gates`, `coupling_map`
 
     # Step 1: create the Qobj, with empty experiments.
+    qobj = _empty_qobj(backend_name, config, shots, max_credits, qobj_id, seed)
+
+    if isinstance(circuits, QuantumCircuit):
+        circuits = [circuits]
+
+    for circuit in circuits:
+        qobj.experiments.append(_circuit_to_experiment(circuit,
+                                                       config,
+                                                       basis_gates,
+                                                       coupling_map,
+                                                       texparams,
+                                                       compiled_circuit_qasm))
+
+    _update_qobj_config(qobj)
+    return qobj
+
+
+def _empty_qobj(backend_name, config=None, shots=1024, max_credits=10,
+                qobj_id=None, seed=None):
+    """Create a Qobj without experiments.
+
+    Args:
+        backend_name (str): name of runner backend
+        config (dict): dictionary of parameters (e.g. noise) used by runner
+        shots (int): number of repetitions of each circuit, for sampling
+        max_credits (int): maximum credits to use
+        qobj_id (int): identifier for the generated qobj
+        seed (int): random seed for simulators
+
+    Returns:
+        Qobj: the Qobj, to be filled with experiments.
+    """
     # Copy the configuration: the values in `config` have preference
     qobj_config = deepcopy(config or {})
     qobj_config.update({'shots': shots,
@@ -99,28 +269,25 @@ def circuits_to_qobj(circuits, backend_name, config=None, shots=1024,
                 header=QobjHeader(backend_name=backend_name))
     if seed:
         qobj.config.seed = seed
+    return qobj
 
-    if isinstance(circuits, QuantumCircuit):
-        circuits = [circuits]
 
-    for circuit in circuits:
-        qobj.experiments.append(_circuit_to_experiment(circuit,
-                                                       config,
-                                                       basis_gates,
-                                                       coupling_map))
+def _update_qobj_config(qobj):
+    """Update the global `memory_slots` and `n_qubits` values of a Qobj from
+    its experiments.
 
-    # Update the global `memory_slots` and `n_qubits` values.
+    Args:
+        qobj (Qobj): the Qobj, with all its experiments.
+    """
     qobj.config.memory_slots = max(experiment.config.memory_slots for
                                    experiment in qobj.experiments)
 
     qobj.config.n_qubits = max(experiment.config.n_qubits for
                                experiment in qobj.experiments)
 
-    return qobj
-
 
 def _circuit_to_experiment(circuit, config=None, basis_gates=None,
-                           coupling_map=None):
+                           coupling_map=None, texparams=True, compiled_circuit_qasm=True):
     """Helper function for dags to qobj in parallel (if available).
 
     Args:
@@ -128,6 +295,11 @@ def _circuit_to_experiment(circuit, config=None, basis_gates=None,
         config (dict): dictionary of parameters (e.g. noise) used by runner
         basis_gates (list[str])): basis gates for the experiment
         coupling_map (list): coupling map (perhaps custom) to target in mapping
+        texparams (bool or str): add the LaTeX representation of the parameters
+            (True), leave it out (False or None) or compute it on first access
+            (``'lazy'``)
+        compiled_circuit_qasm (bool or str): add the QASM of the circuit (True),
+            leave it out (False or None) or compute it on first access (``'lazy'``)
 
     Returns:
         Qobj: Qobj to be run on the backends
@@ -135,30 +307,32 @@ def _circuit_to_experiment(circuit, config=None, basis_gates=None,
     # pylint: disable=unused-argument
     #  TODO: if arguments are really unused, consider changing the signature
 
-    dag = DAGCircuit.fromQuantumCircuit(circuit)
-    json_circuit = DagUnroller(dag, JsonBackend(dag.basis)).execute()
-    # Step 3a: create the Experiment based on json_circuit
-    experiment = QobjExperiment.from_dict(json_circuit)
-    # Step 3b: populate the Experiment configuration and header
-    experiment.header.name = circuit.name
-    experiment_config = deepcopy(config or {})
-    experiment_config.update({
-        'memory_slots': sum([creg.size for creg in dag.cregs.values()]),
-        'n_qubits': sum([qreg.size for qreg in dag.qregs.values()])
-        })
-    experiment.config = QobjItem(**experiment_config)
-
-    # set eval_symbols=True to evaluate each symbolic expression
-    # TODO: after transition to qobj, we can drop this
-    experiment.header.compiled_circuit_qasm = circuit.qasm()
-    # Step 3c: add the Experiment to the Qobj
-    return experiment
+    # TODO: after transition to qobj, we can drop texparams and qasm
+    return circuit_to_experiment(circuit, config, texparams=texparams,
+                                 qasm=compiled_circuit_qasm)
+
+
+def _optional_field(backend, field, value):
+    """Tell how to produce an optional field of the qobj for a backend.
+
+    Args:
+        backend (BaseBackend): the backend the qobj is compiled for
+        field (str): name of the field
+        value (bool or str): value of the option of ``compile`` for the field
+
+    Returns:
+        bool or str: True if the field is to be produced, False if it is to
+            be left out, ``'lazy'`` if it is to be computed on first access.
+    """
+    if value is None:
+        return field in getattr(backend, 'OPTIONAL_QOBJ_FIELDS', ())
+    return value
 
 
 def execute(circuits, backend, config=None, basis_gates=None, coupling_map=None,
             initial_layout=None, shots=1024, max_credits=10, seed=None,
             qobj_id=None, skip_transpiler=False, seed_mapper=None, pass_manager=None,
-            **kwargs):
+            texparams=None, compiled_circuit_qasm=None, **kwargs):
     """Executes a set of circuits.
 
     Args:
@@ -175,21 +349,127 @@ def execute(circuits, backend, config=None, basis_gates=None, coupling_map=None,
         qobj_id (int): identifier for the generated qobj
         pass_manager (PassManager): a pass manger for the transpiler pipeline
         skip_transpiler (bool): DEPRECATED skip transpiler and create qobj directly
+        texparams (bool or str): see ``compile``
+        compiled_circuit_qasm (bool or str): see ``compile``
         kwargs: extra arguments used by AER for running configurable backends.
                 Refer to the backend documentation for details on these arguments
 
     Returns:
         BaseJob: returns job instance derived from BaseJob
     """
-    if skip_transpiler:  # empty pass manager which does nothing
-        pass_manager = PassManager()
-        warnings.warn('The skip_transpiler option has been deprecated. '
-                      'Please pass an empty PassManager() instance instead',
-                      DeprecationWarning)
+    pass_manager = _skip_transpiler(skip_transpiler, pass_manager)
 
     qobj = compile(circuits, backend,
                    config, basis_gates, coupling_map, initial_layout,
                    shots, max_credits, seed, qobj_id,
-                   skip_transpiler, seed_mapper, pass_manager)
+                   False, seed_mapper, pass_manager,
+                   texparams, compiled_circuit_qasm)
 
     return backend.run(qobj, **kwargs)
+
+
+def compile_async(circuits, backend,
+                  config=None, basis_gates=None, coupling_map=None, initial_layout=None,
+                  shots=1024, max_credits=10, seed=None, qobj_id=None,
+                  skip_transpiler=False, seed_mapper=None, pass_manager=None,
+                  texparams=None, compiled_circuit_qasm=None):
+    """Compile a list of circuits into a qobj in the background.
+
+    The circuits are transpiled in batches, and the experiments of a batch
+    are assembled into the qobj while the next batch is being transpiled.
+    The arguments are the same as for ``compile``. The returned future can
+    be awaited from asyncio code via ``asyncio.wrap_future``.
+
+    Returns:
+        concurrent.futures.Future: future of the Qobj to be run on the backends
+    """
+    pass_manager = _skip_transpiler(skip_transpiler, pass_manager)
+    return _executor.submit(_compile_pipeline, circuits, backend,
+                            config, basis_gates, coupling_map, initial_layout,
+                            shots, max_credits, seed, qobj_id,
+                            seed_mapper, pass_manager,
+                            texparams, compiled_circuit_qasm)
+
+
+def execute_async(circuits, backend, config=None, basis_gates=None, coupling_map=None,
+                  initial_layout=None, shots=1024, max_credits=10, seed=None,
+                  qobj_id=None, skip_transpiler=False, seed_mapper=None, pass_manager=None,
+                  texparams=None, compiled_circuit_qasm=None, **kwargs):
+    """Executes a set of circuits in the background.
+
+    The circuits are compiled as by ``compile_async``, and the qobj is
+    submitted to the backend as soon as it is assembled. The arguments are
+    the same as for ``execute``. The returned future can be awaited from
+    asyncio code via ``asyncio.wrap_future``.
+
+    Returns:
+        concurrent.futures.Future: future of the job instance derived from BaseJob
+    """
+    pass_manager = _skip_transpiler(skip_transpiler, pass_manager)
+
+    def _execute():
+        qobj = _compile_pipeline(circuits, backend,
+                                 config, basis_gates, coupling_map, initial_layout,
+                                 shots, max_credits, seed, qobj_id,
+                                 seed_mapper, pass_manager,
+                                 texparams, compiled_circuit_qasm)
+        return backend.run(qobj, **kwargs)
+
+    return _executor.submit(_execute)
+
+
+def _skip_transpiler(skip_transpiler, pass_manager):
+    """Return the pass manager to use for the deprecated ``skip_transpiler``
+    option, warning if it is set."""
+    if skip_transpiler:  # empty pass manager which does nothing
+        warnings.warn('The skip_transpiler option has been deprecated. '
+                      'Please pass an empty PassManager() instance instead',
+                      DeprecationWarning)
+        return PassManager()
+    return pass_manager
+
+
+def _compile_pipeline(circuits, backend, config=None, basis_gates=None,
+                      coupling_map=None, initial_layout=None, shots=1024,
+                      max_credits=10, seed=None, qobj_id=None, seed_mapper=None,
+                      pass_manager=None, texparams=None, compiled_circuit_qasm=None):
+    """Compile circuits into a qobj, overlapping transpilation and assembly.
+
+    The circuits are split into contiguous batches of similar transpilation
+    cost. While a batch is transpiled by ``transpile_async``, the experiments
+    of the previous one are assembled, so that the order of the experiments
+    is the order of the circuits.
+
+    Returns:
+        Qobj: the qobj to be run on the backends
+    """
+    if isinstance(circuits, QuantumCircuit):
+        circuits = [circuits]
+
+    # Batches are kept expensive enough to be worth transpiling in parallel.
+    mapping_coupling = coupling_map or getattr(backend.configuration(), 'coupling_map', None)
+    costs = [_transpilation_cost(circuit, mapping_coupling) for circuit in circuits]
+    num_batches = min(PIPELINE_BATCHES, int(sum(costs) // parallel_min_cost()))
+    batches = _chunks(len(circuits), max(num_batches, 1), costs)
+
+    texparams = _optional_field(backend, 'texparams', texparams)
+    compiled_circuit_qasm = _optional_field(backend, 'compiled_circuit_qasm',
+                                            compiled_circuit_qasm)
+
+    qobj = _empty_qobj(backend.name(), config, shots, max_credits, qobj_id, seed)
+    transpiled = []
+    for batch in batches:
+        pending = transpile_async([circuits[i] for i in batch], backend, basis_gates,
+                                  coupling_map, initial_layout, seed_mapper, pass_manager)
+        for circuit in transpiled:
+            qobj.experiments.append(_circuit_to_experiment(
+                circuit, config, basis_gates, coupling_map,
+                texparams, compiled_circuit_qasm))
+        transpiled = pending.result()
+    for circuit in transpiled:
+        qobj.experiments.append(_circuit_to_experiment(
+            circuit, config, basis_gates, coupling_map,
+            texparams, compiled_circuit_qasm))
+
+    _update_qobj_config(qobj)
+    return qobj
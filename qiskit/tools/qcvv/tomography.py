@@ -43,14 +43,13 @@ Workflow:
 """
 
 import logging
-from functools import reduce
 from itertools import product
-from re import match
 
 import numpy as np
 
 from qiskit import QuantumCircuit
 from qiskit import QiskitError
+from qiskit.result import IntegerCounts
 from qiskit.tools.qi.qi import vectorize, devectorize, outer
 
 logger = logging.getLogger(__name__)
@@ -643,32 +642,15 @@ def marginal_counts(counts, meas_qubits):
             `marginal_counts(counts, [0])` returns `{'0': 15, '1': 0}`.
             `marginal_counts(counts, [0])` returns `{'0': 10, '1': 5}`.
     """
-    # pylint: disable=cell-var-from-loop
-    # Extract total number of qubits from count keys
-    num_of_qubits = len(list(counts.keys())[0])
-
-    # keys for measured qubits only
-    qs = sorted(meas_qubits, reverse=True)
-
+    # keys for measured qubits only, the highest qubit leftmost
+    qs = sorted(meas_qubits)
     meas_keys = count_keys(len(qs))
 
-    # get regex match strings for summing outcomes of other qubits
-    rgx = [
-        reduce(lambda x, y: (key[qs.index(y)] if y in qs else '\\d') + x,
-               range(num_of_qubits), '') for key in meas_keys
-    ]
-
-    # build the return list
-    meas_counts = []
-    for m in rgx:
-        c = 0
-        for key, val in counts.items():
-            if match(m, key):
-                c += val
-        meas_counts.append(c)
+    # sum the outcomes of the other qubits, with the outcomes as integers
+    meas_counts = IntegerCounts.from_dict(counts).marginal(qs).bitstring_dict()
 
     # return as counts dict on measured qubits only
-    return dict(zip(meas_keys, meas_counts))
+    return {key: meas_counts.get(key, 0) for key in meas_keys}
 
 
 def count_keys(n):
@@ -12,7 +12,7 @@ from ._propertyset import PropertySet
 from ._transpilererror import TranspilerError, TranspilerAccessError
 from ._fencedobjs import FencedDAGCircuit, FencedPropertySet
 from ._basepasses import AnalysisPass, TransformationPass
-from ._transpiler import transpile, transpile_dag
+from ._transpiler import transpile, transpile_async, transpile_dag
 from ._parallel import parallel_map
 
 # Set parallel environmental variable
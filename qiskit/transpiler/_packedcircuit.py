@@ -0,0 +1,334 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Compact, flat representation of a circuit for transferring it between processes.
+
+Pickling a ``QuantumCircuit`` also pickles the sympy parameters, the
+decomposition DAGs of every gate and the back-references of the instructions
+to their circuit. A ``PackedCircuit`` holds instead the instructions as NumPy
+arrays of operation codes, qubit and clbit indices and float parameters, and
+rebuilds the instructions on the receiving side.
+"""
+import random
+import string
+
+import networkx as nx
+import numpy as np
+import sympy
+
+from qiskit._compositegate import CompositeGate
+from qiskit._quantumcircuit import QuantumCircuit
+from qiskit.dagcircuit import DAGCircuit
+
+# Attributes that are rebuilt when unpacking an instruction. Instructions
+# carrying any other attribute cannot be packed.
+_INSTRUCTION_ATTRIBUTES = {'name', 'param', 'qargs', 'cargs', 'control', 'circuit',
+                           '_decomposition_rules', '_is_multi_qubit', '_qubit_coupling'}
+
+# Kinds of parameters stored in PackedCircuit.param_kinds.
+_PARAM_FLOAT = 0
+_PARAM_INTEGER = 1
+_PARAM_OBJECT = 2
+
+# Instructions on any number of qubits, whose constructors take the list of
+# their qubits.
+_QUBIT_LIST_INSTRUCTIONS = {'barrier', 'snapshot', 'save', 'load', 'noise'}
+
+# Same instructions and signatures added on demand by DAGCircuit.fromQuantumCircuit.
+_BUILTIN_BASIS = {
+    "U": ["U", 1, 0, 3],
+    "CX": ["CX", 2, 0, 0],
+    "measure": ["measure", 1, 1, 0],
+    "reset": ["reset", 1, 0, 0],
+    "barrier": ["barrier", -1, 0, 0],
+    "snapshot": ["snapshot", -1, 0, 1],
+    "save": ["save", -1, 0, 1],
+    "load": ["load", -1, 0, 1],
+    "noise": ["noise", -1, 0, 1]
+}
+
+
+class PackedCircuit:
+    """A circuit stored as flat arrays, cheap to pickle."""
+
+    def __init__(self, name, qregs, cregs):
+        """Create an empty packed circuit.
+
+        Args:
+            name (str or None): name of the circuit.
+            qregs (list[QuantumRegister]): quantum registers of the circuit.
+            cregs (list[ClassicalRegister]): classical registers of the circuit.
+        """
+        self.name = name
+        self.qregs = qregs
+        self.cregs = cregs
+        # Table of (instruction class, instruction name) pairs, indexed by op code.
+        self.op_table = []
+        # Op code of each instruction.
+        self.op_codes = None
+        # Qubits (and clbits) of instruction i are
+        # qubits[qubit_offsets[i]:qubit_offsets[i + 1]], as indices in the
+        # concatenation of the registers.
+        self.qubit_offsets = None
+        self.qubits = None
+        self.clbit_offsets = None
+        self.clbits = None
+        # Parameters of instruction i are
+        # param_values[param_offsets[i]:param_offsets[i + 1]]. Parameters
+        # that are not plain numbers are kept in param_objects, and their
+        # value is their index in that list.
+        self.param_offsets = None
+        self.param_values = None
+        self.param_kinds = None
+        self.param_objects = []
+        # Condition of each instruction, as a creg index (-1 if unconditioned)
+        # and a value.
+        self.condition_cregs = None
+        self.condition_values = None
+
+    def __len__(self):
+        return len(self.op_codes)
+
+    @staticmethod
+    def _pack(name, qregs, cregs, instructions):
+        """Pack a sequence of instructions.
+
+        Args:
+            name (str or None): name of the circuit.
+            qregs (list[QuantumRegister]): quantum registers of the circuit.
+            cregs (list[ClassicalRegister]): classical registers of the circuit.
+            instructions (iterable): (op, qargs, cargs, condition) tuples.
+
+        Returns:
+            PackedCircuit: the packed circuit, or None if an instruction cannot be packed.
+        """
+        packed = PackedCircuit(name, qregs, cregs)
+        qubit_indices = {bit: i for i, bit in
+                         enumerate((reg, j) for reg in qregs for j in range(reg.size))}
+        clbit_indices = {bit: i for i, bit in
+                         enumerate((reg, j) for reg in cregs for j in range(reg.size))}
+        creg_indices = {reg: i for i, reg in enumerate(cregs)}
+        op_codes = {}
+
+        codes = []
+        qubit_offsets = [0]
+        qubits = []
+        clbit_offsets = [0]
+        clbits = []
+        param_offsets = [0]
+        param_values = []
+        param_kinds = []
+        condition_cregs = []
+        condition_values = []
+        try:
+            for op, qargs, cargs, condition in instructions:
+                if not _is_packable(op):
+                    return None
+                key = (type(op), op.name)
+                if key not in op_codes:
+                    op_codes[key] = len(packed.op_table)
+                    packed.op_table.append(key)
+                codes.append(op_codes[key])
+                qubits.extend(qubit_indices[qarg] for qarg in qargs)
+                qubit_offsets.append(len(qubits))
+                clbits.extend(clbit_indices[carg] for carg in cargs)
+                clbit_offsets.append(len(clbits))
+                for param in op.param:
+                    if _is_double(param):
+                        param_values.append(float(param))
+                        param_kinds.append(_PARAM_FLOAT)
+                    elif isinstance(param, sympy.Integer) and abs(param) < 2 ** 53:
+                        param_values.append(int(param))
+                        param_kinds.append(_PARAM_INTEGER)
+                    else:
+                        param_values.append(len(packed.param_objects))
+                        param_kinds.append(_PARAM_OBJECT)
+                        packed.param_objects.append(param)
+                param_offsets.append(len(param_values))
+                if condition is None:
+                    condition_cregs.append(-1)
+                    condition_values.append(0)
+                else:
+                    condition_cregs.append(creg_indices[condition[0]])
+                    condition_values.append(condition[1])
+        except KeyError:
+            # A bit or a register that does not belong to the circuit.
+            return None
+
+        packed.op_codes = np.array(codes, dtype=np.int32)
+        packed.qubit_offsets = np.array(qubit_offsets, dtype=np.int64)
+        packed.qubits = np.array(qubits, dtype=np.int32)
+        packed.clbit_offsets = np.array(clbit_offsets, dtype=np.int64)
+        packed.clbits = np.array(clbits, dtype=np.int32)
+        packed.param_offsets = np.array(param_offsets, dtype=np.int64)
+        packed.param_values = np.array(param_values, dtype=np.float64)
+        packed.param_kinds = np.array(param_kinds, dtype=np.int8)
+        packed.condition_cregs = np.array(condition_cregs, dtype=np.int32)
+        packed.condition_values = np.array(condition_values, dtype=np.int64)
+        return packed
+
+    @staticmethod
+    def from_circuit(circuit):
+        """Pack a ``QuantumCircuit``.
+
+        Args:
+            circuit (QuantumCircuit): the circuit to pack.
+
+        Returns:
+            PackedCircuit: the packed circuit, or None if the circuit contains
+                instructions that cannot be packed (e.g. composite gates).
+        """
+        instructions = ((instruction, instruction.qargs, instruction.cargs, instruction.control)
+                        for instruction in circuit.data)
+        return PackedCircuit._pack(circuit.name, list(circuit.qregs), list(circuit.cregs),
+                                   instructions)
+
+    @staticmethod
+    def from_dag(dag):
+        """Pack a ``DAGCircuit``, with its operations in topological order.
+
+        Args:
+            dag (DAGCircuit): the dag to pack.
+
+        Returns:
+            PackedCircuit: the packed circuit, or None if the dag contains
+                operations that cannot be packed.
+        """
+        graph = dag.multi_graph
+        nodes = (graph.nodes[node] for node in nx.topological_sort(graph))
+        instructions = ((node['op'], node['qargs'], node['cargs'], node['condition'])
+                        for node in nodes if node['type'] == 'op')
+        return PackedCircuit._pack(dag.name, list(dag.qregs.values()),
+                                   list(dag.cregs.values()), instructions)
+
+    def _instructions(self, circuit=None):
+        """Rebuild the instructions of the packed circuit.
+
+        Args:
+            circuit (QuantumCircuit or None): circuit the instructions are attached to.
+
+        Yields:
+            tuple: (Instruction, condition) for each instruction.
+        """
+        all_qubits = [(reg, j) for reg in self.qregs for j in range(reg.size)]
+        all_clbits = [(reg, j) for reg in self.cregs for j in range(reg.size)]
+        qubits = self.qubits.tolist()
+        qubit_offsets = self.qubit_offsets.tolist()
+        clbits = self.clbits.tolist()
+        clbit_offsets = self.clbit_offsets.tolist()
+        param_values = self.param_values.tolist()
+        param_kinds = self.param_kinds.tolist()
+        param_offsets = self.param_offsets.tolist()
+        condition_cregs = self.condition_cregs.tolist()
+        condition_values = self.condition_values.tolist()
+
+        for i, code in enumerate(self.op_codes.tolist()):
+            op_class, name = self.op_table[code]
+            qargs = [all_qubits[q] for q in qubits[qubit_offsets[i]:qubit_offsets[i + 1]]]
+            cargs = [all_clbits[c] for c in clbits[clbit_offsets[i]:clbit_offsets[i + 1]]]
+            param = []
+            for j in range(param_offsets[i], param_offsets[i + 1]):
+                if param_kinds[j] == _PARAM_FLOAT:
+                    param.append(sympy.Number(param_values[j]))
+                elif param_kinds[j] == _PARAM_INTEGER:
+                    param.append(sympy.Integer(int(param_values[j])))
+                else:
+                    param.append(self.param_objects[int(param_values[j])])
+            if condition_cregs[i] < 0:
+                condition = None
+            else:
+                condition = (self.cregs[condition_cregs[i]], condition_values[i])
+            yield _build_instruction(op_class, name, param, qargs, cargs, circuit), condition
+
+    def to_circuit(self):
+        """Unpack into a ``QuantumCircuit``, as ``QuantumCircuit.fromDAGCircuit`` would build it.
+
+        Returns:
+            QuantumCircuit: the unpacked circuit.
+        """
+        circuit = QuantumCircuit()
+        random_name = QuantumCircuit.cls_prefix() + \
+            str(''.join(random.choice(string.ascii_lowercase) for i in range(8)))
+        circuit.name = self.name or random_name
+        for qreg in self.qregs:
+            circuit.add_register(qreg)
+        for creg in self.cregs:
+            circuit.add_register(creg)
+        for op, condition in self._instructions(circuit):
+            if condition:
+                op = op.c_if(*condition)
+            circuit._attach(op)
+        return circuit
+
+    def to_dag(self):
+        """Unpack into a ``DAGCircuit``, as ``DAGCircuit.fromQuantumCircuit`` would build it.
+
+        Returns:
+            DAGCircuit: the unpacked dag.
+        """
+        dagcircuit = DAGCircuit()
+        dagcircuit.name = self.name
+        for register in self.qregs:
+            dagcircuit.add_qreg(register)
+        for register in self.cregs:
+            dagcircuit.add_creg(register)
+        for name, data in QuantumCircuit.definitions.items():
+            dagcircuit.add_basis_element(name, data["n_bits"], 0, data["n_args"])
+            dagcircuit.add_gate_data(name, data)
+        for op, condition in self._instructions():
+            if op.name in _BUILTIN_BASIS:
+                dagcircuit.add_basis_element(*_BUILTIN_BASIS[op.name])
+            dagcircuit.apply_operation_back(op, op.qargs, op.cargs, condition)
+        return dagcircuit
+
+
+def _is_packable(op):
+    """Return True if the operation can be rebuilt from its class, name and arguments.
+
+    Only the instructions defined in qiskit (the standard gates, measure,
+    reset and the simulator instructions) are packed: their constructors take
+    the parameters, then the qubits and clbits, then the circuit (see
+    ``_build_instruction()``). Composite gates and the instructions of other
+    packages are not.
+    """
+    if isinstance(op, CompositeGate):
+        return False
+    if type(op).__module__.split('.')[0] != 'qiskit':
+        return False
+    if not _INSTRUCTION_ATTRIBUTES.issuperset(vars(op)):
+        return False
+    return not op._decomposition_rules or hasattr(op, '_define_decompositions')
+
+
+def _is_double(param):
+    """Return True if the parameter is a sympy Float that is unpacked unchanged
+    from its value as a Python float: same value, printed the same way (which
+    is not the case for Floats of a higher precision)."""
+    if not isinstance(param, sympy.Float):
+        return False
+    unpacked = sympy.Number(float(param))
+    return unpacked == param and str(unpacked) == str(param)
+
+
+def _build_instruction(op_class, name, param, qargs, cargs, circuit=None):
+    """Rebuild an instruction with its constructor.
+
+    Args:
+        op_class (type): class of the instruction, accepted by ``_is_packable()``.
+        name (str): name of the instruction.
+        param (list[sympy.Basic]): parameters of the instruction.
+        qargs (list[(QuantumRegister, int)]): qubits the instruction acts on.
+        cargs (list[(ClassicalRegister, int)]): clbits the instruction acts on.
+        circuit (QuantumCircuit or None): circuit the instruction is attached to.
+
+    Returns:
+        Instruction: the rebuilt instruction.
+    """
+    if name in _QUBIT_LIST_INSTRUCTIONS:
+        return op_class(*param, qargs, circuit)
+    return op_class(*param, *qargs, *cargs, circuit)
@@ -45,6 +45,7 @@ from the multiprocessing library.
 
 import os
 import platform
+import threading
 from multiprocessing import Pool
 from qiskit._qiskiterror import QiskitError
 from qiskit._util import local_hardware_info
@@ -53,9 +54,87 @@ from qiskit._pubsub import Publisher
 # Number of local physical cpus
 CPU_COUNT = local_hardware_info()['cpus']
 
+# Estimated cost of a batch of tasks under which it is not worth spawning a
+# process pool. The unit is the time taken to transpile a single gate without
+# routing (see ``transpiler._transpiler._transpilation_cost``). It can be
+# tuned for a given machine with the ``QISKIT_PARALLEL_MIN_COST`` environment
+# variable, as suggested by ``test/performance/parallel_calibration.py``.
+PARALLEL_MIN_COST = 100
+
+# Number of chunks each process gets, when grouping small tasks together.
+CHUNKS_PER_PROCESS = 4
+
+# Held by the thread running a process pool, which sets QISKIT_IN_PARALLEL
+# for the whole process: a parallel_map started meanwhile from another thread
+# (such as the executors of ``transpile_async`` and ``compile_async``) runs
+# serially instead of racing on the variable.
+_POOL_LOCK = threading.Lock()
+
+
+def parallel_min_cost():
+    """
+    Return the estimated cost of a batch of tasks under which the tasks
+    should run serially.
+
+    Returns:
+        float: the ``QISKIT_PARALLEL_MIN_COST`` environment variable if set,
+            ``PARALLEL_MIN_COST`` otherwise.
+    """
+    return float(os.getenv('QISKIT_PARALLEL_MIN_COST', str(PARALLEL_MIN_COST)))
+
+
+def parallel_enabled(num_processes=CPU_COUNT):
+    """
+    Tell whether ``parallel_map`` runs the tasks in a process pool, which is
+    the case if not on Windows and not in a parallel_map already.
+
+    Args:
+        num_processes (int): Number of processes that would be spawned.
+
+    Returns:
+        bool: True if more than one value would be mapped in parallel.
+    """
+    return platform.system() != 'Windows' and num_processes > 1 \
+        and os.getenv('QISKIT_IN_PARALLEL') == 'FALSE'
+
+
+def _chunks(num_values, num_chunks, costs=None):
+    """
+    Split ``range(num_values)`` into at most ``num_chunks`` contiguous chunks
+    of similar estimated cost.
+
+    Args:
+        num_values (int): Number of values to split.
+        num_chunks (int): Maximum number of chunks.
+        costs (list[float]): Estimated cost of each value. Every value costs
+            the same if None.
+
+    Returns:
+        list[range]: the chunks of indices.
+    """
+    if costs is None:
+        costs = [1] * num_values
+    target = sum(costs) / max(num_chunks, 1)
+    chunks = []
+    start = 0
+    accumulated = 0
+    for index, cost in enumerate(costs):
+        accumulated += cost
+        if accumulated >= target * (len(chunks) + 1) and len(chunks) < num_chunks - 1:
+            chunks.append(range(start, index + 1))
+            start = index + 1
+    if start < num_values:
+        chunks.append(range(start, num_values))
+    return chunks
+
+
+def _task_chunk(task, chunk, task_args, task_kwargs):
+    """Run ``task`` on each value of a chunk, in a worker process."""
+    return [task(value, *task_args, **task_kwargs) for value in chunk]
+
 
 def parallel_map(task, values, task_args=tuple(), task_kwargs={},  # pylint: disable=W0102
-                 num_processes=CPU_COUNT):
+                 num_processes=CPU_COUNT, costs=None):
     """
     Parallel execution of a mapping of `values` to the function `task`. This
     is functionally equivalent to::
@@ -65,6 +144,10 @@ def parallel_map(task, values, task_args=tuple(), task_kwargs={},  # pylint: dis
     On Windows this function defaults to a serial implementation to avoid the
     overhead from spawning processes in Windows.
 
+    In parallel, the values are sent to the processes in contiguous chunks
+    (a few per process) of similar estimated cost, so that small tasks do not
+    pay the inter-process overhead one by one.
+
     Args:
         task (func): Function that is to be called for each value in ``task_vec``.
         values (array_like): List or array of values for which the ``task``
@@ -72,6 +155,8 @@ def parallel_map(task, values, task_args=tuple(), task_kwargs={},  # pylint: dis
         task_args (list): Optional additional arguments to the ``task`` function.
         task_kwargs (dict): Optional additional keyword argument to the ``task`` function.
         num_processes (int): Number of processes to spawn.
+        costs (list[float]): Optional estimated cost of each value, used for
+            balancing the chunks sent to the processes.
 
     Returns:
         result: The result list contains the value of
@@ -96,32 +181,18 @@ def parallel_map(task, values, task_args=tuple(), task_kwargs={},  # pylint: dis
         nfinished[0] += 1
         Publisher().publish("terra.transpiler.parallel.done", nfinished[0])
 
-    # Run in parallel if not Win and not in parallel already
-    if platform.system() != 'Windows' and num_processes > 1 \
-       and os.getenv('QISKIT_IN_PARALLEL') == 'FALSE':
-        os.environ['QISKIT_IN_PARALLEL'] = 'TRUE'
-        try:
-            pool = Pool(processes=num_processes)
-
-            async_res = [pool.apply_async(task, (value,) + task_args, task_kwargs,
-                                          _callback) for value in values]
+    def _chunk_callback(results):
+        for result in results:
+            _callback(result)
 
-            while not all([item.ready() for item in async_res]):
-                for item in async_res:
-                    item.wait(timeout=0.1)
-
-            pool.terminate()
-            pool.join()
-
-        except KeyboardInterrupt:
-            pool.terminate()
-            pool.join()
-            Publisher().publish("terra.parallel.parallel.finish")
-            raise QiskitError('Keyboard interrupt in parallel_map.')
-
-        Publisher().publish("terra.transpiler.parallel.finish")
-        os.environ['QISKIT_IN_PARALLEL'] = 'FALSE'
-        return [ar.get() for ar in async_res]
+    # Run in parallel if not Win and not in parallel already, in this thread
+    # or another one
+    if parallel_enabled(num_processes) and _POOL_LOCK.acquire(blocking=False):
+        try:
+            return _pool_map(task, values, task_args, task_kwargs, num_processes, costs,
+                             _chunk_callback)
+        finally:
+            _POOL_LOCK.release()
 
     # Cannot do parallel on Windows , if another parallel_map is running in parallel,
     # or len(values) == 1.
@@ -132,3 +203,37 @@ def parallel_map(task, values, task_args=tuple(), task_kwargs={},  # pylint: dis
         _callback(0)
     Publisher().publish("terra.transpiler.parallel.finish")
     return results
+
+
+def _pool_map(task, values, task_args, task_kwargs, num_processes, costs, chunk_callback):
+    """Run the tasks of ``parallel_map`` in a process pool, with
+    QISKIT_IN_PARALLEL set while the pool runs."""
+    os.environ['QISKIT_IN_PARALLEL'] = 'TRUE'
+    try:
+        pool = Pool(processes=num_processes)
+
+        chunks = _chunks(len(values), num_processes * CHUNKS_PER_PROCESS, costs)
+        async_res = [pool.apply_async(_task_chunk,
+                                      (task, [values[i] for i in chunk],
+                                       task_args, task_kwargs),
+                                      callback=chunk_callback)
+                     for chunk in chunks]
+
+        while not all([item.ready() for item in async_res]):
+            for item in async_res:
+                item.wait(timeout=0.1)
+
+        pool.terminate()
+        pool.join()
+
+    except KeyboardInterrupt:
+        pool.terminate()
+        pool.join()
+        Publisher().publish("terra.parallel.parallel.finish")
+        raise QiskitError('Keyboard interrupt in parallel_map.')
+
+    finally:
+        os.environ['QISKIT_IN_PARALLEL'] = 'FALSE'
+
+    Publisher().publish("terra.transpiler.parallel.finish")
+    return [result for ar in async_res for result in ar.get()]
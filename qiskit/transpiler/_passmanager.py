@@ -18,7 +18,8 @@ from ._transpilererror import TranspilerError
 class PassManager():
     """ A PassManager schedules the passes """
 
-    def __init__(self, ignore_requires=None, ignore_preserves=None, max_iteration=None):
+    def __init__(self, ignore_requires=None, ignore_preserves=None, max_iteration=None,
+                 track_changes=None):
         """
         Initialize an empty PassManager object (with no passes scheduled).
 
@@ -29,6 +30,9 @@ class PassManager():
                 default setting in the pass is False.
             max_iteration (int): The schedule looping iterates until the condition is met or until
                 max_iteration is reached.
+            track_changes (bool): The schedule keeps the valid passes when a transformation pass
+                leaves the DAG unchanged, and stops do_while loops after an iteration that did not
+                change the DAG. The default setting is False.
         """
         # the pass manager's schedule of passes, including any control-flow.
         # Populated via PassManager.add_passes().
@@ -43,10 +47,17 @@ class PassManager():
         # passes already run that have not been invalidated
         self.valid_passes = set()
 
+        # number of transformation passes run so far that modified the DAG
+        self.dag_changes = 0
+        # value of dag_changes when the running passset started, or when its do_while
+        # condition was last evaluated
+        self._checked_dag_changes = 0
+
         # pass manager's overriding options for the passes it runs (for debugging)
         self.passmanager_options = {'ignore_requires': ignore_requires,
                                     'ignore_preserves': ignore_preserves,
-                                    'max_iteration': max_iteration}
+                                    'max_iteration': max_iteration,
+                                    'track_changes': track_changes}
 
     def _join_options(self, passset_options):
         """ Set the options of each passset, based on precedence rules:
@@ -56,20 +67,23 @@ class PassManager():
         """
         default = {'ignore_preserves': False,  # Ignore preserves for this pass
                    'ignore_requires': False,  # Ignore requires for this pass
-                   'max_iteration': 1000}  # Maximum allowed iteration on this pass
+                   'max_iteration': 1000,  # Maximum allowed iteration on this pass
+                   'track_changes': False}  # Skip invalidation when the DAG is unchanged
 
         passmanager_level = {k: v for k, v in self.passmanager_options.items() if v is not None}
         passset_level = {k: v for k, v in passset_options.items() if v is not None}
         return {**default, **passmanager_level, **passset_level}
 
     def add_passes(self, passes, ignore_requires=None, ignore_preserves=None, max_iteration=None,
-                   **flow_controller_conditions):
+                   track_changes=None, **flow_controller_conditions):
         """
         Args:
             passes (list[BasePass] or BasePass): pass(es) to be added to schedule
             ignore_preserves (bool): ignore the preserves claim of passes. Default: False
             ignore_requires (bool): ignore the requires need of passes. Default: False
             max_iteration (int): max number of iterations of passes. Default: 1000
+            track_changes (bool): do not invalidate passes when the DAG is left unchanged, and
+                stop do_while loops once an iteration leaves the DAG unchanged. Default: False
             flow_controller_conditions (kwargs): See add_flow_controller(): Dictionary of
                 control flow plugins. Default:
                 do_while (callable property_set -> boolean): The passes repeat until the
@@ -84,7 +98,8 @@ class PassManager():
 
         passset_options = {'ignore_requires': ignore_requires,
                            'ignore_preserves': ignore_preserves,
-                           'max_iteration': max_iteration}
+                           'max_iteration': max_iteration,
+                           'track_changes': track_changes}
 
         options = self._join_options(passset_options)
 
@@ -101,9 +116,33 @@ class PassManager():
             else:
                 raise TranspilerError('The flow controller parameter %s is not callable' % name)
 
+        if options['track_changes'] and 'do_while' in flow_controller_conditions:
+            flow_controller_conditions['do_while'] = self._stop_if_unchanged(
+                flow_controller_conditions['do_while'])
+
         self.working_list.append(
             FlowController.controller_factory(passes, options, **flow_controller_conditions))
 
+    def _stop_if_unchanged(self, do_while):
+        """Wrap a do_while condition so the loop ends when an iteration did not change the DAG.
+
+        Args:
+            do_while (callable): the condition of the loop, with the property set already bound.
+
+        Returns:
+            callable: a condition that is False when no transformation pass changed the DAG since
+                the loop started or the previous evaluation, and the result of ``do_while``
+                otherwise.
+        """
+        def condition():
+            unchanged = self._checked_dag_changes == self.dag_changes
+            self._checked_dag_changes = self.dag_changes
+            if unchanged:
+                return False
+            return do_while()
+
+        return condition
+
     def run_passes(self, dag):
         """Run all the passes on a DAG.
 
@@ -114,6 +153,7 @@ class PassManager():
             DAGCircuit: Transformed DAG.
         """
         for passset in self.working_list:
+            self._checked_dag_changes = self.dag_changes
             for pass_ in passset:
                 dag = self._do_pass(pass_, dag, passset.options)
         return dag
@@ -139,13 +179,16 @@ class PassManager():
 
         # Run the pass itself, if not already run
         if pass_ not in self.valid_passes:
+            dag_changed = False
             if pass_.is_transformation_pass:
                 pass_.property_set = self.fenced_property_set
+                generation = dag.generation
                 new_dag = pass_.run(dag)
                 if not isinstance(new_dag, DAGCircuit):
                     raise TranspilerError("Transformation passes should return a transformed dag."
                                           "The pass %s is returning a %s" % (type(pass_).__name__,
                                                                              type(new_dag)))
+                dag_changed = new_dag is not dag or new_dag.generation != generation
                 dag = new_dag
             elif pass_.is_analysis_pass:
                 pass_.property_set = self.property_set
@@ -153,13 +196,19 @@ class PassManager():
             else:
                 raise TranspilerError("I dont know how to handle this type of pass")
 
+            if dag_changed:
+                self.dag_changes += 1
+
             # update the valid_passes property
-            self._update_valid_passes(pass_, options['ignore_preserves'])
+            self._update_valid_passes(pass_, options['ignore_preserves'],
+                                      options['track_changes'] and not dag_changed)
 
         return dag
 
-    def _update_valid_passes(self, pass_, ignore_preserves):
+    def _update_valid_passes(self, pass_, ignore_preserves, dag_unchanged=False):
         self.valid_passes.add(pass_)
+        if dag_unchanged:  # Nothing to invalidate
+            return
         if not pass_.is_analysis_pass:  # Analysis passes preserve all
             if ignore_preserves:
                 self.valid_passes.clear()
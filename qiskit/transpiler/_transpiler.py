@@ -6,6 +6,7 @@
 # the LICENSE.txt file in the root directory of this source tree.
 
 """Tools for compiling a batch of quantum circuits."""
+from concurrent import futures
 import logging
 import warnings
 import numpy as np
@@ -21,11 +22,16 @@ from qiskit.unrollers import _dagbackend
 from qiskit.mapper import (Coupling, optimize_1q_gates, swap_mapper,
                            cx_cancellation, direction_mapper,
                            remove_last_measurements, return_last_measurements)
-from ._parallel import parallel_map
+from ._packedcircuit import PackedCircuit
+from ._parallel import parallel_map, parallel_enabled, parallel_min_cost, CPU_COUNT
 
 
 logger = logging.getLogger(__name__)
 
+# Executor running the transpilations requested by ``transpile_async``. The
+# transpilation itself may in turn spread over a process pool.
+_executor = futures.ThreadPoolExecutor()
+
 
 def transpile(circuits, backend, basis_gates=None, coupling_map=None, initial_layout=None,
               seed_mapper=None, pass_manager=None):
@@ -57,25 +63,74 @@ def transpile(circuits, backend, basis_gates=None, coupling_map=None, initial_la
     coupling_map = coupling_map or getattr(backend.configuration(),
                                            'coupling_map', None)
 
+    # Only spawn processes if the batch is expensive enough to pay for them.
+    costs = [_transpilation_cost(circuit, coupling_map) for circuit in circuits]
+    in_parallel = len(circuits) > 1 and parallel_enabled() and \
+        sum(costs) >= parallel_min_cost()
+    num_processes = CPU_COUNT if in_parallel else 1
+
+    # Circuits are sent to (and back from) the worker processes in a packed
+    # form, which is much cheaper to pickle than a QuantumCircuit.
+    if in_parallel:
+        circuits = [PackedCircuit.from_circuit(circuit) or circuit for circuit in circuits]
+
     circuits = parallel_map(_transpilation, circuits,
                             task_args=(backend,),
                             task_kwargs={'basis_gates': basis_gates,
                                          'coupling_map': coupling_map,
                                          'initial_layout': initial_layout,
                                          'seed_mapper': seed_mapper,
-                                         'pass_manager': pass_manager})
+                                         'pass_manager': pass_manager},
+                            num_processes=num_processes, costs=costs)
+    circuits = [circuit.to_circuit() if isinstance(circuit, PackedCircuit) else circuit
+                for circuit in circuits]
     if return_form_is_single:
         return circuits[0]
     return circuits
 
 
+def transpile_async(circuits, backend, basis_gates=None, coupling_map=None,
+                    initial_layout=None, seed_mapper=None, pass_manager=None):
+    """Transpile one or more circuits in the background.
+
+    The arguments are the same as for ``transpile``. The returned future can
+    be awaited from asyncio code via ``asyncio.wrap_future``.
+
+    Returns:
+        concurrent.futures.Future: future of the transpiled circuit(s).
+    """
+    return _executor.submit(transpile, circuits, backend, basis_gates, coupling_map,
+                            initial_layout, seed_mapper, pass_manager)
+
+
+def _transpilation_cost(circuit, coupling_map=None):
+    """Estimate the cost of transpiling a circuit.
+
+    The unit is the time taken to transpile a single gate without routing.
+    Routing with the swap mapper costs roughly an extra unit per gate and per
+    qubit of the circuit.
+
+    Args:
+        circuit (QuantumCircuit): A circuit to transpile.
+        coupling_map (list): coupling map to target in mapping, if any.
+
+    Returns:
+        int: the estimated cost.
+    """
+    num_gates = len(circuit.data)
+    num_qubits = sum(qreg.size for qreg in circuit.qregs)
+    if coupling_map and coupling_map != "all-to-all" and num_qubits > 1:
+        return num_gates * (1 + num_qubits)
+    return num_gates
+
+
 def _transpilation(circuit, backend, basis_gates=None, coupling_map=None,
                    initial_layout=None, seed_mapper=None,
                    pass_manager=None):
     """Perform transpilation of a single circuit.
 
     Args:
-        circuit (QuantumCircuit): A circuit to transpile.
+        circuit (QuantumCircuit or PackedCircuit): A circuit to transpile.
         backend (BaseBackend): a backend to compile for
         basis_gates (str): comma-separated basis gate set to compile to
         coupling_map (list): coupling map (perhaps custom) to target in mapping
@@ -84,10 +139,14 @@ def _transpilation(circuit, backend, basis_gates=None, coupling_map=None,
         pass_manager (PassManager): a pass_manager for the transpiler stage
 
     Returns:
-        QuantumCircuit: A transpiled circuit.
+        QuantumCircuit or PackedCircuit: A transpiled circuit, packed if the
+            input circuit was packed.
 
     """
-    dag = DAGCircuit.fromQuantumCircuit(circuit)
+    if isinstance(circuit, PackedCircuit):
+        dag = circuit.to_dag()
+    else:
+        dag = DAGCircuit.fromQuantumCircuit(circuit)
     if (initial_layout is None and not backend.configuration().simulator
             and not _matches_coupling_map(dag, coupling_map)):
         initial_layout = _pick_best_layout(dag, backend)
@@ -101,6 +160,11 @@ def _transpilation(circuit, backend, basis_gates=None, coupling_map=None,
     final_dag.layout = [[k, v]
                         for k, v in final_layout.items()] if final_layout else None
 
+    if isinstance(circuit, PackedCircuit):
+        packed_circuit = PackedCircuit.from_dag(final_dag)
+        if packed_circuit is not None:
+            return packed_circuit
+
     out_circuit = QuantumCircuit.fromDAGCircuit(final_dag)
 
     return out_circuit
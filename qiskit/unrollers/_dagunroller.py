@@ -7,15 +7,38 @@
 
 """
 DAG Unroller
+
+Gates are expanded in a single sweep over the DAG, replacing each of them by
+its basis-level expansion (see ``DAGCircuit.substitute_operations_one``).
+The expansions are built once per gate type and parameters, by flattening the
+decomposition rules recursively, and shared between the unrollers (see
+``_basis_expansion``).
+
+The single sweep does not apply the conditional of a gate to its expansion:
+DAGs with conditional gates to expand fall back to substituting the
+decomposition rules one level at a time, which does.
 """
 
+from collections import OrderedDict
+import copy
+
 import networkx as nx
 
+from qiskit._instruction import _decomposition_key
 from qiskit._quantumregister import QuantumRegister
 from qiskit._classicalregister import ClassicalRegister
+from qiskit.dagcircuit import DAGCircuit
 from ._unrollererror import UnrollerError
 from ._dagbackend import DAGBackend
 
+# Instructions of the simulators, which are never expanded.
+_SIMULATOR_BUILTINS = frozenset(['snapshot', 'save', 'load', 'noise'])
+
+# Basis-level expansions of the gates, by decomposition key and set of gates
+# left unexpanded, least recently used first.
+_EXPANSIONS = OrderedDict()
+_EXPANSIONS_MAX_SIZE = 4096
+
 
 class DagUnroller(object):
     """An Unroller that takes Dag circuits as the input."""
@@ -61,6 +84,20 @@ class DagUnroller(object):
 
         This method replicates the behavior of the unroller
         module without using the OpenQASM parser or the ast.
+
+        The gates are expanded in a single sweep, unless some of the gates
+        to expand are conditional: the DAG is then expanded one level of
+        decomposition at a time.
+
+        Args:
+            basis (list[str]): the basis gates.
+
+        Returns:
+            DAGCircuit: the DAG of the unroller, with every gate expanded.
+
+        Raises:
+            UnrollerError: if the backend is not a DAGBackend, or if a gate
+                has no decomposition rules.
         """
         if not basis:
             basis = []
@@ -69,6 +106,75 @@ class DagUnroller(object):
         if not isinstance(self.backend, DAGBackend):
             raise UnrollerError("expand_gates only accepts a DAGBackend!!")
 
+        graph = self.dag_circuit.multi_graph
+        leaves = self._leaves(basis)
+        for node in self.dag_circuit.get_op_nodes():
+            if graph.nodes[node]["op"].name not in leaves and \
+                    graph.nodes[node]["condition"] is not None:
+                return self._expand_gates_recursively(basis)
+
+        return self._expand_gates_single_pass(leaves)
+
+    def _leaves(self, basis):
+        """Return the names of the operations that are not expanded.
+
+        Args:
+            basis (list[str]): the basis gates.
+
+        Returns:
+            frozenset(str): the basis gates, simulator instructions and opaque gates.
+        """
+        opaque_gates = [name for name, data in self.dag_circuit.gates.items()
+                        if data["opaque"]]
+        return frozenset(basis).union(_SIMULATOR_BUILTINS, opaque_gates)
+
+    def _expand_gates_single_pass(self, leaves):
+        """Expand the gate nodes in a single sweep over the DAG.
+
+        Args:
+            leaves (frozenset(str)): names of the operations that are not expanded.
+
+        Returns:
+            DAGCircuit: the DAG of the unroller, with every gate expanded.
+
+        Raises:
+            UnrollerError: if a gate has no decomposition rules.
+        """
+        dag = self.dag_circuit
+        graph = dag.multi_graph
+        for node in list(nx.topological_sort(graph)):
+            node_data = graph.nodes[node]
+            if node_data["type"] != "op" or node_data["op"].name in leaves:
+                continue
+            expansion = _basis_expansion(node_data["op"], leaves)
+            for name, signature in expansion.basis.items():
+                if name not in dag.basis:
+                    dag.add_basis_element(name, *signature)
+            for name, data in expansion.gates.items():
+                dag.add_gate_data(name, data)
+            qargs, cargs = node_data["qargs"], node_data["cargs"]
+            operations = []
+            for template_op, qubits, clbits in expansion.ops:
+                op = copy.copy(template_op)
+                op.param = list(template_op.param)
+                operations.append((op, [qargs[i] for i in qubits],
+                                   [cargs[i] for i in clbits]))
+            dag.substitute_operations_one(node, operations)
+        return dag
+
+    def _expand_gates_recursively(self, basis):
+        """Expand the gate nodes by substituting their decomposition rules,
+        one level at a time, until only basis gates are left.
+
+        Args:
+            basis (list[str]): the basis gates.
+
+        Returns:
+            DAGCircuit: the DAG of the unroller, with every gate expanded.
+
+        Raises:
+            UnrollerError: if a gate has no decomposition rules.
+        """
         # Walk through the DAG and expand each non-basis node
         simulator_builtins = ['snapshot', 'save', 'load', 'noise']
         topological_sorted_list = list(nx.topological_sort(self.dag_circuit.multi_graph))
@@ -83,23 +189,8 @@ class DagUnroller(object):
                     raise UnrollerError("no decomposition rules defined for ",
                                         current_node["op"].name)
                 # TODO: allow choosing other possible decompositions
-                decomposition_dag = decomposition_rules[0]
                 condition = current_node["condition"]
-                # the decomposition rule must be amended if used in a
-                # conditional context. delete the op nodes and replay
-                # them with the condition.
-                if condition:
-                    decomposition_dag.add_creg(condition[0])
-                    to_replay = []
-                    for n_it in nx.topological_sort(decomposition_dag.multi_graph):
-                        n = decomposition_dag.multi_graph.nodes[n_it]
-                        if n["type"] == "op":
-                            n["op"].control = condition
-                            to_replay.append(n)
-                    for n in decomposition_dag.get_op_nodes():
-                        decomposition_dag._remove_op_node(n)
-                    for n in to_replay:
-                        decomposition_dag.apply_operation_back(n["op"], condition=condition)
+                decomposition_dag = _instantiate(decomposition_rules[0], condition)
 
                 # the wires for substitute_circuit_one are expected as qargs first,
                 # then cargs, then conditions
@@ -116,7 +207,7 @@ class DagUnroller(object):
         gate_set = set([self.dag_circuit.multi_graph.nodes[n]["op"].name
                         for n in self.dag_circuit.get_op_nodes()])
         if not gate_set.issubset(basis):
-            self.expand_gates(basis)
+            self._expand_gates_recursively(basis)
 
         return self.dag_circuit
 
@@ -161,3 +252,136 @@ class DagUnroller(object):
                 self.backend.drop_condition()
 
         return self.backend.get_output()
+
+
+def _instantiate(template, condition=None):
+    """Instantiate a decomposition rule, which is shared between instructions.
+
+    Args:
+        template (DAGCircuit): the decomposition rule.
+        condition (tuple or None): (ClassicalRegister, int) condition the
+            instructions of the rule are amended with, if any.
+
+    Returns:
+        DAGCircuit: a copy of the rule, with its own instructions.
+    """
+    dag = DAGCircuit()
+    dag.name = template.name
+    for qreg in template.qregs.values():
+        dag.add_qreg(qreg)
+    for creg in template.cregs.values():
+        dag.add_creg(creg)
+    if condition and condition[0].name not in dag.cregs:
+        dag.add_creg(condition[0])
+    dag.basis = copy.copy(template.basis)
+    dag.gates = copy.copy(template.gates)
+    graph = template.multi_graph
+    for node in nx.topological_sort(graph):
+        node_data = graph.nodes[node]
+        if node_data["type"] != "op":
+            continue
+        op = copy.copy(node_data["op"])
+        op.param = list(op.param)
+        if condition:
+            op.control = condition
+        dag.apply_operation_back(op, node_data["qargs"], node_data["cargs"],
+                                 condition or node_data["condition"])
+    return dag
+
+
+class _BasisExpansion(object):
+    """Expansion of a gate into operations left unexpanded.
+
+    Attributes:
+        ops (list[tuple]): (op, qubits, clbits) triples, in order, where
+            qubits and clbits are the indices of the arguments of the gate
+            the op is applied to. The ops are shared and must be copied
+            before being added to a DAG.
+        basis (OrderedDict): basis elements of the decomposition rules.
+        gates (OrderedDict): gate definitions of the decomposition rules.
+    """
+
+    def __init__(self):
+        self.ops = []
+        self.basis = OrderedDict()
+        self.gates = OrderedDict()
+
+
+def _basis_expansion(op, leaves):
+    """Return the expansion of a gate into the operations left unexpanded.
+
+    The expansion is built by flattening the first decomposition rule of the
+    gate recursively, and is shared by the gates of the same type and
+    parameters.
+
+    Args:
+        op (Instruction): the gate to expand.
+        leaves (frozenset(str)): names of the operations that are not expanded.
+
+    Returns:
+        _BasisExpansion: the expansion.
+
+    Raises:
+        UnrollerError: if the gate, or a gate of its decomposition, has no
+            decomposition rules.
+    """
+    key = _decomposition_key(op)
+    if key is None:
+        return _flatten(op, leaves)
+    key = (key, leaves)
+    try:
+        expansion = _EXPANSIONS.pop(key)
+    except KeyError:
+        expansion = _flatten(op, leaves)
+        if len(_EXPANSIONS) >= _EXPANSIONS_MAX_SIZE:
+            _EXPANSIONS.popitem(last=False)
+    _EXPANSIONS[key] = expansion
+    return expansion
+
+
+def _flatten(op, leaves):
+    """Build the expansion of a gate into the operations left unexpanded.
+
+    Args:
+        op (Instruction): the gate to expand.
+        leaves (frozenset(str)): names of the operations that are not expanded.
+
+    Returns:
+        _BasisExpansion: the expansion.
+
+    Raises:
+        UnrollerError: if the gate, or a gate of its decomposition, has no
+            decomposition rules.
+    """
+    decomposition_rules = op._decompositions
+    if not decomposition_rules:
+        raise UnrollerError("no decomposition rules defined for ", op.name)
+    # TODO: allow choosing other possible decompositions
+    rule = decomposition_rules[0]
+    qubit_indices = {wire: i for i, wire in enumerate(
+        w for w in rule.wires if isinstance(w[0], QuantumRegister))}
+    clbit_indices = {wire: i for i, wire in enumerate(
+        w for w in rule.wires if isinstance(w[0], ClassicalRegister))}
+
+    expansion = _BasisExpansion()
+    expansion.basis.update(rule.basis)
+    expansion.gates.update(rule.gates)
+    graph = rule.multi_graph
+    for node in nx.topological_sort(graph):
+        node_data = graph.nodes[node]
+        if node_data["type"] != "op":
+            continue
+        qubits = [qubit_indices[qarg] for qarg in node_data["qargs"]]
+        clbits = [clbit_indices[carg] for carg in node_data["cargs"]]
+        if node_data["op"].name in leaves:
+            expansion.ops.append((node_data["op"], qubits, clbits))
+            continue
+        inner_expansion = _basis_expansion(node_data["op"], leaves)
+        for name, signature in inner_expansion.basis.items():
+            expansion.basis.setdefault(name, signature)
+        for name, data in inner_expansion.gates.items():
+            expansion.gates.setdefault(name, data)
+        expansion.ops.extend((inner_op, [qubits[i] for i in inner_qubits],
+                              [clbits[i] for i in inner_clbits])
+                             for inner_op, inner_qubits, inner_clbits in inner_expansion.ops)
+    return expansion
@@ -241,8 +241,26 @@ class _SchemaBinder:
             raise ValidationError(errors)
 
     @staticmethod
-    def _from_dict(decorated_cls, dict_):
-        """Deserialize a dict of simple types into an instance of this class."""
+    def _from_dict(decorated_cls, dict_, validate=True):
+        """Deserialize a dict of simple types into an instance of this class.
+
+        Args:
+            decorated_cls (type): the model class.
+            dict_ (dict): the serialized model.
+            validate (bool): validate the dict against the schema. If False,
+                the dict is trusted to conform to the schema (as the ones
+                produced by the local simulators), and the model instances
+                are built directly, only deserializing the fields whose
+                serialized and deserialized forms differ.
+
+        Returns:
+            BaseModel: the model instance.
+
+        Raises:
+            ValidationError: if the dict does not validate against the schema.
+        """
+        if not validate:
+            return _trusted_loader(decorated_cls.schema.__class__)(dict_)
         data, errors = decorated_cls.schema.load(dict_)
         if errors:
             raise ValidationError(errors)
@@ -305,6 +323,91 @@ def bind_schema(schema):
     return _SchemaBinder(schema)
 
 
+# Fields deserializing to their serialized value.
+_PLAIN_FIELDS = (fields.Number, fields.String, fields.Boolean, fields.Raw)
+
+# Functions building the models of the schemas from trusted dicts, by schema class.
+_TRUSTED_LOADERS = {}
+
+
+def _trusted_loader(schema_cls):
+    """Return a function building the model of a schema from a trusted dict.
+
+    The function builds the model with its undecorated constructor, after
+    deserializing the fields of the dict that are nested models (unless
+    already built) or whose serialized and deserialized forms differ. The
+    other fields, and the fields unknown to the schema, are passed through.
+
+    Args:
+        schema_cls (type): the BaseSchema class, bound to a model.
+
+    Returns:
+        callable: function building the model from a dict.
+    """
+    if schema_cls in _TRUSTED_LOADERS:
+        return _TRUSTED_LOADERS[schema_cls]
+
+    schema = schema_cls()
+    model_cls = schema_cls.model_cls
+    # Constructor of the model without the validation added by bind_schema.
+    init_method = getattr(model_cls.__init__, '__wrapped__', model_cls.__init__)
+    converters = [(name, converter) for name, converter in
+                  ((name, _trusted_converter(field, name))
+                   for name, field in schema.fields.items())
+                  if converter is not None]
+
+    def _load(data):
+        kwargs = dict(data)
+        for name, converter in converters:
+            value = kwargs.get(name)
+            if value is not None:
+                kwargs[name] = converter(value, data)
+        instance = model_cls.__new__(model_cls)
+        init_method(instance, **kwargs)
+        return instance
+
+    _TRUSTED_LOADERS[schema_cls] = _load
+    return _load
+
+
+def _trusted_converter(field, name):
+    """Return a function deserializing a trusted field value, or None if passed through.
+
+    Args:
+        field (marshmallow.fields.Field): the field of the schema.
+        name (str): the name of the field.
+
+    Returns:
+        callable: function taking the value and the dict containing it, or
+            None if the value is passed through.
+    """
+    if isinstance(field, _PLAIN_FIELDS):
+        return None
+    if isinstance(field, fields.Nested) and isinstance(field.schema, BaseSchema):
+        nested_cls = field.schema.__class__
+
+        def _load_nested(value):
+            # Nested models may already be built.
+            if isinstance(value, nested_cls.model_cls):
+                return value
+            return _trusted_loader(nested_cls)(value)
+
+        if field.many:
+            return lambda value, _: [_load_nested(item) for item in value]
+        return lambda value, _: _load_nested(value)
+    if isinstance(field, fields.List):
+        item_converter = _trusted_converter(field.container, name)
+        if item_converter is None:
+            return None
+        return lambda value, data: [item_converter(item, data) for item in value]
+    return partial(_deserialize_field, field, name)
+
+
+def _deserialize_field(field, name, value, data):
+    """Deserialize the value of a field, without running its validators."""
+    return field._deserialize(value, name, data)
+
+
 def _base_model_from_kwargs(cls, kwargs):
     """Helper for BaseModel.__reduce__, expanding kwargs."""
     return cls(**kwargs)
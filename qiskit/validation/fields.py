@@ -9,6 +9,7 @@
 
 from functools import partial
 
+import numpy as np
 from marshmallow import ValidationError, fields
 from marshmallow.utils import is_collection
 from marshmallow_polyfield import PolyField
@@ -195,7 +196,9 @@ class Complex(fields.Field):
 
     Field for parsing complex numbers:
     * deserializes to Python's `complex`.
-    * serializes to a tuple of 2 decimals `(float, imaginary)`
+    * serializes to a tuple of 2 decimals `(float, imaginary)`, from Python's
+      `complex` or a Numpy complex scalar (such as the amplitudes of the
+      single precision simulators).
     """
 
     default_error_messages = {
@@ -206,10 +209,10 @@ class Complex(fields.Field):
     def _serialize(self, value, attr, obj):
         if value is None:
             return None
-        if not isinstance(value, complex):
+        if not isinstance(value, (complex, np.complexfloating)):
             self.fail('format', input=value)
         try:
-            return [value.real, value.imag]
+            return [float(value.real), float(value.imag)]
         except AttributeError:
             self.fail('format', input=value)
         return value
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Benchmark of the post-processing of counts.
+Measures the time taken to count the outcomes of many shots and to compute
+the marginal counts of a few bits, with dicts of hexadecimal keys and with
+IntegerCounts.
+"""
+
+import argparse
+import time
+from collections import Counter
+
+import numpy as np
+
+from qiskit.result import IntegerCounts
+
+
+def dict_counts(memory, bits):
+    """Count with dicts of hexadecimal keys, as from the memory of a simulator."""
+    counts = dict(Counter(map(hex, memory)))
+    marginal = {}
+    for key, value in counts.items():
+        outcome = int(key, 16)
+        new_key = hex(sum(((outcome >> bit) & 1) << k for k, bit in enumerate(bits)))
+        marginal[new_key] = marginal.get(new_key, 0) + value
+    return marginal
+
+
+def integer_counts(memory, bits, num_bits):
+    """Count with IntegerCounts, formatting only the marginal counts."""
+    return IntegerCounts.from_memory(memory, num_bits).marginal(bits).hex_dict()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark of the post-processing of counts.")
+    parser.add_argument('--n_qubits', type=int, default=24, help='num qubits')
+    parser.add_argument('--shots', type=int, nargs='+', default=[10000, 100000, 1000000],
+                        help='num shots')
+    parser.add_argument('--n_marginal', type=int, default=4, help='num bits kept')
+    args = parser.parse_args()
+
+    rng = np.random.RandomState(0)
+    bits = list(range(0, args.n_qubits, args.n_qubits // args.n_marginal))[:args.n_marginal]
+    for shots in args.shots:
+        memory = rng.randint(0, 1 << args.n_qubits, size=shots).tolist()
+        tstart = time.time()
+        expected = dict_counts(memory, bits)
+        dict_time = time.time() - tstart
+        tstart = time.time()
+        result = integer_counts(memory, bits, args.n_qubits)
+        integer_time = time.time() - tstart
+        assert result == expected
+        print("---- {} shots, dict counts: {}".format(shots, dict_time))
+        print("---- {} shots, integer counts: {}".format(shots, integer_time))
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Benchmark of the gate fusion of the Python simulators.
+Measures the time taken by the Python statevector simulator to run random
+circuits of single qubit gates and CX gates, with and without gate fusion.
+"""
+
+import argparse
+import random
+import time
+
+from qiskit import QuantumRegister, QuantumCircuit, compile
+from qiskit.backends.aer.statevector_simulator_py import StatevectorSimulatorPy
+
+
+def random_circuit(n_qubits, n_gates, seed):
+    """A random circuit of u3, h and cx gates."""
+    rng = random.Random(seed)
+    qr = QuantumRegister(n_qubits, 'qr')
+    circ = QuantumCircuit(qr)
+    for _ in range(n_gates):
+        draw = rng.random()
+        if draw < 0.3:
+            circ.u3(rng.random(), rng.random(), rng.random(), qr[rng.randrange(n_qubits)])
+        elif draw < 0.5:
+            circ.h(qr[rng.randrange(n_qubits)])
+        else:
+            control, target = rng.sample(range(n_qubits), 2)
+            circ.cx(qr[control], qr[target])
+    return circ
+
+
+def simulation_time(backend, circuit, fusion):
+    """Time taken to simulate a circuit."""
+    qobj = compile(circuit, backend, config={'fusion': fusion})
+    tstart = time.time()
+    backend._run_job('benchmark', qobj)
+    return time.time() - tstart
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark of the gate fusion.")
+    parser.add_argument('--n_qubits', type=int, nargs='+', default=[12, 16, 20],
+                        help='num qubits')
+    parser.add_argument('--n_gates', type=int, default=400, help='num gates')
+    args = parser.parse_args()
+
+    backend = StatevectorSimulatorPy()
+    for n_qubits in args.n_qubits:
+        circuit = random_circuit(n_qubits, args.n_gates, seed=0)
+        print("---- {} qubits, no fusion: {}".format(
+            n_qubits, simulation_time(backend, circuit, fusion=False)))
+        print("---- {} qubits, fusion: {}".format(
+            n_qubits, simulation_time(backend, circuit, fusion=True)))
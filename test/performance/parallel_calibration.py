@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Calibration of the serial/parallel dispatch of the transpiler.
+Measures the overhead of running a batch of tasks in a process pool and the
+time taken to transpile a gate, and suggests the value of the
+QISKIT_PARALLEL_MIN_COST environment variable for this machine.
+"""
+
+import argparse
+import random
+import time
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit import Aer
+from qiskit.transpiler._parallel import parallel_map, CPU_COUNT
+from qiskit.transpiler._packedcircuit import PackedCircuit
+from qiskit.transpiler._transpiler import _transpilation, _transpilation_cost
+
+
+def random_circuit(n_qubits, n_gates, seed):
+    """A random circuit of h and cx gates, followed by measurements."""
+    rng = random.Random(seed)
+    qr = QuantumRegister(n_qubits, 'qr')
+    cr = ClassicalRegister(n_qubits, 'cr')
+    circ = QuantumCircuit(qr, cr)
+    for _ in range(n_gates):
+        if rng.random() < 0.5:
+            circ.h(qr[rng.randrange(n_qubits)])
+        else:
+            control, target = rng.sample(range(n_qubits), 2)
+            circ.cx(qr[control], qr[target])
+    circ.measure(qr, cr)
+    return circ
+
+
+def _identity(value):
+    """Task doing nothing, for measuring the overhead of the process pool."""
+    return value
+
+
+def unit_time(circuits, backend, basis_gates):
+    """Time taken to transpile one unit of cost, serially."""
+    cost = sum(_transpilation_cost(circ) for circ in circuits)
+    tstart = time.time()
+    for circ in circuits:
+        _transpilation(circ, backend, basis_gates=basis_gates)
+    return (time.time() - tstart) / cost
+
+
+def pool_overhead(circuits, num_processes):
+    """Time taken to send packed circuits to a process pool and back."""
+    packed = [PackedCircuit.from_circuit(circ) for circ in circuits]
+    tstart = time.time()
+    parallel_map(_identity, packed, num_processes=num_processes)
+    return time.time() - tstart
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Calibration of the serial/parallel dispatch of the transpiler.")
+    parser.add_argument('--n_qubits', type=int, default=3, help='num qubits')
+    parser.add_argument('--n_gates', type=int, default=20, help='gates per circuit')
+    parser.add_argument('--n_circuits', type=int, default=16, help='num circuits')
+    parser.add_argument('--num_processes', type=int, default=CPU_COUNT,
+                        help='num processes')
+    args = parser.parse_args()
+
+    backend = Aer.get_backend('qasm_simulator_py')
+    basis_gates = ','.join(backend.configuration().basis_gates)
+    circuits = [random_circuit(args.n_qubits, args.n_gates, seed)
+                for seed in range(args.n_circuits)]
+
+    unit = unit_time(circuits, backend, basis_gates)
+    overhead = pool_overhead(circuits, args.num_processes)
+    print("---- Time per cost unit: {}".format(unit))
+    print("---- Process pool overhead: {}".format(overhead))
+
+    if args.num_processes < 2:
+        print("---- A single process is available: transpilation always runs serially.")
+    else:
+        # Running in parallel pays off when the serial time exceeds the
+        # overhead plus the time shared among the processes.
+        speedup = args.num_processes / (args.num_processes - 1)
+        min_cost = int(overhead * speedup / unit) + 1
+        print("---- Suggested setting: export QISKIT_PARALLEL_MIN_COST={}".format(min_cost))
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Benchmark of the Qobj validation modes.
+Measures the time taken to validate a Qobj of random circuits in the 'full',
+'fast' and 'off' modes of validate_qobj_against_schema.
+"""
+
+import argparse
+import random
+import time
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.qobj import validate_qobj_against_schema
+from qiskit.qobj._validation import VALIDATION_MODES
+from qiskit.tools._compiler import circuits_to_qobj
+
+
+def random_circuit(n_qubits, n_gates, seed):
+    """A random circuit of u3 and cx gates, followed by measurements."""
+    rng = random.Random(seed)
+    qr = QuantumRegister(n_qubits, 'qr')
+    cr = ClassicalRegister(n_qubits, 'cr')
+    circ = QuantumCircuit(qr, cr)
+    for _ in range(n_gates):
+        if rng.random() < 0.5:
+            circ.u3(rng.random(), rng.random(), rng.random(), qr[rng.randrange(n_qubits)])
+        else:
+            control, target = rng.sample(range(n_qubits), 2)
+            circ.cx(qr[control], qr[target])
+    circ.measure(qr, cr)
+    return circ
+
+
+def validation_time(qobj, mode, repeats):
+    """Best time taken to validate the qobj in a mode."""
+    times = []
+    for _ in range(repeats):
+        tstart = time.time()
+        validate_qobj_against_schema(qobj, mode)
+        times.append(time.time() - tstart)
+    return min(times)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark of the Qobj validation modes.")
+    parser.add_argument('--n_qubits', type=int, default=5, help='num qubits')
+    parser.add_argument('--n_gates', type=int, default=1000, help='gates per circuit')
+    parser.add_argument('--n_circuits', type=int, default=10, help='num circuits')
+    parser.add_argument('--repeats', type=int, default=3, help='num repeats')
+    args = parser.parse_args()
+
+    circuits = [random_circuit(args.n_qubits, args.n_gates, seed)
+                for seed in range(args.n_circuits)]
+    qobj = circuits_to_qobj(circuits, 'qasm_simulator_py', texparams=False,
+                            compiled_circuit_qasm=False)
+    n_instructions = sum(len(experiment.instructions) for experiment in qobj.experiments)
+    print("---- Instructions: {}".format(n_instructions))
+    for mode in VALIDATION_MODES:
+        print("---- Validation time ({}): {}".format(
+            mode, validation_time(qobj, mode, args.repeats)))
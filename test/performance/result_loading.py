@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Benchmark of the loading of Result objects.
+Measures the time taken by Result.from_dict() to load results with many
+experiments and per-shot memory, with and without validation.
+"""
+
+import argparse
+import random
+import time
+
+from qiskit.result import Result
+
+
+def result_dict(n_experiments, shots, n_qubits, seed):
+    """A result dict, as produced by the qasm simulator, with random outcomes."""
+    rng = random.Random(seed)
+    results = []
+    for i in range(n_experiments):
+        memory = [hex(rng.randrange(2 ** n_qubits)) for _ in range(shots)]
+        counts = {}
+        for outcome in memory:
+            counts[outcome] = counts.get(outcome, 0) + 1
+        header = {'name': 'circuit%d' % i, 'n_qubits': n_qubits, 'memory_slots': n_qubits,
+                  'qreg_sizes': [['qr', n_qubits]], 'creg_sizes': [['cr', n_qubits]],
+                  'qubit_labels': [['qr', j] for j in range(n_qubits)],
+                  'clbit_labels': [['cr', j] for j in range(n_qubits)]}
+        results.append({'name': header['name'], 'seed': seed, 'shots': shots,
+                        'data': {'counts': counts, 'memory': memory, 'snapshots': {}},
+                        'status': 'DONE', 'success': True, 'time_taken': 0.0,
+                        'header': header})
+    return {'backend_name': 'qasm_simulator_py', 'backend_version': '2.0.0',
+            'qobj_id': 'benchmark', 'job_id': 'benchmark', 'results': results,
+            'status': 'COMPLETED', 'success': True, 'time_taken': 0.0,
+            'header': {'backend_name': 'qasm_simulator_py'}}
+
+
+def loading_time(data, validate):
+    """Time taken to load a result from its dict."""
+    tstart = time.time()
+    Result.from_dict(data, validate=validate)
+    return time.time() - tstart
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark of the loading of Result objects.")
+    parser.add_argument('--n_experiments', type=int, nargs='+', default=[1000, 10000],
+                        help='num experiments')
+    parser.add_argument('--shots', type=int, default=100, help='num shots')
+    parser.add_argument('--n_qubits', type=int, default=5, help='num qubits')
+    args = parser.parse_args()
+
+    for n_experiments in args.n_experiments:
+        data = result_dict(n_experiments, args.shots, args.n_qubits, seed=0)
+        print("---- {} experiments, validated: {}".format(
+            n_experiments, loading_time(data, validate=True)))
+        print("---- {} experiments, trusted: {}".format(
+            n_experiments, loading_time(data, validate=False)))
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+# pylint: disable=missing-docstring
+
+"""Tests for the Python simulator of stabilizer circuits."""
+
+import random
+import unittest
+
+import numpy as np
+
+from qiskit import ClassicalRegister, QuantumRegister, QuantumCircuit
+from qiskit import compile
+from qiskit.backends.aer.clifford_simulator_py import CliffordSimulatorPy
+from qiskit.backends.aer.statevector_simulator_py import StatevectorSimulatorPy
+from qiskit.backends.aer._simulatorerror import SimulatorError
+from ..common import QiskitTestCase
+
+
+class TestCliffordSimulatorPy(QiskitTestCase):
+    """Test the Python simulator of stabilizer circuits."""
+
+    def setUp(self):
+        self.seed = 88
+        self.backend = CliffordSimulatorPy()
+
+    def test_deterministic_phases(self):
+        """Test the signs of deterministic measurements."""
+        qr = QuantumRegister(4, 'qr')
+        cr = ClassicalRegister(4, 'cr')
+        circuit = QuantumCircuit(qr, cr, name='phases')
+        # HZH|1> = X|1> = |0>
+        circuit.x(qr[0])
+        circuit.h(qr[0])
+        circuit.s(qr[0])
+        circuit.s(qr[0])
+        circuit.h(qr[0])
+        # Y|0> = i|1>
+        circuit.y(qr[1])
+        # H Sdg S H|0> = |0>
+        circuit.h(qr[2])
+        circuit.s(qr[2])
+        circuit.sdg(qr[2])
+        circuit.h(qr[2])
+        # CX of |1> on |0>, then Z which does not flip it.
+        circuit.x(qr[3])
+        circuit.cx(qr[3], qr[2])
+        circuit.z(qr[3])
+        circuit.measure(qr, cr)
+        qobj = compile(circuit, backend=self.backend, shots=20, seed=self.seed)
+        counts = self.backend.run(qobj).result().get_counts('phases')
+        self.assertEqual(counts, {'0xe': 20})
+
+    def test_ghz_many_qubits(self):
+        """Test the measurements of a GHZ state on a thousand qubits."""
+        qr = QuantumRegister(1000, 'qr')
+        cr = ClassicalRegister(1000, 'cr')
+        circuit = QuantumCircuit(qr, cr, name='ghz')
+        circuit.h(qr[0])
+        for qubit in range(999):
+            circuit.cx(qr[qubit], qr[qubit + 1])
+        circuit.measure(qr, cr)
+        qobj = compile(circuit, backend=self.backend, shots=20, seed=self.seed)
+        result = self.backend.run(qobj).result()
+        counts = result.get_counts('ghz')
+        self.assertEqual(set(counts), {'0x0', hex(2 ** 1000 - 1)})
+        # Same seed, same shots.
+        self.assertEqual(self.backend.run(qobj).result().get_counts('ghz'), counts)
+
+    def test_random_clifford_circuits(self):
+        """Test the outcomes of random circuits against the statevector."""
+        rng = random.Random(self.seed)
+        statevector_backend = StatevectorSimulatorPy()
+        for index in range(5):
+            qr = QuantumRegister(4, 'qr')
+            circuit = QuantumCircuit(qr, name='clifford{}'.format(index))
+            for _ in range(30):
+                gate = rng.choice(['h', 's', 'sdg', 'x', 'y', 'z', 'cx'])
+                if gate == 'cx':
+                    control, target = rng.sample(range(4), 2)
+                    circuit.cx(qr[control], qr[target])
+                else:
+                    getattr(circuit, gate)(qr[rng.randrange(4)])
+            qobj = compile(circuit, backend=statevector_backend)
+            statevector = statevector_backend.run(qobj).result().get_statevector(circuit.name)
+            expected = {hex(outcome)
+                        for outcome in np.flatnonzero(np.abs(statevector) ** 2 > 1e-6)}
+
+            cr = ClassicalRegister(4, 'cr')
+            measured = QuantumCircuit(qr, cr, name=circuit.name)
+            measured += circuit
+            measured.measure(qr, cr)
+            qobj = compile(measured, backend=self.backend, shots=500, seed=self.seed)
+            counts = self.backend.run(qobj).result().get_counts(circuit.name)
+            self.assertEqual(set(counts), expected)
+
+    def test_conditional_reset(self):
+        """Test resets, mid-circuit measurements and conditionals."""
+        qr = QuantumRegister(2, 'qr')
+        cr0 = ClassicalRegister(1, 'cr0')
+        cr1 = ClassicalRegister(1, 'cr1')
+        circuit = QuantumCircuit(qr, cr0, cr1, name='conditional')
+        circuit.h(qr[0])
+        circuit.measure(qr[0], cr0[0])
+        circuit.x(qr[1]).c_if(cr0, 1)
+        circuit.reset(qr[0])
+        circuit.measure(qr[1], cr1[0])
+        qobj = compile(circuit, backend=self.backend, shots=100, seed=self.seed)
+        counts = self.backend.run(qobj).result().get_counts('conditional')
+        self.assertEqual(set(counts), {'0x0', '0x3'})
+
+    def test_unsupported_gates(self):
+        """Test that only Clifford gates are accepted."""
+        qr = QuantumRegister(1, 'qr')
+        cr = ClassicalRegister(1, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.t(qr[0])
+        circuit.measure(qr, cr)
+        qobj = compile(circuit, backend=self.backend)
+        with self.assertRaises(SimulatorError):
+            self.backend._run_job('test', qobj)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+# pylint: disable=missing-docstring
+
+"""Tests for the gate fusion of the Python simulators."""
+
+import unittest
+
+import numpy as np
+
+from qiskit import ClassicalRegister, QuantumRegister, QuantumCircuit
+from qiskit import compile
+from qiskit.backends.aer._fusion import fuse_gates
+from qiskit.backends.aer.qasm_simulator_py import QasmSimulatorPy
+from qiskit.backends.aer.statevector_simulator_py import StatevectorSimulatorPy
+from qiskit.backends.aer.unitary_simulator_py import UnitarySimulatorPy
+from ..common import QiskitTestCase
+
+
+class TestGateFusion(QiskitTestCase):
+    """Test the gate fusion of the Python simulators."""
+
+    def setUp(self):
+        self.seed = 88
+        qr = QuantumRegister(4, 'qr')
+        self.circuit = QuantumCircuit(qr, name='fusion')
+        self.circuit.h(qr[0])
+        self.circuit.u3(0.1, 0.2, 0.3, qr[0])
+        self.circuit.cx(qr[0], qr[1])
+        self.circuit.u1(0.4, qr[1])
+        self.circuit.cx(qr[1], qr[0])
+        self.circuit.cx(qr[2], qr[3])
+        self.circuit.cx(qr[2], qr[3])
+        self.circuit.cx(qr[3], qr[1])
+        self.circuit.t(qr[0])
+
+    def test_fuse_gates(self):
+        """Test which gates are fused together."""
+        qobj = compile(self.circuit, backend=UnitarySimulatorPy())
+        fused = fuse_gates(qobj.experiments[0].instructions)
+        # The CX on qubits 2 and 3 cancel out, the t gate is absorbed in the
+        # gates on qubits 0 and 1, and the last CX is left alone.
+        self.assertCountEqual([(instruction.name, instruction.qubits) for instruction in fused],
+                              [('fused', [0, 1]), ('cx', [3, 1])])
+
+    def test_statevector(self):
+        """Test that fusion does not change the final statevector."""
+        backend = StatevectorSimulatorPy()
+        expected = backend.run(compile(self.circuit, backend)).result()
+        result = backend.run(compile(self.circuit, backend, config={'fusion': True})).result()
+        self.assertTrue(np.allclose(result.get_statevector('fusion'),
+                                    expected.get_statevector('fusion')))
+
+    def test_unitary(self):
+        """Test that fusion does not change the unitary."""
+        backend = UnitarySimulatorPy()
+        expected = backend.run(compile(self.circuit, backend)).result()
+        result = backend.run(compile(self.circuit, backend, config={'fusion': True})).result()
+        self.assertTrue(np.allclose(result.get_unitary('fusion'),
+                                    expected.get_unitary('fusion')))
+
+    def test_measure_reset_conditional(self):
+        """Test fusion around measurements, resets and conditional gates."""
+        qr = QuantumRegister(3, 'qr')
+        cr = ClassicalRegister(3, 'cr')
+        circuit = QuantumCircuit(qr, cr, name='teleport')
+        circuit.h(qr[1])
+        circuit.cx(qr[1], qr[2])
+        circuit.ry(np.pi / 4, qr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.h(qr[0])
+        circuit.measure(qr[0], cr[0])
+        circuit.measure(qr[1], cr[1])
+        circuit.z(qr[2]).c_if(cr, 1)
+        circuit.x(qr[2]).c_if(cr, 2)
+        circuit.reset(qr[0])
+        circuit.h(qr[0])
+        circuit.measure(qr[2], cr[2])
+        backend = QasmSimulatorPy()
+        expected = backend.run(compile(circuit, backend, shots=200, seed=self.seed)).result()
+        result = backend.run(compile(circuit, backend, shots=200, seed=self.seed,
+                                     config={'fusion': True})).result()
+        self.assertEqual(result.get_counts('teleport'), expected.get_counts('teleport'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+# pylint: disable=missing-docstring
+
+"""Tests for the Python simulator of matrix product states."""
+
+import unittest
+
+import numpy as np
+
+from qiskit import ClassicalRegister, QuantumRegister, QuantumCircuit
+from qiskit import compile
+from qiskit.backends.aer.mps_simulator_py import MPSSimulatorPy
+from qiskit.backends.aer.statevector_simulator_py import StatevectorSimulatorPy
+from qiskit.backends.aer._simulatorerror import SimulatorError
+from ..common import QiskitTestCase
+
+
+class TestMPSSimulatorPy(QiskitTestCase):
+    """Test the Python simulator of matrix product states."""
+
+    def setUp(self):
+        self.seed = 88
+        self.backend = MPSSimulatorPy()
+
+    def test_statevector(self):
+        """Test that the state is the statevector of the circuit."""
+        qr = QuantumRegister(5, 'qr')
+        circuit = QuantumCircuit(qr, name='mps')
+        circuit.h(qr[0])
+        circuit.u3(0.1, 0.2, 0.3, qr[3])
+        circuit.cx(qr[0], qr[4])
+        circuit.cx(qr[3], qr[1])
+        circuit.u2(0.4, 0.5, qr[2])
+        circuit.cx(qr[2], qr[1])
+        circuit.cx(qr[1], qr[2])
+        circuit.u1(0.6, qr[4])
+        statevector_backend = StatevectorSimulatorPy()
+        expected = statevector_backend.run(
+            compile(circuit, backend=statevector_backend)).result().get_statevector('mps')
+
+        qobj = compile(circuit, backend=self.backend)
+        state, _ = self.backend.simulate(qobj.experiments[0])
+        self.assertTrue(np.allclose(state.to_statevector(), expected))
+        self.assertAlmostEqual(state.truncation_error, 0)
+
+    def test_ghz_sampling(self):
+        """Test sampling the measurements of a GHZ state on many qubits."""
+        qr = QuantumRegister(60, 'qr')
+        cr = ClassicalRegister(60, 'cr')
+        circuit = QuantumCircuit(qr, cr, name='ghz')
+        circuit.h(qr[0])
+        for qubit in range(59):
+            circuit.cx(qr[qubit], qr[qubit + 1])
+        circuit.measure(qr, cr)
+        qobj = compile(circuit, backend=self.backend, shots=1000, seed=self.seed)
+        result = self.backend.run(qobj).result()
+        counts = result.get_counts('ghz')
+        self.assertEqual(set(counts), {'0x0', hex(2 ** 60 - 1)})
+        self.assertAlmostEqual(counts['0x0'] / 1000, 0.5, delta=0.05)
+        self.assertEqual(result.results[0].metadata,
+                         {'truncation_error': 0, 'bond_dimension': 2})
+        # Same seed, same shots.
+        self.assertEqual(self.backend.run(qobj).result().get_counts('ghz'), counts)
+
+    def test_truncation(self):
+        """Test the truncation error of a limited bond dimension."""
+        qr = QuantumRegister(2, 'qr')
+        cr = ClassicalRegister(2, 'cr')
+        circuit = QuantumCircuit(qr, cr, name='bell')
+        circuit.h(qr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.measure(qr, cr)
+        qobj = compile(circuit, backend=self.backend, config={'max_bond_dimension': 1})
+        result = self.backend.run(qobj).result()
+        self.assertAlmostEqual(result.results[0].metadata['truncation_error'], 0.5)
+        self.assertEqual(result.results[0].metadata['bond_dimension'], 1)
+        self.assertEqual(len(result.get_counts('bell')), 1)
+
+    def test_unsupported_circuits(self):
+        """Test that no gate may act on a qubit after it is measured."""
+        qr = QuantumRegister(2, 'qr')
+        cr = ClassicalRegister(2, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.measure(qr[0], cr[0])
+        circuit.x(qr[0])
+        qobj = compile(circuit, backend=self.backend)
+        with self.assertRaises(SimulatorError):
+            self.backend._run_job('test', qobj)
+
+
+if __name__ == '__main__':
+    unittest.main()
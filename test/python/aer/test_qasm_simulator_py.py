@@ -5,14 +5,17 @@
 # This source code is licensed under the Apache License, Version 2.0 found in
 # the LICENSE.txt file in the root directory of this source tree.
 
-# pylint: disable=missing-docstring,redefined-builtin
+# pylint: disable=missing-docstring,redefined-builtin,unused-import
 from sys import version_info
 import unittest
 
 import numpy as np
 from qiskit import ClassicalRegister, QuantumRegister, QuantumCircuit
 from qiskit import compile
-from qiskit.backends.aer.qasm_simulator_py import QasmSimulatorPy
+import qiskit.extensions.simulator
+from qiskit.backends.aer.qasm_simulator_py import QasmSimulatorPy, _shot_chunks
+from qiskit.backends.aer.statevector_simulator_py import StatevectorSimulatorPy
+from qiskit.backends.aer._simulatorerror import SimulatorError
 
 from ..common import QiskitTestCase, bin_to_hex_keys
 
@@ -128,6 +131,309 @@ class TestAerQasmSimulatorPy(QiskitTestCase):
         self.log.info('test_teleport: relative error = %s', error)
         self.assertLess(error, 0.05)
 
+    def test_gate_kernels(self):
+        """Test the gates on a random state against their full matrices."""
+        n = 4
+        rng = np.random.RandomState(self.seed)
+        state = rng.randn(2 ** n) + 1j * rng.randn(2 ** n)
+        gate = np.array([[0.6, 0.8j], [0.8j, 0.6]])
+        backend = QasmSimulatorPy()
+        backend._number_of_qubits = n
+        for qubit in range(n):
+            backend._statevector = state.copy()
+            backend._add_qasm_single(gate, qubit)
+            # qubit 0 is the least significant bit of the amplitude indices
+            matrix = np.kron(np.kron(np.eye(2 ** (n - qubit - 1)), gate), np.eye(2 ** qubit))
+            self.assertTrue(np.allclose(backend._statevector, matrix.dot(state)))
+        for control, target in [(0, 1), (1, 0), (0, 3), (3, 1)]:
+            backend._statevector = state.copy()
+            backend._add_qasm_cx(control, target)
+            expected = [state[k ^ (1 << target)] if (k >> control) & 1 else state[k]
+                        for k in range(2 ** n)]
+            self.assertTrue(np.array_equal(backend._statevector, expected))
+
+    def test_measure_and_reset_kernels(self):
+        """Test measurement and reset on a state with a known outcome."""
+        backend = QasmSimulatorPy()
+        backend._number_of_qubits = 3
+        # qubit 1 is in state 1
+        backend._statevector = np.array([0, 0, 0.6, 0.8j, 0, 0, 0, 0])
+        backend._add_qasm_measure(1, 2)
+        self.assertEqual(backend._classical_state, 4)
+        self.assertTrue(np.allclose(backend._statevector, [0, 0, 0.6, 0.8j, 0, 0, 0, 0]))
+        backend._add_qasm_reset(1)
+        self.assertTrue(np.allclose(backend._statevector, [0.6, 0.8j, 0, 0, 0, 0, 0, 0]))
+
+    def test_sample_measure(self):
+        """Test sampling the shots of a circuit with final measurements."""
+        qr = QuantumRegister(3, 'qr')
+        cr = ClassicalRegister(3, 'cr')
+        circuit = QuantumCircuit(qr, cr, name='sampled')
+        circuit.h(qr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.x(qr[2])
+        circuit.barrier(qr)
+        circuit.measure(qr[0], cr[2])
+        circuit.measure(qr[1], cr[0])
+        circuit.measure(qr[2], cr[1])
+        qobj = compile(circuit, backend=self.backend, shots=2000, seed=self.seed)
+        self.assertTrue(QasmSimulatorPy._can_sample_measure(qobj.experiments[0].instructions))
+        result = self.backend.run(qobj).result()
+        counts = result.get_counts('sampled')
+        self.assertEqual(set(counts), {'0x2', '0x7'})
+        self.assertAlmostEqual(counts['0x7'] / 2000, 0.5, delta=0.05)
+        self.assertEqual(result.results[0].data.memory.count('0x7'), counts['0x7'])
+        # Same seed, same shots.
+        self.assertEqual(self.backend.run(qobj).result().get_counts('sampled'), counts)
+
+    def test_sample_measure_compiled(self):
+        """Test sampling the shots when compile() measures qubits early."""
+        qr = QuantumRegister(3, 'qr')
+        cr = ClassicalRegister(3, 'cr')
+        circuit = QuantumCircuit(qr, cr, name='early')
+        # The measurement of qr[0] can come before the gates on qr[1] and qr[2].
+        circuit.h(qr[0])
+        circuit.x(qr[1])
+        circuit.cx(qr[1], qr[2])
+        circuit.h(qr[2])
+        circuit.h(qr[2])
+        circuit.measure(qr, cr)
+        qobj = compile(circuit, backend=self.backend, shots=2000, seed=self.seed)
+        self.assertTrue(QasmSimulatorPy._can_sample_measure(qobj.experiments[0].instructions))
+        counts = self.backend.run(qobj).result().get_counts('early')
+        self.assertEqual(set(counts), {'0x6', '0x7'})
+        self.assertAlmostEqual(counts['0x7'] / 2000, 0.5, delta=0.05)
+
+    def test_sample_measure_disabled(self):
+        """Test that the shots are simulated one by one when they have to."""
+        qr = QuantumRegister(2, 'qr')
+        cr = ClassicalRegister(2, 'cr')
+        measure_then_gate = QuantumCircuit(qr, cr)
+        measure_then_gate.measure(qr[0], cr[0])
+        measure_then_gate.x(qr[0])
+        measure_then_gate.measure(qr[0], cr[1])
+        conditional = QuantumCircuit(qr, cr)
+        conditional.h(qr[0])
+        conditional.measure(qr[0], cr[0])
+        conditional.x(qr[1]).c_if(cr, 1)
+        conditional.measure(qr[1], cr[1])
+        reset = QuantumCircuit(qr, cr)
+        reset.reset(qr[0])
+        reset.measure(qr, cr)
+        qobj = compile([measure_then_gate, conditional, reset], backend=self.backend)
+        for experiment in qobj.experiments:
+            self.assertFalse(QasmSimulatorPy._can_sample_measure(experiment.instructions))
+
+    def test_batch(self):
+        """Test that a parameter sweep is batched, with the same results."""
+        qr = QuantumRegister(3, 'qr')
+        cr = ClassicalRegister(3, 'cr')
+        circuits = []
+        for index in range(4):
+            circuit = QuantumCircuit(qr, cr, name='sweep{}'.format(index))
+            circuit.h(qr[0])
+            circuit.u3(0.3 * index, 0.1, 0.2, qr[1])
+            circuit.cx(qr[0], qr[2])
+            circuit.u1(0.5 * index, qr[2])
+            circuit.measure(qr, cr)
+            circuits.append(circuit)
+        other = QuantumCircuit(qr, cr, name='other')
+        other.x(qr[1])
+        other.measure(qr, cr)
+        qobj = compile(circuits + [other], backend=self.backend, shots=500, seed=self.seed)
+        result = self.backend.run(qobj).result()
+        # The job runs in a worker process, so the state read by _batches()
+        # is set here.
+        self.backend._shots = qobj.config.shots
+        self.backend._qobj_config = qobj.config
+        self.assertEqual(self.backend._batches(qobj.experiments), [[0, 1, 2, 3], [4]])
+        for index, circuit in enumerate(circuits):
+            single = compile(circuit, backend=self.backend, shots=500, seed=self.seed)
+            self.assertEqual(result.get_counts(circuit),
+                             self.backend.run(single).result().get_counts(circuit),
+                             msg='circuit {}'.format(index))
+        self.assertEqual(result.get_counts('other'), {'0x2': 500})
+
+    def test_batch_disabled(self):
+        """Test that the experiments that cannot be batched are run one by one."""
+        qr = QuantumRegister(2, 'qr')
+        cr = ClassicalRegister(2, 'cr')
+        conditional = QuantumCircuit(qr, cr)
+        conditional.h(qr[0])
+        conditional.measure(qr[0], cr[0])
+        conditional.x(qr[1]).c_if(cr, 1)
+        conditional.measure(qr[1], cr[1])
+        measure_then_gate = QuantumCircuit(qr, cr)
+        measure_then_gate.measure(qr[0], cr[0])
+        measure_then_gate.x(qr[0])
+        measure_then_gate.measure(qr[0], cr[1])
+        qobj = compile([conditional, conditional, measure_then_gate, measure_then_gate],
+                       backend=self.backend)
+        self.backend.run(qobj).result()
+        self.backend._shots = qobj.config.shots
+        self.backend._qobj_config = qobj.config
+        self.assertEqual(self.backend._batches(qobj.experiments), [[0], [1], [2], [3]])
+
+    def test_batch_statevector(self):
+        """Test that batched statevectors are those of the experiments run alone."""
+        backend = StatevectorSimulatorPy()
+        qr = QuantumRegister(3, 'qr')
+        circuits = []
+        for index in range(3):
+            circuit = QuantumCircuit(qr, name='sweep{}'.format(index))
+            circuit.h(qr[1])
+            circuit.cx(qr[1], qr[0])
+            circuit.u3(0.2 * index, 0.4 * index, 0.1, qr[0])
+            circuit.snapshot('1')
+            circuit.u2(0.3, 0.7 * index, qr[2])
+            circuits.append(circuit)
+        result = backend.run(compile(circuits, backend=backend)).result()
+        for circuit in circuits:
+            single = backend.run(compile(circuit, backend=backend)).result()
+            self.assertTrue(np.array_equal(result.get_statevector(circuit),
+                                           single.get_statevector(circuit)))
+            self.assertTrue(np.array_equal(
+                result.data(circuit)['snapshots']['1']['statevector'][0],
+                single.data(circuit)['snapshots']['1']['statevector'][0]))
+
+    def test_parallel_experiments(self):
+        """Test that the results do not depend on the number of workers."""
+        qr = QuantumRegister(2, 'qr')
+        cr = ClassicalRegister(2, 'cr')
+        sampled = QuantumCircuit(qr, cr, name='sampled')
+        sampled.h(qr[0])
+        sampled.cx(qr[0], qr[1])
+        sampled.measure(qr, cr)
+        shot_by_shot = QuantumCircuit(qr, cr, name='shot_by_shot')
+        shot_by_shot.h(qr[0])
+        shot_by_shot.measure(qr[0], cr[0])
+        shot_by_shot.x(qr[1]).c_if(cr, 1)
+        shot_by_shot.measure(qr[1], cr[1])
+        circuits = [sampled, shot_by_shot]
+
+        results = []
+        for max_parallel_experiments in [1, 2]:
+            qobj = compile(circuits, backend=self.backend, shots=300, seed=self.seed,
+                           config={'max_parallel_experiments': max_parallel_experiments,
+                                   'max_parallel_shots': 3})
+            results.append(self.backend.run(qobj).result())
+        for circuit in circuits:
+            self.assertEqual(results[0].get_counts(circuit), results[1].get_counts(circuit))
+            self.assertEqual(results[0].data(circuit)['memory'],
+                             results[1].data(circuit)['memory'])
+        self.assertEqual(set(results[1].get_counts('shot_by_shot')), {'0x0', '0x3'})
+        self.assertEqual(len(results[1].data('shot_by_shot')['memory']), 300)
+
+    def test_shot_chunks(self):
+        """Test splitting the shots of an experiment into chunks."""
+        self.assertEqual(_shot_chunks(10, 3), [4, 3, 3])
+        self.assertEqual(_shot_chunks(2, 4), [1, 1])
+
+    def test_single_precision(self):
+        """Test simulating in single precision."""
+        backend = StatevectorSimulatorPy()
+        qr = QuantumRegister(3, 'qr')
+        circuit = QuantumCircuit(qr, name='single')
+        circuit.h(qr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.u3(0.1, 0.2, 0.3, qr[2])
+        expected = backend.run(compile(circuit, backend=backend)).result()
+        qobj = compile(circuit, backend=backend, config={'precision': 'single'})
+        statevector = backend.run(qobj).result().get_statevector('single')
+        self.assertEqual(statevector.dtype, np.complex64)
+        self.assertTrue(np.allclose(statevector, expected.get_statevector('single'), atol=1e-6))
+
+        qobj = compile(circuit, backend=backend, config={'precision': 'half'})
+        with self.assertRaises(SimulatorError):
+            backend._run_job('test', qobj)
+
+    def test_single_precision_snapshots(self):
+        """Test that single precision snapshots are returned by the jobs."""
+        qr = QuantumRegister(2, 'qr')
+        cr = ClassicalRegister(2, 'cr')
+        circuit = QuantumCircuit(qr, cr, name='snapshots')
+        circuit.h(qr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.snapshot('1')
+        circuit.measure(qr, cr)
+        qobj = compile(circuit, backend=self.backend, shots=10, seed=self.seed,
+                       config={'precision': 'single'})
+        result = self.backend.run(qobj).result()
+        self.assertTrue(result.success)
+        snapshots = result.data('snapshots')['snapshots']['1']['statevector']
+        self.assertEqual(len(snapshots), 10)
+        self.assertEqual(snapshots[0].dtype, np.complex64)
+        self.assertTrue(np.allclose(snapshots[0], [1 / np.sqrt(2), 0, 0, 1 / np.sqrt(2)],
+                                    atol=1e-6))
+        self.assertEqual(set(result.get_counts('snapshots')), {'0x0', '0x3'})
+
+    def test_memory_budget(self):
+        """Test that an experiment larger than max_memory_mb is not simulated."""
+        qr = QuantumRegister(20, 'qr')
+        cr = ClassicalRegister(1, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0])
+        circuit.measure(qr[0], cr[0])
+        # The statevector of 2**20 amplitudes takes 16 MB.
+        qobj = compile(circuit, backend=self.backend, config={'max_memory_mb': 16})
+        with self.assertRaises(SimulatorError):
+            self.backend._run_job('test', qobj)
+        # It takes 8 MB in single precision.
+        qobj = compile(circuit, backend=self.backend,
+                       config={'max_memory_mb': 32, 'precision': 'single'})
+        self.assertEqual(self.backend.run(qobj).result().success, True)
+
+    def test_sparse(self):
+        """Test a sparse statevector on more qubits than a dense one could hold."""
+        qr = QuantumRegister(40, 'qr')
+        cr = ClassicalRegister(40, 'cr')
+        circuit = QuantumCircuit(qr, cr, name='sparse')
+        circuit.h(qr[0])
+        for qubit in range(39):
+            circuit.cx(qr[qubit], qr[qubit + 1])
+        circuit.x(qr[5])
+        circuit.measure(qr, cr)
+        qobj = compile(circuit, backend=self.backend, shots=200, seed=self.seed,
+                       config={'sparse': True})
+        counts = self.backend.run(qobj).result().get_counts('sparse')
+        self.assertEqual(set(counts), {hex(1 << 5), hex((2 ** 40 - 1) ^ (1 << 5))})
+
+    def test_sparse_statevector(self):
+        """Test that sparse and dense statevectors are the same."""
+        backend = StatevectorSimulatorPy()
+        qr = QuantumRegister(4, 'qr')
+        circuit = QuantumCircuit(qr, name='sparse')
+        circuit.x(qr[1])
+        circuit.u1(0.3, qr[1])
+        circuit.cx(qr[1], qr[3])
+        circuit.h(qr[2])
+        circuit.u3(0.1, 0.2, 0.3, qr[3])
+        circuit.cx(qr[2], qr[0])
+        expected = backend.run(compile(circuit, backend=backend)).result()
+        # With a threshold of 1/8, the state becomes dense on the u3 gate.
+        for threshold in [1, 1 / 8]:
+            qobj = compile(circuit, backend=backend,
+                           config={'sparse': True, 'sparse_threshold': threshold})
+            result = backend.run(qobj).result()
+            self.assertTrue(np.allclose(result.get_statevector('sparse'),
+                                        expected.get_statevector('sparse')))
+
+    def test_sparse_measure_reset(self):
+        """Test measurements and resets of a sparse statevector."""
+        qr = QuantumRegister(2, 'qr')
+        cr = ClassicalRegister(2, 'cr')
+        circuit = QuantumCircuit(qr, cr, name='sparse')
+        circuit.h(qr[0])
+        circuit.measure(qr[0], cr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.reset(qr[0])
+        circuit.measure(qr, cr)
+        qobj = compile(circuit, backend=self.backend, shots=500, seed=self.seed,
+                       config={'sparse': True})
+        counts = self.backend.run(qobj).result().get_counts('sparse')
+        self.assertEqual(set(counts), {'0x0', '0x2'})
+        self.assertAlmostEqual(counts['0x2'] / 500, 0.5, delta=0.08)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -9,11 +9,15 @@
 # pylint: disable=redefined-builtin
 
 import unittest
+from unittest import mock
+
 import numpy as np
 
 from qiskit import ClassicalRegister, QuantumRegister, QuantumCircuit
 from qiskit import compile
+from qiskit.qobj import QobjInstruction
 from qiskit.backends.aer.unitary_simulator_py import UnitarySimulatorPy
+from qiskit.backends.aer._simulatorerror import SimulatorError
 from ..common import QiskitTestCase
 
 
@@ -58,6 +62,56 @@ class AerUnitarySimulatorPyTest(QiskitTestCase):
         for norm in norms:
             self.assertAlmostEqual(norm, 8)
 
+    def test_single_precision(self):
+        """Test the unitary in single precision."""
+        circuits = self._test_circuits()
+        expected = self.backend.run(compile(circuits, backend=self.backend)).result()
+        qobj = compile(circuits, backend=self.backend, config={'precision': 'single'})
+        result = self.backend.run(qobj).result()
+        for circuit in circuits:
+            self.assertTrue(np.allclose(result.get_unitary(circuit),
+                                        expected.get_unitary(circuit), atol=1e-6))
+
+    def test_memory_budget(self):
+        """Test that an experiment larger than max_memory_mb is not simulated."""
+        qr = QuantumRegister(10, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.h(qr[0])
+        # The 1024 x 1024 unitary takes 16 MB.
+        qobj = compile(circuit, backend=self.backend, config={'max_memory_mb': 10})
+        with self.assertRaises(SimulatorError):
+            self.backend._run_job('test', qobj)
+
+    def test_shared_prefix(self):
+        """Test that the prefix shared by experiments is computed once."""
+        qr = QuantumRegister(3, 'qr')
+        circuits = []
+        for index in range(4):
+            circuit = QuantumCircuit(qr, name='prefix{}'.format(index))
+            circuit.h(qr)
+            circuit.cx(qr[0], qr[1])
+            circuit.u3(0.1, 0.2, 0.3, qr[2])
+            circuit.cx(qr[1], qr[2])
+            circuits.append(circuit)
+        qobj = compile(circuits, backend=self.backend)
+        # Three experiments end with a different gate, the last one has only
+        # the prefix.
+        for index, qubit in enumerate([2, 0, 1]):
+            qobj.experiments[index].instructions.append(
+                QobjInstruction(name='u1', qubits=[qubit], params=[0.4 * (index + 1)]))
+        prefix_length = len(qobj.experiments[3].instructions)
+        expected = [self.backend.run_experiment(experiment) for experiment in qobj.experiments]
+
+        with mock.patch.object(self.backend, '_add_unitary',
+                               wraps=self.backend._add_unitary) as add_unitary:
+            # In this process, as the job would pickle the mock for its worker.
+            result = self.backend._run_job('test', qobj)
+        self.assertEqual(add_unitary.call_count, prefix_length + 3)
+        for circuit, expected_result in zip(circuits, expected):
+            unitary = expected_result['data']['unitary']
+            self.assertTrue(np.allclose(result.get_unitary(circuit),
+                                        unitary[..., 0] + 1j * unitary[..., 1]))
+
     def _test_circuits(self):
         """Return test circuits for unitary simulator"""
         qr = QuantumRegister(3)
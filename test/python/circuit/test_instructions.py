@@ -17,6 +17,7 @@ from qiskit import QuantumRegister, ClassicalRegister
 from qiskit._instruction import Instruction
 from qiskit.extensions.standard.h import HGate
 from qiskit.extensions.standard.cx import CnotGate
+from qiskit.extensions.standard.u3 import U3Gate
 from ..common import QiskitTestCase
 
 
@@ -45,6 +46,35 @@ class TestInstructions(QiskitTestCase):
         self.assertFalse(HGate(qr[0]) == CnotGate(qr[0], qr[1]))
         self.assertFalse(hop1 == HGate(qr[2]))
 
+    def test_decompositions_lazy(self):
+        """Test the decompositions are not built by the constructor."""
+        qr = QuantumRegister(2)
+        gate = CnotGate(qr[0], qr[1])
+        self.assertIsNone(gate._decomposition_rules)
+        self.assertEqual(len(gate._decompositions), 1)
+        self.assertIsNone(gate._decomposition_rules)
+        self.assertEqual(Instruction('barrier', [], [qr[0]], [])._decompositions, [])
+
+    def test_decompositions_shared(self):
+        """Test the decompositions are shared by gates of the same type and parameters."""
+        qr = QuantumRegister(2)
+        self.assertIs(HGate(qr[0])._decompositions, HGate(qr[1])._decompositions)
+        self.assertIs(U3Gate(0.1, 0.2, 0.3, qr[0])._decompositions,
+                      U3Gate(0.1, 0.2, 0.3, qr[1])._decompositions)
+        self.assertIsNot(U3Gate(0.1, 0.2, 0.3, qr[0])._decompositions,
+                         U3Gate(0.1, 0.2, 0.4, qr[0])._decompositions)
+        self.assertIsNot(U3Gate(1, 0, 0, qr[0])._decompositions,
+                         U3Gate(1.0, 0, 0, qr[0])._decompositions)
+
+    def test_decompositions_follow_params(self):
+        """Test the decompositions follow the changes of the parameters."""
+        qr = QuantumRegister(1)
+        gate = U3Gate(0.1, 0.2, 0.3, qr[0])
+        gate.inverse()
+        decomposition = gate._decompositions[0]
+        ubase = decomposition.multi_graph.nodes[decomposition.get_op_nodes().pop()]['op']
+        self.assertEqual(ubase.param, gate.param)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""Tests for the counts of integer outcomes."""
+
+import pickle
+import unittest
+import unittest.mock
+
+import numpy as np
+
+from qiskit import QiskitError
+from qiskit.result import IntegerCounts
+from qiskit.result.models import ExperimentResultData
+from .common import QiskitTestCase
+
+
+class TestIntegerCounts(QiskitTestCase):
+    """Test IntegerCounts."""
+
+    def setUp(self):
+        # Outcomes of 3 bits: 0b001 twice, 0b110 three times, 0b111 once.
+        self.counts = IntegerCounts.from_memory([1, 6, 1, 6, 7, 6], 3)
+
+    def test_from_memory(self):
+        """Test counting the outcomes of each shot."""
+        self.assertEqual(self.counts.outcomes.tolist(), [1, 6, 7])
+        self.assertEqual(self.counts.counts.tolist(), [2, 3, 1])
+        self.assertEqual(self.counts.shots, 6)
+        self.assertEqual(self.counts.hex_dict(), {'0x1': 2, '0x6': 3, '0x7': 1})
+        self.assertEqual(self.counts.bitstring_dict(), {'001': 2, '110': 3, '111': 1})
+
+    def test_from_dict(self):
+        """Test building the counts from hexadecimal and bitstring keys."""
+        self.assertEqual(IntegerCounts.from_dict({'0x6': 3, '0x1': 2, '0x7': 1}, 3),
+                         self.counts)
+        self.assertEqual(IntegerCounts.from_dict({'110': 3, '001': 2, '111': 1}),
+                         self.counts)
+        self.assertEqual(IntegerCounts.from_dict({'1 10': 3, '0 01': 2, '1 11': 1}),
+                         self.counts)
+
+    def test_dense(self):
+        """Test the counts of every outcome."""
+        self.assertEqual(self.counts.dense().tolist(), [0, 2, 0, 0, 0, 0, 3, 1])
+
+    def test_marginal(self):
+        """Test the counts of some of the bits."""
+        self.assertEqual(self.counts.marginal([0]).hex_dict(), {'0x0': 3, '0x1': 3})
+        self.assertEqual(self.counts.marginal([2, 1]).bitstring_dict(),
+                         {'00': 2, '11': 4})
+        self.assertEqual(self.counts.marginal([0, 2]).bitstring_dict(),
+                         {'01': 2, '10': 3, '11': 1})
+        with self.assertRaises(QiskitError):
+            self.counts.marginal([3])
+
+    def test_reorder(self):
+        """Test permuting the bits of the outcomes."""
+        self.assertEqual(self.counts.reorder([2, 1, 0]).bitstring_dict(),
+                         {'100': 2, '011': 3, '111': 1})
+        with self.assertRaises(QiskitError):
+            self.counts.reorder([0, 0, 1])
+
+    def test_split(self):
+        """Test the counts of each register."""
+        registers = self.counts.split([1, 2])
+        self.assertEqual(len(registers), 2)
+        self.assertEqual(registers[0].bitstring_dict(), {'0': 3, '1': 3})
+        self.assertEqual(registers[1].bitstring_dict(), {'00': 2, '11': 4})
+        self.assertEqual(self.counts.bitstring_dict([1, 2]),
+                         {'00 1': 2, '11 0': 3, '11 1': 1})
+        with self.assertRaises(QiskitError):
+            self.counts.split([1, 1])
+
+    def test_many_bits(self):
+        """Test outcomes of more bits than fit in int64."""
+        outcome = (1 << 70) | 5
+        counts = IntegerCounts.from_memory([outcome, 5, outcome], 71)
+        self.assertEqual(counts.hex_dict(), {hex(outcome): 2, '0x5': 1})
+        self.assertEqual(counts.marginal([0, 70]).bitstring_dict(), {'11': 2, '01': 1})
+
+    def test_large_marginal(self):
+        """Test the marginal counts of random outcomes against a dict count."""
+        rng = np.random.RandomState(42)
+        memory = rng.randint(0, 1 << 24, size=5000)
+        counts = IntegerCounts.from_memory(memory.tolist(), 24)
+        expected = {}
+        for outcome in memory.tolist():
+            key = ((outcome >> 3) & 1) | ((outcome >> 20) & 1) << 1
+            expected[key] = expected.get(key, 0) + 1
+        marginal = counts.marginal([3, 20])
+        self.assertEqual(dict(zip(marginal.outcomes.tolist(), marginal.counts.tolist())),
+                         expected)
+
+
+class TestExperimentResultDataCounts(QiskitTestCase):
+    """Test the data of experiments with counts of integer outcomes."""
+
+    def setUp(self):
+        self.integer_counts = IntegerCounts.from_memory([1, 6, 1], 3)
+        self.data = ExperimentResultData.from_integer_counts(
+            self.integer_counts, {'memory': ['0x1', '0x6', '0x1']})
+
+    def test_lazy_counts(self):
+        """Test that the counts are formatted on first access."""
+        self.assertIn('counts', self.data)
+        self.assertNotIn('counts', vars(self.data))
+        self.assertEqual(self.data.counts.to_dict(), {'0x1': 2, '0x6': 1})
+        self.assertEqual(self.data.to_dict()['counts'], {'0x1': 2, '0x6': 1})
+        self.assertIs(self.data.integer_counts(), self.integer_counts)
+
+    def test_integer_counts_from_dict(self):
+        """Test getting the integer counts of data with counts as a dict."""
+        data = ExperimentResultData.from_dict({'counts': {'0x1': 2, '0x6': 1},
+                                               'memory': ['0x1', '0x6', '0x1']})
+        self.assertEqual(data.integer_counts(3), self.integer_counts)
+        self.assertEqual(data, self.data)
+
+    def test_pickle(self):
+        """Test that pickling keeps the integer counts."""
+        data = pickle.loads(pickle.dumps(self.data))
+        self.assertEqual(data, self.data)
+        self.assertEqual(data.integer_counts(), self.integer_counts)
+
+    def test_pickle_without_validation(self):
+        """Test that unpickling does not validate the data again."""
+        with unittest.mock.patch.object(ExperimentResultData.shallow_schema,
+                                        'validate') as validate:
+            data = pickle.loads(pickle.dumps(self.data))
+        validate.assert_not_called()
+        self.assertEqual(data, self.data)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
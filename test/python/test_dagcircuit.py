@@ -115,6 +115,20 @@ class TestDagOperations(QiskitTestCase):
         self.assertEqual(len(self.dag.multi_graph.nodes), 16)
         self.assertEqual(len(self.dag.multi_graph.edges), 17)
 
+    def test_generation(self):
+        """Modifying the dag increases its generation, reading it does not."""
+        generation = self.dag.generation
+        self.dag.apply_operation_back(CnotGate(self.qubit0, self.qubit1))
+        self.assertGreater(self.dag.generation, generation)
+
+        generation = self.dag.generation
+        self.dag.get_op_nodes()
+        self.dag.depth()
+        self.assertEqual(self.dag.generation, generation)
+
+        self.dag._remove_op_node(self.dag.get_op_nodes().pop())
+        self.assertGreater(self.dag.generation, generation)
+
     def test_apply_operation_front(self):
         """The apply_operation_front() method"""
         self.dag.apply_operation_back(HGate(self.qubit0))
@@ -182,6 +196,47 @@ class TestDagOperations(QiskitTestCase):
         self.assertEqual([9, 10, 7, 8, 5, 3, 1, 11, 13, 4, 12, 14, 15, 6, 2],
                          [i for i in named_nodes])
 
+    def test_substitute_operations_one(self):
+        """The substitute_operations_one() method."""
+        self.dag.apply_operation_back(HGate(self.qubit0))
+        self.dag.apply_operation_back(CnotGate(self.qubit0, self.qubit1))
+        self.dag.apply_operation_back(HGate(self.qubit1))
+        cx_node = self.dag.get_named_nodes('cx').pop()
+        self.dag.substitute_operations_one(cx_node, [
+            (HGate(self.qubit1), [self.qubit1], []),
+            (CnotGate(self.qubit1, self.qubit0), [self.qubit1, self.qubit0], []),
+            (HGate(self.qubit1), [self.qubit1], [])])
+
+        expected = DAGCircuit()
+        expected.add_qreg(self.dag.qregs['qr'])
+        expected.add_creg(self.dag.cregs['cr'])
+        expected.add_basis_element('h', 1, 0, 0)
+        expected.add_basis_element('cx', 2, 0, 0)
+        expected.apply_operation_back(HGate(self.qubit0))
+        expected.apply_operation_back(HGate(self.qubit1))
+        expected.apply_operation_back(CnotGate(self.qubit1, self.qubit0))
+        expected.apply_operation_back(HGate(self.qubit1))
+        expected.apply_operation_back(HGate(self.qubit1))
+        self.assertEqual(self.dag, expected)
+
+    def test_substitute_operations_one_condition(self):
+        """The substituted operations keep the condition of the node."""
+        self.dag.apply_operation_back(XGate(self.qubit0), condition=self.condition)
+        x_node = self.dag.get_named_nodes('x').pop()
+        self.dag.substitute_operations_one(x_node, [(HGate(self.qubit0), [self.qubit0], []),
+                                                    (HGate(self.qubit0), [self.qubit0], [])])
+        conditions = [self.dag.multi_graph.nodes[node]['condition']
+                      for node in self.dag.get_op_nodes()]
+        self.assertEqual(conditions, [self.condition, self.condition])
+        self.assertEqual(len(self.dag.multi_graph.edges), 11)
+
+    def test_substitute_operations_one_outside_wires(self):
+        """The substituted operations must act on the wires of the node."""
+        self.dag.apply_operation_back(HGate(self.qubit0))
+        h_node = self.dag.get_named_nodes('h').pop()
+        self.assertRaises(DAGCircuitError, self.dag.substitute_operations_one, h_node,
+                          [(HGate(self.qubit1), [self.qubit1], [])])
+
 
 class TestDagLayers(QiskitTestCase):
     """Test finding layers on the dag"""
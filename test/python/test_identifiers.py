@@ -33,7 +33,7 @@ class TestQobjIdentifiers(QiskitTestCase):
 
     def test_aer_qasm_simulator_py(self):
         backend = Aer.get_backend('qasm_simulator_py')
-        qobj = compile(self.circuits, backend=backend)
+        qobj = compile(self.circuits, backend=backend, compiled_circuit_qasm=True)
         exp = qobj.experiments[0]
         c_qasm = exp.header.compiled_circuit_qasm
         self.assertIn(self.qr_name, map(lambda x: x[0], exp.header.qubit_labels))
@@ -44,7 +44,7 @@ class TestQobjIdentifiers(QiskitTestCase):
     @requires_cpp_simulator
     def test_aer_clifford_simulator(self):
         backend = Aer.get_backend('clifford_simulator')
-        qobj = compile(self.circuits, backend=backend)
+        qobj = compile(self.circuits, backend=backend, compiled_circuit_qasm=True)
         exp = qobj.experiments[0]
         c_qasm = exp.header.compiled_circuit_qasm
         self.assertIn(self.qr_name, map(lambda x: x[0], exp.header.qubit_labels))
@@ -55,7 +55,7 @@ class TestQobjIdentifiers(QiskitTestCase):
     @requires_cpp_simulator
     def test_aer_qasm_simulator(self):
         backend = Aer.get_backend('qasm_simulator')
-        qobj = compile(self.circuits, backend=backend)
+        qobj = compile(self.circuits, backend=backend, compiled_circuit_qasm=True)
         exp = qobj.experiments[0]
         c_qasm = exp.header.compiled_circuit_qasm
         self.assertIn(self.qr_name, map(lambda x: x[0], exp.header.qubit_labels))
@@ -65,7 +65,7 @@ class TestQobjIdentifiers(QiskitTestCase):
 
     def test_aer_unitary_simulator_py(self):
         backend = Aer.get_backend('unitary_simulator_py')
-        qobj = compile(self.circuits, backend=backend)
+        qobj = compile(self.circuits, backend=backend, compiled_circuit_qasm=True)
         exp = qobj.experiments[0]
         c_qasm = exp.header.compiled_circuit_qasm
         self.assertIn(self.qr_name, map(lambda x: x[0], exp.header.qubit_labels))
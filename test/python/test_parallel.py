@@ -9,7 +9,7 @@
 import os
 import time
 
-from qiskit.transpiler._parallel import parallel_map
+from qiskit.transpiler._parallel import parallel_map, parallel_min_cost, _chunks
 from .common import QiskitTestCase
 
 
@@ -20,6 +20,12 @@ def _parfunc(x):
     return x
 
 
+def _square(x):
+    """Function for testing parallel_map with costs
+    """
+    return x * x
+
+
 class TestParallel(QiskitTestCase):
     """A class for testing parallel_map functionality.
     """
@@ -32,3 +38,29 @@ class TestParallel(QiskitTestCase):
         """Test parallel_map """
         ans = parallel_map(_parfunc, list(range(10)))
         self.assertEqual(ans, list(range(10)))
+
+    def test_parallel_with_costs(self):
+        """Test parallel_map keeps the order of values with unbalanced costs"""
+        values = list(range(20))
+        ans = parallel_map(_square, values, costs=[1] * 10 + [10] * 10)
+        self.assertEqual(ans, [x * x for x in values])
+
+    def test_chunks(self):
+        """Test the chunks cover the values in order, balancing their costs"""
+        chunks = _chunks(10, 3, costs=[1, 1, 1, 1, 1, 1, 1, 1, 8, 8])
+        self.assertEqual([index for chunk in chunks for index in chunk], list(range(10)))
+        self.assertLessEqual(len(chunks), 3)
+        self.assertEqual(list(chunks[-1]), [9])
+
+    def test_chunks_more_than_values(self):
+        """Test there are never more chunks than values"""
+        chunks = _chunks(3, 8)
+        self.assertEqual([list(chunk) for chunk in chunks], [[0], [1], [2]])
+
+    def test_parallel_min_cost_env(self):
+        """Test the minimum parallel cost can be set from the environment"""
+        os.environ['QISKIT_PARALLEL_MIN_COST'] = '12.5'
+        try:
+            self.assertEqual(parallel_min_cost(), 12.5)
+        finally:
+            del os.environ['QISKIT_PARALLEL_MIN_COST']
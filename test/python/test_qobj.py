@@ -8,14 +8,24 @@
 # pylint: disable=redefined-builtin
 
 """QOBj test."""
+import io
+import json
+import os
+import pickle
+import tempfile
 import uuid
 import unittest
+from unittest.mock import patch
 import copy
 import jsonschema
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
-from qiskit import compile, SchemaValidationError, Aer
-from qiskit.qobj import Qobj, QobjConfig, QobjExperiment, QobjInstruction
+from qiskit import compile, SchemaValidationError, Aer, QiskitError
+from qiskit.qobj import Qobj, QobjConfig, QobjExperiment, QobjInstruction, QobjItem
 from qiskit.qobj import QobjHeader, validate_qobj_against_schema
+from qiskit.qobj import QobjExperimentHeader, QobjValidationError
+from qiskit.qobj import iterencode_qobj, dump_qobj, load_qobj
+from qiskit.qobj import _stream
+from qiskit.qobj._validation import VALIDATION_MODES
 from qiskit.backends.aer import aerjob
 from qiskit.backends.ibmq import ibmqjob
 from ._mockutils import FakeBackend
@@ -67,6 +77,49 @@ class TestQobj(QiskitTestCase):
         except jsonschema.ValidationError as validation_error:
             self.fail(str(validation_error))
 
+    def test_validation_modes(self):
+        """Test the validation of Qobjs in the different modes."""
+        for mode in VALIDATION_MODES:
+            with self.subTest(mode=mode):
+                validate_qobj_against_schema(self.valid_qobj, mode)
+        for mode in ('full', 'fast'):
+            with self.subTest(mode=mode):
+                with self.assertRaises(SchemaValidationError):
+                    validate_qobj_against_schema(self.bad_qobj, mode)
+        validate_qobj_against_schema(self.bad_qobj, 'off')
+        with self.assertRaises(QiskitError):
+            validate_qobj_against_schema(self.valid_qobj, 'quick')
+
+    def test_fast_validation_errors(self):
+        """Test the invalid instructions rejected by the fast validation."""
+        # Instructions, invalid field and whether the schema rejects them.
+        invalid_instructions = [
+            (QobjInstruction(name='u2', qubits=[1], params=[0.4]), 'params', True),
+            (QobjInstruction(name='cx', qubits=[1]), 'qubits', True),
+            (QobjInstruction(name='measure', qubits=[0]), 'name', True),
+            (QobjInstruction(name='x', qubits=[-1]), 'qubits', False),
+            (QobjInstruction(name='x', qubits=[True]), 'qubits', False),
+            (QobjInstruction(name='x', qubits=[0], conditional=QobjItem(mask='0x1')),
+             'conditional', False)
+        ]
+        for instruction, field, schema_rejects in invalid_instructions:
+            with self.subTest(instruction=instruction):
+                self.valid_qobj.experiments[0].instructions[1] = instruction
+                with self.assertRaisesRegex(SchemaValidationError,
+                                            r'experiments\[0\]\.instructions\[1\]\.' + field):
+                    validate_qobj_against_schema(self.valid_qobj, 'fast')
+                if schema_rejects:
+                    with self.assertRaises(SchemaValidationError):
+                        validate_qobj_against_schema(self.valid_qobj, 'full')
+
+    def test_validation_mode_from_environment(self):
+        """Test the default validation mode is read from the environment."""
+        with patch.dict(os.environ, {'QISKIT_QOBJ_VALIDATION': 'off'}):
+            validate_qobj_against_schema(self.bad_qobj)
+        with patch.dict(os.environ, {'QISKIT_QOBJ_VALIDATION': 'fast'}):
+            with self.assertRaises(SchemaValidationError):
+                validate_qobj_against_schema(self.bad_qobj)
+
     @unittest.expectedFailure
     # expected to fail until _qobjectify_item is updated (see TODO_ on line 77 of _qobj.py)
     def test_from_dict_per_class(self):
@@ -148,6 +201,129 @@ class TestQobj(QiskitTestCase):
         self.assertTrue(qobj2.experiments[0].config.xvals == ['only for qobj2', 2, 3, 4])
         self.assertTrue(qobj2.experiments[1].config.xvals == ['only for qobj2', 2, 3, 4])
 
+    def test_instruction_slots(self):
+        """The common fields of the instructions are kept in slots."""
+        instruction = QobjInstruction(name='u1', qubits=[1], params=[0.4])
+        self.assertEqual(instruction.as_dict(),
+                         {'name': 'u1', 'qubits': [1], 'params': [0.4]})
+        self.assertFalse(hasattr(instruction, 'memory'))
+        self.assertEqual(vars(instruction), {})
+
+        instruction.texparams = ['0.4']
+        self.assertEqual(vars(instruction), {'texparams': ['0.4']})
+        self.assertEqual(instruction.as_dict()['texparams'], ['0.4'])
+        self.assertEqual(instruction, QobjItem(name='u1', qubits=[1], params=[0.4],
+                                               texparams=['0.4']))
+
+    def test_instruction_round_trip(self):
+        """The instructions are rebuilt from their dict, pickle and copy."""
+        instruction_dict = {'name': 'x', 'qubits': [0], 'memory': [], 'params': [],
+                            'conditional': {'type': 'equals', 'mask': '0x1', 'val': '0x1'},
+                            'texparams': []}
+        instruction = QobjInstruction.from_dict(instruction_dict)
+        self.assertIsInstance(instruction.conditional, QobjItem)
+        self.assertEqual(instruction.as_dict(), instruction_dict)
+        for copied in (pickle.loads(pickle.dumps(instruction)),
+                       copy.deepcopy(instruction), copy.copy(instruction)):
+            self.assertIsInstance(copied, QobjInstruction)
+            self.assertEqual(copied, instruction)
+            self.assertEqual(copied.as_dict(), instruction_dict)
+
+
+class TestQobjStream(QiskitTestCase):
+    """Tests for the streaming JSON serialization of Qobj."""
+
+    def setUp(self):
+        self.qobj = Qobj(
+            qobj_id='12345',
+            header=QobjHeader(backend_name='qasm_simulator_py'),
+            config=QobjConfig(shots=1024, memory_slots=2, max_credits=10),
+            experiments=[
+                QobjExperiment(
+                    instructions=[
+                        QobjInstruction(name='u1', qubits=[1], params=[0.4 + i]),
+                        QobjInstruction(name='u2', qubits=[1], params=[0.4, 0.2]),
+                        QobjInstruction(name='measure', qubits=[1], memory=[0])
+                    ],
+                    header=QobjExperimentHeader(name='experiment%d' % i),
+                    config=QobjItem(memory_slots=2, n_qubits=2))
+                for i in range(3)
+            ]
+        )
+        # Read the streams in small blocks, for splitting the values.
+        read_size = _stream.READ_SIZE
+        _stream.READ_SIZE = 5
+        self.addCleanup(setattr, _stream, 'READ_SIZE', read_size)
+
+    def _qobj_file(self, qobj_dict=None):
+        """Return the path of a file with the JSON representation of the Qobj."""
+        handle, path = tempfile.mkstemp(suffix='.json')
+        self.addCleanup(os.remove, path)
+        with os.fdopen(handle, 'w') as fp:
+            if qobj_dict is None:
+                dump_qobj(self.qobj, fp)
+            else:
+                json.dump(qobj_dict, fp)
+        return path
+
+    def test_iterencode(self):
+        """The encoded Qobj is the JSON representation of its dict."""
+        encoded = ''.join(iterencode_qobj(self.qobj))
+        self.assertEqual(json.loads(encoded), self.qobj.as_dict())
+
+    def test_load(self):
+        """A dumped Qobj is loaded back."""
+        stream = io.StringIO()
+        dump_qobj(self.qobj, stream)
+        stream.seek(0)
+        qobj = load_qobj(stream)
+        self.assertEqual(qobj, self.qobj)
+        self.assertIsInstance(qobj.config, QobjConfig)
+        self.assertIsInstance(qobj.experiments[0], QobjExperiment)
+        self.assertIsInstance(qobj.experiments[0].instructions[0], QobjInstruction)
+        self.assertEqual(qobj.experiments[2].header.name, 'experiment2')
+
+    def test_load_invalid(self):
+        """Loading a stream that is not a Qobj raises an error."""
+        self.assertRaises(QobjValidationError, load_qobj, io.StringIO('[1, 2]'))
+        self.assertRaises(QobjValidationError, load_qobj,
+                          io.StringIO('{"qobj_id": "12345", "experiments": []}'))
+        self.assertRaises(json.JSONDecodeError, load_qobj,
+                          io.StringIO('{"qobj_id": "12345", "experiments": [{'))
+
+    def test_from_file(self):
+        """The experiments of a Qobj from a file are read when iterated."""
+        qobj = Qobj.from_file(self._qobj_file())
+        self.assertIsInstance(qobj.experiments, _stream.QobjExperimentsFile)
+        self.assertEqual(qobj.header, self.qobj.header)
+        self.assertEqual(len(qobj.experiments), 3)
+        self.assertEqual(list(qobj.experiments), self.qobj.experiments)
+        self.assertEqual(qobj.experiments[-1], self.qobj.experiments[2])
+        self.assertEqual(qobj.experiments[1:], self.qobj.experiments[1:])
+        self.assertEqual(qobj.as_dict(), self.qobj.as_dict())
+        self.assertEqual(pickle.loads(pickle.dumps(qobj)), self.qobj)
+
+    def test_from_file_experiments_first(self):
+        """The fields written after the experiments are read from the file."""
+        qobj_dict = self.qobj.as_dict()
+        qobj_dict = {'experiments': qobj_dict.pop('experiments'), **qobj_dict}
+        qobj = Qobj.from_file(self._qobj_file(qobj_dict))
+        self.assertEqual(qobj.qobj_id, '12345')
+        self.assertEqual(qobj.config, self.qobj.config)
+        self.assertEqual(qobj.experiments, self.qobj.experiments)
+
+    def test_run_from_file(self):
+        """A Qobj from a file runs on a simulator."""
+        qr = QuantumRegister(2)
+        cr = ClassicalRegister(2)
+        circuit = QuantumCircuit(qr, cr)
+        circuit.x(qr[0])
+        circuit.measure(qr, cr)
+        backend = Aer.get_backend('qasm_simulator_py')
+        self.qobj = compile(circuit, backend, shots=10)
+        result = backend.run(Qobj.from_file(self._qobj_file())).result()
+        self.assertEqual(result.get_counts(circuit), {'0x1': 10})
+
 
 def _nop():
     pass
@@ -11,6 +11,7 @@ import unittest
 
 import qiskit
 from qiskit import Aer
+from qiskit.result import Result
 from .common import QiskitTestCase, requires_qe_access
 
 
@@ -36,6 +37,42 @@ class TestQiskitResult(QiskitTestCase):
         self.assertEqual(self._result1.status, 'COMPLETED')
         self.assertEqual(self._result1.results[0].status, 'DONE')
 
+    def test_aer_result_validates(self):
+        """Test the results of a local simulator, built without validation, validate."""
+        self._result1._validate()
+        self.assertEqual(Result.from_dict(self._result1.to_dict()), self._result1)
+
+    def test_get_experiment_by_name(self):
+        """Test looking up experiments by name, with duplicate names."""
+        result = _result_with_names(['a', 'b', 'a', 'c'])
+        self.assertIs(result._get_experiment('a'), result.results[0])
+        self.assertIs(result._get_experiment('c'), result.results[3])
+        with self.assertRaises(qiskit.QiskitError):
+            result._get_experiment('d')
+
+        # The index follows the changes of the results.
+        result.results[0].header.name = 'd'
+        self.assertIs(result._get_experiment('a'), result.results[2])
+        result.results.append(result.results.pop(1))
+        self.assertIs(result._get_experiment('b'), result.results[3])
+        result.results = result.results[2:]
+        self.assertIs(result._get_experiment('c'), result.results[0])
+
+    def test_get_experiment_by_name_combined(self):
+        """Test looking up experiments by name in combined results."""
+        result1 = _result_with_names(['a', 'b'])
+        result2 = _result_with_names(['b', 'c'])
+        self.assertIs(result1._get_experiment('b'), result1.results[1])
+        with self.assertWarns(DeprecationWarning):
+            combined = result1 + result2
+        self.assertEqual(combined._get_experiment('c'), result2.results[1])
+        self.assertEqual(combined._get_experiment('b'), result1.results[1])
+        with self.assertWarns(DeprecationWarning):
+            result1 += result2
+        self.assertIs(result1._get_experiment('c'), result2.results[1])
+        self.assertIs(result1._get_experiment('b'), result1.results[1])
+        self.assertEqual(result1, combined)
+
     @requires_qe_access
     def test_ibmq_result_fields(self, qe_token, qe_url):
         """Test components of a result from a remote simulator."""
@@ -78,5 +115,15 @@ class TestQiskitResult(QiskitTestCase):
         self.assertIsNot(new_result, result2)
 
 
+def _result_with_names(names):
+    """A result with an experiment for each name."""
+    return Result.from_dict({
+        'backend_name': 'qasm_simulator_py', 'backend_version': '2.0.0',
+        'qobj_id': 'id', 'job_id': 'id', 'success': True,
+        'results': [{'shots': 1, 'success': True, 'header': {'name': name},
+                     'data': {'counts': {'0x%x' % index: 1}}}
+                    for index, name in enumerate(names)]})
+
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
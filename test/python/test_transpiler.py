@@ -12,6 +12,7 @@
 from qiskit import QuantumRegister, QuantumCircuit
 from qiskit import compile, Aer
 from qiskit.transpiler import PassManager, transpile_dag, transpile
+from qiskit.transpiler._transpiler import _transpilation_cost
 from qiskit.tools._compiler import circuits_to_qobj
 from qiskit.transpiler.passes import CXCancellation
 from qiskit.dagcircuit import DAGCircuit
@@ -96,3 +97,18 @@ class TestTranspiler(QiskitTestCase):
         resources_after = dag_circuit.count_ops()
 
         self.assertNotIn('cx', resources_after)
+
+    def test_transpilation_cost(self):
+        """Test the cost estimate used to choose between serial and parallel transpilation.
+
+        Routing is only accounted for when there is a coupling map and more than one qubit.
+        """
+        qr = QuantumRegister(3)
+        circuit = QuantumCircuit(qr)
+        circuit.h(qr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.cx(qr[1], qr[2])
+
+        self.assertEqual(_transpilation_cost(circuit), 3)
+        self.assertEqual(_transpilation_cost(circuit, 'all-to-all'), 3)
+        self.assertEqual(_transpilation_cost(circuit, [[0, 1], [1, 2]]), 12)
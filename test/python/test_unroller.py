@@ -10,9 +10,10 @@
 from sys import version_info
 import unittest
 
-from qiskit import qasm, QuantumCircuit
+from qiskit import qasm, QuantumCircuit, QuantumRegister, ClassicalRegister
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.unroll import Unroller, DagUnroller, DAGBackend, JsonBackend
+from qiskit.unrollers._dagunroller import _basis_expansion
 from .common import QiskitTestCase
 
 
@@ -123,6 +124,63 @@ measure r[0] -> d[0];
 """
         self.assertEqual(expanded_dag_circuit.qasm(), expected_result)
 
+    def test_expand_gates_single_pass(self):
+        """Test DagUnroller.expand_gates() expands nested decompositions in a single pass."""
+        qr = QuantumRegister(3, 'q')
+        cr = ClassicalRegister(3, 'c')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.ccx(qr[0], qr[1], qr[2])
+        circuit.cu3(0.1, 0.2, 0.3, qr[2], qr[0])
+        circuit.cswap(qr[1], qr[0], qr[2])
+        circuit.h(qr[1])
+        circuit.measure(qr, cr)
+        basis = ['u1', 'u2', 'u3', 'cx', 'id']
+
+        dag_unroller = DagUnroller(DAGCircuit.fromQuantumCircuit(circuit), DAGBackend(basis))
+        expanded_dag = dag_unroller.expand_gates()
+        dag_unroller = DagUnroller(DAGCircuit.fromQuantumCircuit(circuit), DAGBackend(basis))
+        recursively_expanded_dag = dag_unroller._expand_gates_recursively(
+            list(dag_unroller.backend.circuit.basis))
+
+        self.assertEqual(expanded_dag, recursively_expanded_dag)
+        self.assertEqual(set(expanded_dag.count_ops()), {'u1', 'u2', 'u3', 'cx', 'measure'})
+
+    def test_basis_expansion_shared(self):
+        """Test the basis expansions are shared by gates of the same type and parameters."""
+        qr = QuantumRegister(3, 'q')
+        circuit = QuantumCircuit(qr)
+        circuit.ccx(qr[0], qr[1], qr[2])
+        circuit.ccx(qr[2], qr[1], qr[0])
+        leaves = frozenset(['U', 'CX'])
+        expansion = _basis_expansion(circuit.data[0], leaves)
+        self.assertIs(_basis_expansion(circuit.data[1], leaves), expansion)
+        self.assertEqual(len(expansion.ops), 15)
+        self.assertEqual({op.name for op, _, _ in expansion.ops}, {'U', 'CX'})
+
+    def test_expand_gates_keeps_decompositions(self):
+        """Test DagUnroller.expand_gates() does not modify the shared decompositions."""
+        qr = QuantumRegister(2, 'q')
+        cr = ClassicalRegister(2, 'c')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0])
+        circuit.h(qr[1]).c_if(cr, 1)
+        circuit.h(qr[0])
+        rule = circuit.data[0]._decompositions[0]
+        rule_qasm = rule.qasm(qeflag=True)
+
+        dag_unroller = DagUnroller(DAGCircuit.fromQuantumCircuit(circuit), DAGBackend())
+        expanded_dag = dag_unroller.expand_gates(['U'])
+
+        self.assertEqual(rule.qasm(qeflag=True), rule_qasm)
+        self.assertEqual(circuit.data[2]._decompositions[0].qasm(qeflag=True), rule_qasm)
+        conditions = [expanded_dag.multi_graph.nodes[node]['condition']
+                      for node in expanded_dag.get_op_nodes()]
+        self.assertEqual(conditions.count(None), 2)
+        self.assertEqual(conditions.count((cr, 1)), 1)
+        op_ids = [id(expanded_dag.multi_graph.nodes[node]['op'])
+                  for node in expanded_dag.get_op_nodes()]
+        self.assertEqual(len(set(op_ids)), 3)
+
     # We need to change the way we create clbit_labels and qubit_labels in order to
     # enable this test, as they are lists but the order is not important so comparing
     # them usually fails.
@@ -140,6 +140,22 @@ class TestModels(QiskitTestCase):
             _ = Book.from_dict({'title': 'A Book',
                                 'author': {'fur_density': '1.2'}})
 
+    def test_instantiate_from_trusted_dict(self):
+        """Test model instantiation from a dict, without validation."""
+        birth_date = datetime(2000, 1, 1).date()
+        book_dict = {'title': 'A Book',
+                     'author': {'name': 'Foo', 'other': 'bar',
+                                'birth_date': birth_date.isoformat()}}
+        book = Book.from_dict(book_dict, validate=False)
+        self.assertIsInstance(book.author, Person)
+        self.assertEqual(book.author.birth_date, birth_date)
+        self.assertEqual(book.author.other, 'bar')
+        self.assertEqual(book, Book.from_dict(book_dict))
+
+        # The dict is not validated.
+        person = Person.from_dict({'name': 1}, validate=False)
+        self.assertEqual(person.name, 1)
+
     def test_serialize(self):
         """Test model serialization to dict."""
         person = Person(name='Foo', other='bar')
@@ -248,6 +264,14 @@ class TestFields(QiskitTestCase):
         self.assertIsInstance(pet_owner.auto_pets[1], Dog)
         self.assertEqual(pet_owner.auto_pets[0].fur_density, 1.5)
 
+    def test_try_from_field_instantiate_from_trusted_dict(self):
+        """Test the TryFrom field, instantiation from dict without validation."""
+        pet_owner_dict = {'auto_pets': [{'fur_density': 1.5}, {'barking_power': 100}]}
+        pet_owner = PetOwner.from_dict(pet_owner_dict, validate=False)
+        self.assertIsInstance(pet_owner.auto_pets[0], Cat)
+        self.assertIsInstance(pet_owner.auto_pets[1], Dog)
+        self.assertEqual(pet_owner, PetOwner.from_dict(pet_owner_dict))
+
     def test_try_from_field_invalid(self):
         """Test the TryFrom field, with invalid kind of object."""
         with self.assertRaises(ValidationError) as context_manager:
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+# pylint: disable=no-member
+
+"""Assembler Test."""
+
+import copy
+import json
+import pickle
+import unittest
+
+import sympy
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.dagcircuit import DAGCircuit
+from qiskit.qobj import QobjExperiment
+from qiskit.tools._assembler import circuit_to_experiment, dag_to_experiment, LAZY
+from qiskit.unroll import DagUnroller, JsonBackend
+from ..common import QiskitTestCase
+
+
+def _sorted_instructions(experiment_dict):
+    """Instructions of an experiment, in an order independent of the topological sort."""
+    return sorted(json.dumps(instruction, sort_keys=True)
+                  for instruction in experiment_dict['instructions'])
+
+
+class TestAssembler(QiskitTestCase):
+    """Tests for the assembly of circuits into Qobj experiments."""
+
+    def setUp(self):
+        qr = QuantumRegister(3, 'q')
+        qr2 = QuantumRegister(1, 'r')
+        cr = ClassicalRegister(2, 'c')
+        cr2 = ClassicalRegister(2, 'd')
+        circuit = QuantumCircuit(qr, qr2, cr, cr2, name='assembled')
+        circuit.h(qr[0])
+        circuit.cx(qr[0], qr2[0])
+        circuit.u3(0.1, sympy.pi / 3, 2, qr[1])
+        circuit.ccx(qr[0], qr[1], qr[2])
+        circuit.barrier(qr)
+        circuit.measure(qr[0], cr2[1])
+        circuit.x(qr[1]).c_if(cr2, 2)
+        circuit.reset(qr[2])
+        circuit.measure(qr[2], cr[0])
+        self.circuit = circuit
+
+    def _unrolled(self):
+        """The experiment built by unrolling the circuit with a JsonBackend."""
+        dag = DAGCircuit.fromQuantumCircuit(self.circuit)
+        experiment = QobjExperiment.from_dict(
+            DagUnroller(dag, JsonBackend(dag.basis)).execute())
+        experiment.header.name = self.circuit.name
+        return experiment.as_dict()
+
+    def test_same_as_unroller(self):
+        """The assembled experiment has the instructions of the unrolled one."""
+        expected = self._unrolled()
+        experiment = circuit_to_experiment(self.circuit, texparams=True).as_dict()
+        self.assertEqual(experiment['header'], expected['header'])
+        self.assertEqual(_sorted_instructions(experiment), _sorted_instructions(expected))
+        self.assertEqual(experiment['config'], {'memory_slots': 4, 'n_qubits': 4})
+
+    def test_circuit_order(self):
+        """The instructions follow the order of the circuit."""
+        experiment = circuit_to_experiment(self.circuit)
+        self.assertEqual([instruction.name for instruction in experiment.instructions],
+                         [op.name for op in self.circuit.data])
+
+    def test_float_params(self):
+        """The parameters of the instructions are floats."""
+        experiment = circuit_to_experiment(self.circuit)
+        u3_instruction = experiment.instructions[2]
+        self.assertEqual(u3_instruction.params, [0.1, float(sympy.pi / 3), 2.0])
+        for param in u3_instruction.params:
+            self.assertIsInstance(param, float)
+
+    def test_conditional(self):
+        """The conditionals have the mask of the memory slots of the register."""
+        experiment = circuit_to_experiment(self.circuit)
+        conditional = experiment.instructions[6].conditional
+        self.assertEqual(conditional.mask, '0xC')
+        self.assertEqual(conditional.val, '0x2')
+
+    def test_optional_fields(self):
+        """The texparams and the qasm are only produced on request."""
+        experiment = circuit_to_experiment(self.circuit)
+        self.assertFalse(hasattr(experiment.instructions[2], 'texparams'))
+        self.assertFalse(hasattr(experiment.header, 'compiled_circuit_qasm'))
+
+        experiment = circuit_to_experiment(self.circuit, texparams=True, qasm=True)
+        self.assertEqual(experiment.instructions[2].texparams,
+                         ['0.1', '\\frac{\\pi}{3}', '2'])
+        self.assertEqual(experiment.header.compiled_circuit_qasm, self.circuit.qasm())
+
+    def test_lazy_fields(self):
+        """The lazy texparams and qasm are computed on first access."""
+        experiment = circuit_to_experiment(self.circuit, texparams=LAZY, qasm=LAZY)
+        self.assertIn('compiled_circuit_qasm', experiment.header._lazy_fields)
+        self.assertIn('texparams', experiment.instructions[2]._lazy_fields)
+
+        self.assertEqual(experiment.instructions[2].texparams,
+                         ['0.1', '\\frac{\\pi}{3}', '2'])
+        self.assertEqual(experiment.header.compiled_circuit_qasm, self.circuit.qasm())
+        self.assertNotIn('compiled_circuit_qasm', experiment.header._lazy_fields)
+        self.assertFalse(hasattr(experiment.header, 'missing_field'))
+
+    def test_lazy_fields_as_dict(self):
+        """The pending lazy fields are computed by as_dict."""
+        experiment = circuit_to_experiment(self.circuit, texparams=LAZY, qasm=LAZY)
+        expected = circuit_to_experiment(self.circuit, texparams=True, qasm=True)
+        self.assertEqual(experiment.as_dict(), expected.as_dict())
+        self.assertEqual(experiment, expected)
+
+    def test_lazy_fields_copy(self):
+        """The pending lazy fields are kept by copies and computed by pickles."""
+        experiment = circuit_to_experiment(self.circuit, texparams=LAZY, qasm=LAZY)
+        copied = copy.deepcopy(experiment)
+        self.assertEqual(copied.header.compiled_circuit_qasm, self.circuit.qasm())
+        self.assertEqual(copied.instructions[2].texparams,
+                         ['0.1', '\\frac{\\pi}{3}', '2'])
+
+        experiment = circuit_to_experiment(self.circuit, texparams=LAZY, qasm=LAZY)
+        unpickled = pickle.loads(pickle.dumps(experiment))
+        self.assertFalse(hasattr(unpickled.header, '_lazy_fields'))
+        self.assertEqual(unpickled.header.compiled_circuit_qasm, self.circuit.qasm())
+        self.assertEqual(unpickled.instructions[2].texparams,
+                         ['0.1', '\\frac{\\pi}{3}', '2'])
+        self.assertEqual(unpickled.as_dict(), experiment.as_dict())
+
+    def test_dag_to_experiment(self):
+        """A dag is assembled into the same experiment as its circuit."""
+        dag = DAGCircuit.fromQuantumCircuit(self.circuit)
+        experiment = dag_to_experiment(dag, config={'shots': 10}).as_dict()
+        expected = circuit_to_experiment(self.circuit, config={'shots': 10}).as_dict()
+        self.assertEqual(experiment['header'], expected['header'])
+        self.assertEqual(experiment['config'], expected['config'])
+        self.assertEqual(_sorted_instructions(experiment), _sorted_instructions(expected))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -10,17 +10,23 @@
 
 """Compiler Test."""
 
+import asyncio
+import json
+import os
 import unittest
 
 import qiskit
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
-from qiskit.transpiler import PassManager, transpile
+from qiskit.transpiler import PassManager, transpile, transpile_async
 from qiskit import compile
 from qiskit import Result
 from qiskit.backends.models import BackendConfiguration
 from qiskit.backends.models.backendconfiguration import GateConfig
 from qiskit import execute
+from qiskit import compile_async, execute_async, compile_iter
 from qiskit._qiskiterror import QiskitError
+from qiskit.qobj import Qobj
+from qiskit.tools import qobj_to_circuits
 from qiskit.backends.ibmq import least_busy
 from ..common import QiskitTestCase, bin_to_hex_keys
 from ..common import requires_qe_access, requires_cpp_simulator
@@ -576,6 +582,208 @@ class TestCompiler(QiskitTestCase):
         rfalse = execute(qc, backend, seed=42, pass_manager=PassManager()).result()
         self.assertEqual(rtrue.get_counts(), rfalse.get_counts())
 
+    def test_transpile_async(self):
+        """Test transpile_async gives the circuits transpile gives."""
+        backend = qiskit.Aer.get_backend('qasm_simulator_py')
+        qr = QuantumRegister(2)
+        cr = ClassicalRegister(2)
+        qc = QuantumCircuit(qr, cr)
+        qc.h(qr[0])
+        qc.cx(qr[0], qr[1])
+        qc.measure(qr, cr)
+        circuits = transpile_async([qc, qc], backend).result()
+        self.assertEqual(circuits, transpile([qc, qc], backend))
+
+    def test_compile_async(self):
+        """Test compile_async keeps the experiments in the order of the circuits."""
+        backend = FakeBackend()
+        qr = QuantumRegister(16)
+        cr = ClassicalRegister(2)
+        qlist = []
+        for k in range(1, 6):
+            qc = QuantumCircuit(qr, cr, name='circuit{}'.format(k))
+            qc.h(qr[0])
+            for j in range(1, k + 1):
+                qc.cx(qr[0], qr[j])
+            qc.measure(qr[0], cr[0])
+            qlist.append(qc)
+        qobj = compile_async(qlist, backend=backend, seed_mapper=self.seed).result()
+        expected = compile(qlist, backend=backend, seed_mapper=self.seed)
+        self.assertEqual([experiment.header.name for experiment in qobj.experiments],
+                         [qc.name for qc in qlist])
+        self.assertEqual([experiment.as_dict() for experiment in qobj.experiments],
+                         [experiment.as_dict() for experiment in expected.experiments])
+        self.assertEqual(qobj.config.as_dict(), expected.config.as_dict())
+
+    def test_compile_async_concurrent(self):
+        """Test concurrent compile_async calls leave QISKIT_IN_PARALLEL unset."""
+        backend = FakeBackend()
+        qr = QuantumRegister(16)
+        cr = ClassicalRegister(2)
+        qlist = []
+        for k in range(1, 11):
+            qc = QuantumCircuit(qr, cr, name='circuit{}'.format(k))
+            qc.h(qr[0])
+            for j in range(1, k + 1):
+                qc.cx(qr[0], qr[j])
+            qc.measure(qr[0], cr[0])
+            qlist.append(qc)
+        futures = [compile_async(qlist, backend=backend, seed_mapper=self.seed)
+                   for _ in range(4)]
+        expected = compile(qlist, backend=backend, seed_mapper=self.seed)
+        for future in futures:
+            self.assertEqual([experiment.as_dict() for experiment in future.result().experiments],
+                             [experiment.as_dict() for experiment in expected.experiments])
+        self.assertEqual(os.environ['QISKIT_IN_PARALLEL'], 'FALSE')
+
+    def test_compile_async_skip_transpiler(self):
+        """Test compile_async accepts the deprecated skip_transpiler option."""
+        backend = qiskit.Aer.get_backend('qasm_simulator_py')
+        qr = QuantumRegister(2)
+        cr = ClassicalRegister(2)
+        qc = QuantumCircuit(qr, cr)
+        qc.h(qr[0])
+        qc.measure(qr, cr)
+        with self.assertWarns(DeprecationWarning):
+            future = compile_async(qc, backend, skip_transpiler=True)
+        self.assertEqual(future.result().experiments[0].as_dict(),
+                         compile(qc, backend, pass_manager=PassManager()).experiments[0].as_dict())
+
+    def test_execute_async(self):
+        """Test execute_async can be awaited from asyncio."""
+        backend = qiskit.Aer.get_backend('qasm_simulator_py')
+        qr = QuantumRegister(2)
+        cr = ClassicalRegister(2)
+        qc = QuantumCircuit(qr, cr)
+        qc.x(qr[0])
+        qc.measure(qr, cr)
+
+        loop = asyncio.new_event_loop()
+        try:
+            job = loop.run_until_complete(
+                asyncio.wrap_future(execute_async(qc, backend, shots=100), loop=loop))
+        finally:
+            loop.close()
+        self.assertEqual(job.result().get_counts(qc), bin_to_hex_keys({'01': 100}))
+
+    def test_execute_async_error(self):
+        """Test execute_async reports compilation errors through the future."""
+        backend = qiskit.Aer.get_backend('qasm_simulator_py')
+        qr = QuantumRegister(2)
+        qc = QuantumCircuit(qr)
+        qc.cx(qr[0], qr[1])
+        future = execute_async(qc, backend, coupling_map=[[0, 5]])
+        self.assertIsNotNone(future.exception())
+
+    def test_compile_iter(self):
+        """Test compile_iter yields chunks of at most max_experiments experiments."""
+        backend = qiskit.Aer.get_backend('qasm_simulator_py')
+        qr = QuantumRegister(2)
+        cr = ClassicalRegister(2)
+
+        def circuits():
+            for k in range(7):
+                qc = QuantumCircuit(qr, cr, name='circuit{}'.format(k))
+                qc.h(qr[0])
+                qc.measure(qr, cr)
+                yield qc
+
+        qobjs = list(compile_iter(circuits(), backend, qobj_id='sweep', max_experiments=3))
+        self.assertEqual([len(qobj.experiments) for qobj in qobjs], [3, 3, 1])
+        self.assertEqual([qobj.qobj_id for qobj in qobjs], ['sweep-0', 'sweep-1', 'sweep-2'])
+        self.assertEqual([experiment.header.name for qobj in qobjs
+                          for experiment in qobj.experiments],
+                         ['circuit{}'.format(k) for k in range(7)])
+        for qobj in qobjs:
+            self.assertEqual(qobj.config.n_qubits, 2)
+            self.assertEqual(qobj.config.memory_slots, 2)
+
+    def test_compile_iter_max_bytes(self):
+        """Test compile_iter yields chunks of at most max_bytes bytes of experiments."""
+        backend = qiskit.Aer.get_backend('qasm_simulator_py')
+        qr = QuantumRegister(2)
+        cr = ClassicalRegister(2)
+        qc = QuantumCircuit(qr, cr)
+        qc.h(qr[0])
+        qc.measure(qr, cr)
+        experiment = compile(qc, backend).experiments[0]
+        size = len(json.dumps(experiment.as_dict()))
+
+        qobjs = list(compile_iter([qc] * 5, backend, max_bytes=2 * size + 1))
+        self.assertEqual([len(qobj.experiments) for qobj in qobjs], [2, 2, 1])
+
+        qobjs = list(compile_iter([qc] * 2, backend, max_bytes=1))
+        self.assertEqual([len(qobj.experiments) for qobj in qobjs], [1, 1])
+
+    def test_compile_iter_no_limit(self):
+        """Test compile_iter needs a limit on the chunks."""
+        backend = qiskit.Aer.get_backend('qasm_simulator_py')
+        with self.assertRaises(QiskitError):
+            compile_iter([], backend)
+
+    def test_compile_iter_invalid_limit(self):
+        """Test compile_iter rejects limits that are not positive."""
+        backend = qiskit.Aer.get_backend('qasm_simulator_py')
+        with self.assertRaises(QiskitError):
+            compile_iter([], backend, max_experiments=0)
+        with self.assertRaises(QiskitError):
+            compile_iter([], backend, max_experiments=2, max_bytes=-1)
+
+    def test_compile_optional_fields(self):
+        """Test compile leaves texparams and qasm out for local simulators, unless
+        requested."""
+        backend = qiskit.Aer.get_backend('qasm_simulator_py')
+        qr = QuantumRegister(1, 'qr')
+        qc = QuantumCircuit(qr)
+        qc.u1(0.5, qr[0])
+
+        qobj = compile(qc, backend)
+        self.assertFalse(hasattr(qobj.experiments[0].header, 'compiled_circuit_qasm'))
+        self.assertFalse(hasattr(qobj.experiments[0].instructions[0], 'texparams'))
+        qobj_dict = qobj.as_dict()
+        self.assertNotIn('compiled_circuit_qasm', qobj_dict['experiments'][0]['header'])
+        self.assertNotIn('texparams', qobj_dict['experiments'][0]['instructions'][0])
+        result = backend.run(qobj).result()
+        self.assertFalse(hasattr(result.results[0].header, 'compiled_circuit_qasm'))
+
+        qobj = compile(qc, backend, texparams=True, compiled_circuit_qasm=True)
+        self.assertIn('compiled_circuit_qasm', qobj.as_dict()['experiments'][0]['header'])
+        self.assertIn('texparams', qobj.as_dict()['experiments'][0]['instructions'][0])
+
+    def test_compile_lazy_fields(self):
+        """Test compile computes the lazy texparams and qasm on access or serialization."""
+        backend = qiskit.Aer.get_backend('qasm_simulator_py')
+        qr = QuantumRegister(1, 'qr')
+        qc = QuantumCircuit(qr)
+        qc.u1(0.5, qr[0])
+
+        qobj = compile(qc, backend, texparams='lazy', compiled_circuit_qasm='lazy')
+        experiment = qobj.experiments[0]
+        self.assertEqual(experiment.instructions[0].texparams, ['0.5'])
+        self.assertIn('u1(0.500000000000000) qr[0];', experiment.header.compiled_circuit_qasm)
+
+        qobj = compile(qc, backend, texparams='lazy', compiled_circuit_qasm='lazy')
+        qobj_dict = qobj.as_dict()
+        self.assertIn('compiled_circuit_qasm', qobj_dict['experiments'][0]['header'])
+        self.assertIn('texparams', qobj_dict['experiments'][0]['instructions'][0])
+        self.assertEqual(len(qobj_to_circuits(Qobj.from_dict(qobj_dict))), 1)
+
+        qobj = compile(qc, backend, texparams='lazy', compiled_circuit_qasm='lazy')
+        result = backend.run(qobj).result()
+        self.assertTrue(hasattr(result.results[0].header, 'compiled_circuit_qasm'))
+
+    def test_compile_optional_fields_backend(self):
+        """Test compile produces the optional fields a backend declares it needs."""
+        backend = FakeBackend()
+        backend.OPTIONAL_QOBJ_FIELDS = ('compiled_circuit_qasm',)
+        qr = QuantumRegister(1)
+        qc = QuantumCircuit(qr)
+        qc.u1(0.5, qr[0])
+
+        qobj_dict = compile(qc, backend).as_dict()
+        self.assertIn('compiled_circuit_qasm', qobj_dict['experiments'][0]['header'])
+        self.assertNotIn('texparams', qobj_dict['experiments'][0]['instructions'][0])
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -36,7 +36,8 @@ class TestQobj2Circuits(QiskitTestCase):
     def test_qobj_to_circuits_single(self):
         """Check that qobj_to_circuits's result matches the qobj ini."""
         backend = Aer.get_backend('qasm_simulator_py')
-        qobj_in = compile(self.circuit, backend, pass_manager=PassManager())
+        qobj_in = compile(self.circuit, backend, pass_manager=PassManager(),
+                          compiled_circuit_qasm=True)
         out_circuit = qobj_to_circuits(qobj_in)
         self.assertEqual(DAGCircuit.fromQuantumCircuit(out_circuit[0]), self.dag)
 
@@ -52,7 +53,8 @@ class TestQobj2Circuits(QiskitTestCase):
         circuit_b.h(qreg2)
         circuit_b.measure(qreg1, creg1)
         circuit_b.measure(qreg2[0], creg2[1])
-        qobj = compile([self.circuit, circuit_b], backend, pass_manager=PassManager())
+        qobj = compile([self.circuit, circuit_b], backend, pass_manager=PassManager(),
+                       compiled_circuit_qasm=True)
         dag_list = [DAGCircuit.fromQuantumCircuit(x) for x in qobj_to_circuits(qobj)]
         self.assertEqual(dag_list, [self.dag, DAGCircuit.fromQuantumCircuit(circuit_b)])
 
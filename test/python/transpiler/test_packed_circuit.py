@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+# pylint: disable=no-member
+
+"""Test the packed circuit used for transferring circuits to parallel workers"""
+
+import pickle
+import unittest
+
+import sympy
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit._gate import Gate
+from qiskit.dagcircuit import DAGCircuit
+from qiskit.transpiler._packedcircuit import PackedCircuit
+from ..common import QiskitTestCase
+
+
+class TestPackedCircuit(QiskitTestCase):
+    """Tests the PackedCircuit class."""
+
+    def setUp(self):
+        qr = QuantumRegister(3, 'qr')
+        cr = ClassicalRegister(3, 'cr')
+        circuit = QuantumCircuit(qr, cr, name='packed')
+        circuit.h(qr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.u3(0.1, sympy.pi / 2, 2, qr[2])
+        circuit.ccx(qr[0], qr[1], qr[2])
+        circuit.barrier(qr)
+        circuit.measure(qr[0], cr[0])
+        circuit.x(qr[1]).c_if(cr, 1)
+        circuit.measure(qr, cr)
+        self.circuit = circuit
+
+    def test_circuit_round_trip(self):
+        """Unpacking a packed circuit gives back the same circuit."""
+        packed = pickle.loads(pickle.dumps(PackedCircuit.from_circuit(self.circuit)))
+        circuit = packed.to_circuit()
+        self.assertEqual(circuit.name, 'packed')
+        self.assertEqual(circuit.qasm(), self.circuit.qasm())
+        self.assertEqual(circuit, self.circuit)
+
+    def test_dag_round_trip(self):
+        """Unpacking a packed circuit into a dag gives the dag of the circuit."""
+        packed = PackedCircuit.from_circuit(self.circuit)
+        dag = DAGCircuit.fromQuantumCircuit(self.circuit)
+        self.assertEqual(packed.to_dag(), dag)
+        self.assertEqual(PackedCircuit.from_dag(dag).to_circuit(), self.circuit)
+
+    def test_decompositions_are_rebuilt(self):
+        """The decompositions of the unpacked gates are rebuilt."""
+        circuit = PackedCircuit.from_circuit(self.circuit).to_circuit()
+        for original, unpacked in zip(self.circuit.data, circuit.data):
+            self.assertEqual(len(original._decompositions), len(unpacked._decompositions))
+            for rule, unpacked_rule in zip(original._decompositions, unpacked._decompositions):
+                self.assertEqual(rule, unpacked_rule)
+
+    def test_smaller_than_pickled_circuit(self):
+        """The packed circuit pickles to fewer bytes than the circuit."""
+        qr = QuantumRegister(3, 'qr')
+        circuit = QuantumCircuit(qr)
+        for i in range(100):
+            circuit.h(qr[i % 3])
+            circuit.cx(qr[i % 3], qr[(i + 1) % 3])
+            circuit.u3(0.1 * i, 0.2, 0.3, qr[2])
+        packed = PackedCircuit.from_circuit(circuit)
+        self.assertLess(len(pickle.dumps(packed)), len(pickle.dumps(circuit)))
+
+    def test_composite_gate_not_packed(self):
+        """Circuits with composite gates are not packed."""
+        qr = QuantumRegister(2, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.initialize([0.5, 0.5, 0.5, 0.5], [qr[0], qr[1]])
+        self.assertIsNone(PackedCircuit.from_circuit(circuit))
+
+    def test_user_gate_not_packed(self):
+        """Circuits with gates defined outside qiskit are not packed."""
+        class UserGate(Gate):
+            """Gate whose constructor has its own signature."""
+
+            def __init__(self, qubit, circ=None, label='user'):
+                super().__init__('user', [], [qubit], circ)
+                self.label = label
+
+        qr = QuantumRegister(1, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.h(qr[0])
+        circuit._attach(UserGate(qr[0], circuit))
+        self.assertIsNone(PackedCircuit.from_circuit(circuit))
+
+
+if __name__ == '__main__':
+    unittest.main()
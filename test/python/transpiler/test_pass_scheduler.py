@@ -16,6 +16,7 @@ from qiskit.dagcircuit import DAGCircuit
 from qiskit.transpiler import PassManager, transpile_dag, TranspilerAccessError, TranspilerError, \
     FlowController
 from qiskit.transpiler._passmanager import DoWhileController, ConditionalController
+from qiskit.transpiler.passes import CXCancellation
 from ._dummy_passes import PassA_TP_NR_NP, PassB_TP_RA_PA, PassC_TP_RA_PA, \
     PassD_TP_NR_NP, PassE_AP_NR_NP, PassF_reduce_dag_property, \
     PassH_Bad_TP, PassI_Bad_AP, PassJ_Bad_NoReturn, PassK_check_fixed_point_property
@@ -423,6 +424,73 @@ class TestUseCases(SchedulerTestCase):
                                     'run transformation pass PassF_reduce_dag_property',
                                     'dag property = 5'], TranspilerError)
 
+    def test_track_changes_unchanged_dag(self):
+        """ With track_changes, a transformation that leaves the DAG unchanged does not invalidate
+        the analysis passes."""
+        passmanager = PassManager(track_changes=True)
+        passmanager.add_passes(PassE_AP_NR_NP(argument1=1))
+        passmanager.add_passes(PassA_TP_NR_NP())
+        passmanager.add_passes(PassE_AP_NR_NP(argument1=1))
+        self.assertScheduler(self.dag, passmanager, ['run analysis pass PassE_AP_NR_NP',
+                                                     'set property as 1',
+                                                     'run transformation pass PassA_TP_NR_NP'])
+
+    def test_track_changes_changed_dag(self):
+        """ With track_changes, a transformation that changes the DAG invalidates the analysis
+        passes."""
+        qr = QuantumRegister(2)
+        circ = QuantumCircuit(qr)
+        # pylint: disable=no-member
+        circ.cx(qr[0], qr[1])
+        circ.cx(qr[0], qr[1])
+        dag = DAGCircuit.fromQuantumCircuit(circ)
+
+        passmanager = PassManager(track_changes=True)
+        passmanager.add_passes(PassE_AP_NR_NP(argument1=1))
+        passmanager.add_passes(CXCancellation())
+        passmanager.add_passes(PassE_AP_NR_NP(argument1=1))
+        self.assertScheduler(dag, passmanager, ['run analysis pass PassE_AP_NR_NP',
+                                                'set property as 1',
+                                                'run analysis pass PassE_AP_NR_NP',
+                                                'set property as 1'])
+
+    def test_track_changes_ends_loop(self):
+        """ With track_changes, a do_while loop stops once an iteration leaves the DAG unchanged."""
+        self.passmanager.add_passes([PassE_AP_NR_NP(argument1=1), PassF_reduce_dag_property()],
+                                    do_while=lambda property_set: True, max_iteration=5,
+                                    track_changes=True)
+        self.assertScheduler(self.dag, self.passmanager,
+                             ['run analysis pass PassE_AP_NR_NP',
+                              'set property as 1',
+                              'run transformation pass PassF_reduce_dag_property',
+                              'dag property = 6'])
+
+    def test_track_changes_unchanged_loop_runs_once(self):
+        """ With track_changes, a do_while loop whose first iteration leaves the DAG unchanged
+        ends without evaluating its condition."""
+        evaluations = []
+        self.passmanager.add_passes([PassE_AP_NR_NP(argument1=1)],
+                                    do_while=lambda property_set: evaluations.append(1) or True,
+                                    max_iteration=5, track_changes=True)
+        self.assertScheduler(self.dag, self.passmanager,
+                             ['run analysis pass PassE_AP_NR_NP',
+                              'set property as 1'])
+        self.assertEqual(evaluations, [])
+
+    def test_without_track_changes_loop_max_iteration(self):
+        """ Without track_changes, the same loop runs until max_iteration is reached."""
+        self.passmanager.add_passes([PassE_AP_NR_NP(argument1=1), PassF_reduce_dag_property()],
+                                    do_while=lambda property_set: True, max_iteration=2)
+        self.assertSchedulerRaises(self.dag, self.passmanager,
+                                   ['run analysis pass PassE_AP_NR_NP',
+                                    'set property as 1',
+                                    'run transformation pass PassF_reduce_dag_property',
+                                    'dag property = 6',
+                                    'run analysis pass PassE_AP_NR_NP',
+                                    'set property as 1',
+                                    'run transformation pass PassF_reduce_dag_property',
+                                    'dag property = 5'], TranspilerError)
+
 
 class DoXTimesController(FlowController):
     """ A control-flow plugin for running a set of passes an X amount of times."""